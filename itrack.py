@@ -11,309 +11,706 @@ Log:
 12/08/2021 - Implement graphical view for trackers. Implement edit x and y axis titles. Fix error that allows user to create titleless or repeated name tracker.
 12/09/2021 - Add Doctests to methods that can be tested automatically. Decorate application.
 12/13/2021 - Update documentation. Fix bug that makes the program crash when the user enters a name with a \ or / character. Fix bug that allows user to enter a repeated x value in edit window.
+10/18/2026 - Store tracker data in two array('d') columns instead of a list of lists. get_data() returns a list-like view.
+10/18/2026 - Keep tracker data sorted by x at all times. Inserts and lookups by x use bisect instead of selection sort and linear scans.
+10/18/2026 - Write every change to a per tracker append-only journal as it happens. Journals are compacted into the tracker files in the background.
+10/18/2026 - Trackers count their changes so only trackers with unsaved changes are written when the application closes.
+10/18/2026 - Add an optional binary format for tracker files that is memory-mapped when loaded, and a converter between the text and binary formats.
+10/18/2026 - Only read the names and axis titles of the trackers at startup. Points are loaded when a tracker is opened, with an optional limit of loaded trackers.
+10/18/2026 - Resolve the tracker_info directory once from --data-dir, ITRACK_DATA_DIR or next to this script instead of walking the working directory.
+10/18/2026 - Read tracker files with a pool of threads, and big text files in separate processes.
+10/18/2026 - Write tracker files in a background save worker and save automatically every few minutes.
+10/18/2026 - Show the tabular window through a QAbstractTableModel read straight from the tracker. New rows are inserted in the view instead of rebuilding the table.
+10/18/2026 - Edit window uses an editable model with delegate-drawn delete buttons. Several selected rows can be deleted at once.
+10/18/2026 - Build the menu, table, graph and edit screens once in a QStackedWidget and refresh them when shown instead of rebuilding them.
+10/18/2026 - Show the menu through a tracker model with delegate-drawn buttons and add a search box that filters trackers by name prefix.
+10/18/2026 - Reduce the points of big trackers to about two per pixel (min/max or LTTB) before drawing the graph, and skip animations on big graphs.
+10/18/2026 - Zoom and pan the graph. Zoomed points come from a cached pyramid of min/max/mean buckets that is updated as points change.
+10/18/2026 - Prepare the points of the graph in a background thread and show a placeholder until they are ready.
+10/18/2026 - Import points from CSV and TSV files into new or existing trackers, choosing what to do with repeated x values.
+10/18/2026 - Export trackers to CSV, TSV, JSON Lines or a columnar binary file, in chunks, from the menu or with TrackerExporter.
+10/18/2026 - Move the trackers and their storage to itrack_core.py, which does not import PySide2. The application only starts when this file is run.
+10/18/2026 - Add itrack_cli.py to list trackers, add or replace points from arguments or the standard input, and dump or summarize a range of points without the user interface.
+10/18/2026 - Keep the trackers in a TrackerRegistry that finds them by name in constant time. Name checks, deletes, renames and the trash file check no longer scan every tracker.
+10/18/2026 - Write tracker files with a checksum to a temporary file that is flushed to the disk before it replaces the old one. Corrupt files are moved to tracker_info/.quarantine instead of stopping the application.
+10/18/2026 - Parse text tracker files in one pass over the whole file. Blank lines, comments and CRLF line endings are allowed, and lines that are not points are skipped and listed instead of stopping the load.
+10/18/2026 - Add a TrackerStore interface with a file store and a SQLite store (indexed by tracker and x, in WAL mode). itrack_cli.py can use a database with --database and copy the trackers into one with migrate.
+10/18/2026 - Opening the edit screen no longer copies the tracker. Changes are kept in an undo log that cancel takes back one by one and confirm drops.
+10/18/2026 - Hold a lock on the tracker_info directory while the application runs. itrack_cli.py waits for it before changing tracker files.
+10/18/2026 - Only delete the old files of trackers renamed or deleted in this session when closing, instead of every file that is not a known tracker.
+10/18/2026 - Check the checksums of tracker files when they are opened instead of reading every file at startup. VERIFY_FILES turns the full check at startup back on.
 """
 from PySide2.QtGui import QFont, QPainter
 from PySide2.QtWidgets import (
-    QAbstractItemView, QHeaderView, QTableWidgetItem, QWidget, QApplication, QLabel,
-    QPushButton, QMainWindow, QGridLayout, QTableWidget, QMessageBox,
-    QDialog, QLineEdit)
-from PySide2.QtCore import QSize, Qt
+    QAbstractItemView, QHeaderView, QWidget, QApplication, QLabel,
+    QPushButton, QMainWindow, QGridLayout, QTableView, QMessageBox,
+    QDialog, QLineEdit, QStackedWidget, QFileDialog, QInputDialog, QProgressDialog,
+    QStyle, QStyledItemDelegate, QStyleOptionButton)
+from PySide2.QtCore import QAbstractTableModel, QEvent, QModelIndex, QObject, QPointF, QSize, Qt, QTimer, Signal
 from PySide2.QtCharts import QtCharts
 import doctest
-from os import getcwd, walk, mkdir, path, remove
-
-class Tracker:
-    """Class Tracker is a class that has a list
-    where all the data is stored and a string that represents 
-    the name given to the tracker. It also has a field that
-    stores the same values of self.data independently in
-    case the data needs to be restored (this field should not be accessed).
-    The titles of the x and y axis are also stored, and a back up is also stored
-    in case the values need to be restored.
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from os import listdir, walk, makedirs, path, remove
+from threading import Condition, Thread
+from traceback import print_exc
+from itrack_core import (
+    Tracker, TrackerFile, TrackerSaveWorker, TrackerJournal, TrackerLoader, StorageLocation,
+    TrackerImporter, TrackerExporter, GraphSampler, TrackerRegistry, TrackerTextParser,
+    StorageLock)
+
+class GraphPreparer(QObject):
+    """Class GraphPreparer prepares the points of the graph in a
+    background thread so the window never freezes while a big tracker
+    is sampled. Only the latest request matters: submitting a new one or
+    calling cancel() makes older ones stale, and their points are never
+    delivered. Finished points are sent with the points_ready signal, which
+    is queued to the thread of the window, along with the y range to show
+    (None to keep the current one). A request that fails is sent with the
+    preparation_failed signal and its error message instead.
     """
+    points_ready = Signal(int, object, object)
+    preparation_failed = Signal(int, str)
+
     def __init__(self):
-        """Initializes a Tracker class.
-        >>> obj = Tracker()
-        >>> obj.name
-        ''
-        >>> obj.data
-        []
-        >>> obj.back_up_data
-        ()
-        >>> obj.x_axis_title
-        'X-Axis'
-        >>> obj.y_axis_title
-        'Y-Axis'
-        >>> obj.back_up_axis_titles
-        ()
-        """
-        self.name = ""
-        self.data = []
-        self.back_up_data = ()
-        self.x_axis_title = "X-Axis"
-        self.y_axis_title = "Y-Axis"
-        self.back_up_axis_titles = ()
-
-    def __str__(self):
-        """Returns a human readable string
-        representing Tracker class.
-        >>> obj = Tracker()
-        >>> print(obj)
-        : []
-        >>> obj.name = 'Hi'
-        >>> obj.data = [1, 2, 3]
-        >>> print(obj)
-        Hi: [1, 2, 3]
-        """
-        return f"{self.name}: {self.data}"
-    
-    def get_name(self):
-        """Returns the name of the tracker saved
-        by the user.
-        >>> obj = Tracker()
-        >>> obj.get_name()
-        ''
-        >>> obj.name = 'Hi'
-        >>> obj.get_name()
-        'Hi'
+        """Initializes the preparer and starts its thread.
+        >>> obj = GraphPreparer()
+        >>> obj.request, obj.request_id, obj.errors
+        (None, 0, [])
+        >>> obj.thread.is_alive()
+        True
         """
-        return self.name
-    
-    def get_data(self):
-        """Returns the data stored in the tracker object.
-        >>> obj = Tracker()
-        >>> obj.get_data()
-        []
-        >>> obj.data = [[1, 2]]
-        >>> obj.get_data()
-        [[1, 2]]
+        super().__init__()
+
+        self.condition = Condition()
+        self.request = None
+        self.request_id = 0
+        self.errors = []
+        self.thread = Thread(target=self.run, name="GraphPreparer", daemon=True)
+
+        self.thread.start()
+
+    def submit(self, prepare):
+        """Asks the thread to call prepare, a function returning the points
+        of the graph and their y range or None. Returns the id the points
+        will be sent with.
+        >>> obj = GraphPreparer()
+        >>> request_id = obj.submit(list)
+        >>> obj.is_current(request_id)
+        True
+        >>> obj.cancel()
+        >>> obj.is_current(request_id)
+        False
         """
-        return self.data
-    
-    def set_name(self, new_name):
-        """Changes name of field self.name to new_name
-        >>> obj = Tracker()
-        >>> obj.set_name('Hi')
-        >>> obj.get_name()
-        'Hi'
-        >>> obj.set_name('')
-        >>> obj.get_name()
-        ''
+        with self.condition:
+            self.request_id += 1
+            self.request = (self.request_id, prepare)
+            self.condition.notify_all()
+            return self.request_id
+
+    def cancel(self):
+        """Makes the request in progress, if any, stale.
         """
-        self.name = new_name
-    
-    def set_data(self, new_data):
-        """Changes data stored in the tracker object
-        with new_data
-        >>> obj = Tracker()
-        >>> obj.set_data([[]])
-        >>> obj.get_data()
-        [[]]
-        >>> obj.set_data([[1, 2], [1, 3]])
-        >>> obj.get_data()
-        [[1, 2], [1, 3]]
-        """
-        self.data = new_data
-    
-    def set_x_axis_title(self, new_title):
-        """Sets self.x_axis_title with given new_title
-        >>> obj = Tracker()
-        >>> previous_title = obj.get_x_axis_title()
-        >>> obj.set_x_axis_title('X')
-        >>> previous_title != obj.get_x_axis_title()
-        True
-        >>> obj.get_x_axis_title()
-        'X'
-        >>> obj.set_x_axis_title('')
-        >>> obj.get_x_axis_title()
-        ''
+        with self.condition:
+            self.request_id += 1
+            self.request = None
+
+    def is_current(self, request_id):
+        """Returns True if request_id is the latest request.
         """
-        self.x_axis_title = new_title
-    
-    def set_y_axis_title(self, new_title):
-        """Sets self.y_axis_title with given new_title
-        >>> obj = Tracker()
-        >>> previous_title = obj.get_y_axis_title()
-        >>> obj.set_y_axis_title('Y')
-        >>> previous_title != obj.get_y_axis_title()
-        True
-        >>> obj.get_y_axis_title()
-        'Y'
-        >>> obj.set_y_axis_title('')
-        >>> obj.get_y_axis_title()
-        ''
+        with self.condition:
+            return request_id == self.request_id
+
+    def run(self):
+        """Prepares the requests one at a time and sends the
+        points of the ones that are still current. The traceback of
+        a request that fails is printed to stderr and its error is
+        stored in self.errors before it is sent.
+        >>> from contextlib import redirect_stderr
+        >>> from io import StringIO
+        >>> from time import sleep
+        >>> obj = GraphPreparer()
+        >>> with redirect_stderr(StringIO()) as error_output:
+        ...     _ = obj.submit(lambda: 1 / 0)
+        ...     while not obj.errors:
+        ...         sleep(0.01)
+        >>> obj.errors, 'ZeroDivisionError' in error_output.getvalue(), obj.thread.is_alive()
+        (['division by zero'], True, True)
         """
-        self.y_axis_title = new_title
-    
-    def get_x_axis_title(self):
-        """Returns the title stored in
-        self.x_axis_title
-        >>> obj = Tracker()
-        >>> obj.get_x_axis_title()
-        'X-Axis'
-        >>> obj.set_y_axis_title('X')
-        >>> obj.get_y_axis_title()
-        'X'
+        while True:
+            with self.condition:
+                while self.request is None:
+                    self.condition.wait()
+                request_id, prepare = self.request
+                self.request = None
+            try:
+                points, y_range = prepare()
+            except Exception as error:
+                print_exc()
+                with self.condition:
+                    self.errors.append(str(error))
+                if self.is_current(request_id):
+                    self.preparation_failed.emit(request_id, str(error))
+                continue
+            if self.is_current(request_id):
+                self.points_ready.emit(request_id, points, y_range)
+
+class TrackerChartView(QtCharts.QChartView):
+    """Class TrackerChartView is the view of the graph window. Turning
+    the mouse wheel zooms in and out, dragging a rubber band zooms into an
+    x range, a right click zooms out, and dragging with the middle button or
+    pressing the arrow keys pans the graph.
+    """
+    ZOOM_FACTOR = 1.25
+    PAN_STEP = 20   #Pixels scrolled by an arrow key.
+
+    def __init__(self):
+        """Initializes the view with the rubber band enabled.
+        >>> obj = TrackerChartView()
+        >>> obj.pan_position
         """
-        return self.x_axis_title
-    
-    def get_y_axis_title(self):
-        """Returns the title stored in
-        self.y_axis_title.
-        >>> obj = Tracker()
-        >>> obj.get_y_axis_title()
-        'Y-Axis'
-        >>> obj.set_y_axis_title('Y')
-        >>> obj.get_y_axis_title()
-        'Y'
-        """
-        return self.y_axis_title
-    
-    def set_back_up_data(self):
-        """Copies the values stored in self.data and the x, y axis titles
-        and stores them in the field self.back_up_data and self.back_up_axis_titles
-        >>> obj = Tracker()
-        >>> obj.set_data([[1, 4], [6, 10]])
-        >>> obj.set_back_up_data()
-        >>> len(obj.back_up_data) > 0
-        True
-        >>> len(obj.back_up_axis_titles) > 0
-        True
-        >>> obj.back_up_axis_titles[0] == obj.get_x_axis_title()
-        True
-        >>> obj.back_up_axis_titles[1] == obj.get_y_axis_title()
-        True
-        >>> obj.set_data([[1, 4], [6, 10]])
-        >>> obj.back_up_data is obj.get_data()
-        False
+        super().__init__()
+
+        self.pan_position = None
+        self.setRubberBand(QtCharts.QChartView.HorizontalRubberBand)
+
+    def wheelEvent(self, event):
+        """Zooms in or out around the center of the graph.
         """
-        self.back_up_data = tuple(tuple(elem) for elem in self.data)
-        self.back_up_axis_titles = str(self.get_x_axis_title()), str(self.get_y_axis_title())
-    
-    def restore_data(self):
-        """Restores the values of self.data before
-        it was edited.
-        >>> obj = Tracker()
-        >>> obj.set_data([[2, 0], [10, 2]])
-        >>> previous_data = obj.get_data()
-        >>> previous_x_title = obj.get_x_axis_title()
-        >>> previous_y_title = obj.get_y_axis_title()
-        >>> obj.set_back_up_data()
-        >>> obj.set_data([[1, 0], [2, 10]])
-        >>> obj.set_x_axis_title('X')
-        >>> obj.set_y_axis_title('y')
-        >>> obj.restore_data()
-        >>> obj.get_data() == previous_data
-        True
-        >>> obj.get_x_axis_title() == previous_x_title
+        if event.angleDelta().y() > 0:
+            self.chart().zoom(self.ZOOM_FACTOR)
+        else:
+            self.chart().zoom(1 / self.ZOOM_FACTOR)
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """Starts panning when the middle button is pressed.
+        """
+        if event.button() == Qt.MiddleButton:
+            self.pan_position = event.pos()
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Pans the graph while the middle button is held.
+        """
+        if self.pan_position is not None:
+            moved = event.pos() - self.pan_position
+            self.chart().scroll(-moved.x(), moved.y())
+            self.pan_position = event.pos()
+            event.accept()
+        else:
+            super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Stops panning when the middle button is released.
+        """
+        if event.button() == Qt.MiddleButton and self.pan_position is not None:
+            self.pan_position = None
+            event.accept()
+        else:
+            super().mouseReleaseEvent(event)
+
+    def keyPressEvent(self, event):
+        """Pans the graph with the arrow keys.
+        """
+        steps = {Qt.Key_Left: (-self.PAN_STEP, 0), Qt.Key_Right: (self.PAN_STEP, 0),
+            Qt.Key_Up: (0, self.PAN_STEP), Qt.Key_Down: (0, -self.PAN_STEP)}
+        if event.key() in steps:
+            self.chart().scroll(*steps[event.key()])
+            event.accept()
+        else:
+            super().keyPressEvent(event)
+
+class TrackerTableModel(QAbstractTableModel):
+    """Class TrackerTableModel shows the points of a tracker in a
+    QTableView. Values are read straight from the columns of the tracker
+    when a cell is drawn, so no item is created per point. Points added
+    or replaced through the model are signalled to the view row by row
+    instead of rebuilding the table.
+    """
+    def __init__(self, tracker=None):
+        """Initializes the model with the points of tracker.
+        >>> obj = TrackerTableModel()
+        >>> obj.tracker
+        """
+        super().__init__()
+
+        self.tracker = tracker
+
+    def set_tracker(self, tracker):
+        """Shows the points of tracker, loading them if needed.
+        >>> obj = TrackerTableModel()
+        >>> tracker = Tracker()
+        >>> obj.set_tracker(tracker)
+        >>> obj.tracker is tracker
         True
-        >>> obj.get_y_axis_title() == previous_y_title
+        """
+        self.beginResetModel()
+        if tracker is not None:
+            tracker.load_data()
+        self.tracker = tracker
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        """Returns the number of points of the tracker.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4]])
+        >>> TrackerTableModel(tracker).rowCount()
+        2
+        >>> TrackerTableModel().rowCount()
+        0
+        """
+        if self.tracker is None or (parent is not None and parent.isValid()):
+            return 0
+        return len(self.tracker.x_values)
+
+    def columnCount(self, parent=None):
+        """Returns 2, one column for the x values and one for the y values.
+        >>> TrackerTableModel().columnCount()
+        2
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return 2
+
+    def get_cell_text(self, row, col):
+        """Returns the text shown in the cell at row and col.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4]])
+        >>> TrackerTableModel(tracker).get_cell_text(1, 0)
+        '3.0'
+        """
+        return str(self.tracker.get_column(col)[row])
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Returns the text of the cell at index. Only the
+        rows drawn by the view are ever asked for.
+        """
+        if role == Qt.DisplayRole and index.isValid():
+            return self.get_cell_text(index.row(), index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Returns the axis titles of the tracker as the column headers.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and self.tracker is not None:
+            if section == 0:
+                return self.tracker.get_x_axis_title()
+            elif section == 1:
+                return self.tracker.get_y_axis_title()
+        return None
+
+    def add_point(self, x_value, y_value):
+        """Adds a point to the tracker and inserts its row in the view.
+        Returns False without changing anything if the x value already exists.
+        >>> tracker = Tracker()
+        >>> obj = TrackerTableModel(tracker)
+        >>> obj.add_point(5, 1)
         True
-        >>> previous_data is obj.get_data()
+        >>> obj.add_point(5, 2)
         False
+        >>> obj.rowCount()
+        1
         """
-        self.data = list(list(elem) for elem in self.back_up_data)
-        self.x_axis_title = self.back_up_axis_titles[0]
-        self.y_axis_title = self.back_up_axis_titles[1]
-        self.back_up_data = ()
-        self.back_up_axis_titles = ()
-    
-    def check_for_x_repeats(self, value_to_search):
-        """Finds if there is any repeats with the x value
-        that the user is trying to add to the list.
-        >>> obj = Tracker()
-        >>> obj.set_data([[2, 5], [3, 1], [6, 5]])
-        >>> obj.check_for_x_repeats(2)
+        if self.tracker.check_for_x_repeats(x_value):
+            return False
+        row = self.tracker.find_insert_index(x_value)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tracker.add_graph_point(x_value, y_value)
+        self.endInsertRows()
+        return True
+
+    def replace_y_value(self, x_value, y_value):
+        """Replaces the y value of the point with the given x value
+        and updates its cell in the view.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2]])
+        >>> TrackerTableModel(tracker).replace_y_value(1, 5)
+        >>> tracker.get_data()
+        [[1.0, 5.0]]
+        """
+        row = self.tracker.find_x_index(x_value)
+        if row == -1:
+            return
+        self.tracker.replace_y_value(x_value, y_value)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1))
+
+    def set_x_axis_title(self, new_title):
+        """Changes the x axis title of the tracker and its column header.
+        >>> tracker = Tracker()
+        >>> TrackerTableModel(tracker).set_x_axis_title('Day')
+        >>> tracker.get_x_axis_title()
+        'Day'
+        """
+        self.tracker.set_x_axis_title(new_title)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+
+    def set_y_axis_title(self, new_title):
+        """Changes the y axis title of the tracker and its column header.
+        >>> tracker = Tracker()
+        >>> TrackerTableModel(tracker).set_y_axis_title('Steps')
+        >>> tracker.get_y_axis_title()
+        'Steps'
+        """
+        self.tracker.set_y_axis_title(new_title)
+        self.headerDataChanged.emit(Qt.Horizontal, 1, 1)
+
+class TrackerEditModel(TrackerTableModel):
+    """Class TrackerEditModel is the model of the edit table. The x and
+    y columns can be edited in place and a third column holds the delete
+    button of each row, drawn by a ButtonDelegate. Values that are not
+    numbers and repeated x values are rejected and reported through the
+    signals invalid_value_entered and x_value_repeated.
+    """
+    invalid_value_entered = Signal()
+    x_value_repeated = Signal()
+    DELETE_COLUMN = 2
+
+    def columnCount(self, parent=None):
+        """Returns 3, the x and y columns and the delete column.
+        >>> TrackerEditModel().columnCount()
+        3
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return 3
+
+    def get_cell_text(self, row, col):
+        """Returns the text shown in the cell at row and col. The
+        delete column has no text, its button is drawn by the delegate.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2]])
+        >>> TrackerEditModel(tracker).get_cell_text(0, 2)
+        ''
+        """
+        if col == self.DELETE_COLUMN:
+            return ""
+        return super().get_cell_text(row, col)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Returns the axis titles of the tracker and "Delete Row" as the
+        column headers.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section == self.DELETE_COLUMN:
+            return "Delete Row"
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        """Makes the x and y columns editable.
+        """
+        if index.column() == self.DELETE_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Called by the view when the user edits the cell at index.
+        """
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        return self.set_cell_value(index.row(), index.column(), value)
+
+    def set_cell_value(self, row, col, text):
+        """Changes the x or y value of the point in row to the
+        number in text. Returns False and emits a signal if text is not
+        a number or the x value already exists. Changing an x value may move
+        the point to keep the data sorted; its row is moved in the view.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4], [5, 6]])
+        >>> obj = TrackerEditModel(tracker)
+        >>> obj.set_cell_value(0, 1, '7')
         True
-        >>> obj.set_data([[0, 1], [5, 3], [2, 8]])
-        >>> obj.check_for_x_repeats(10)
+        >>> obj.set_cell_value(0, 0, '4')
+        True
+        >>> tracker.get_data()
+        [[3.0, 4.0], [4.0, 7.0], [5.0, 6.0]]
+        >>> obj.set_cell_value(0, 0, '5')
         False
-        >>> obj.set_data([[]])
-        >>> obj.check_for_x_repeats(0)
+        >>> obj.set_cell_value(0, 1, 'abc')
         False
+        >>> tracker.get_data()
+        [[3.0, 4.0], [4.0, 7.0], [5.0, 6.0]]
         """
-        for graph_point in self.get_data():
-            if len(graph_point) > 0 and graph_point[0] == value_to_search:      #index 0 of the nested list 'data' is where the x value is stored.
+        try:
+            new_value = float(text)
+        except ValueError:
+            self.invalid_value_entered.emit()
+            return False
+
+        if col == 0:    #checks if value changed is a x value.
+            if self.tracker.x_values[row] == new_value:
                 return True
+            if self.tracker.check_for_x_repeats(new_value):
+                self.x_value_repeated.emit()
+                return False
+            destination = self.tracker.find_insert_index(new_value)
+            moves = destination not in (row, row + 1)
+
+            if moves:
+                self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+            row = self.tracker.set_x_value(row, new_value)
+            if moves:
+                self.endMoveRows()
+        else:   #Gets executed if value changed is a y value.
+            self.tracker.set_y_value(row, new_value)
+        self.dataChanged.emit(self.index(row, col), self.index(row, col))
+        return True
+
+    def remove_rows(self, rows):
+        """Removes the points in rows from the tracker and the view.
+        Consecutive rows are removed from the tracker and the view as a
+        single block, from the last block to the first so the rows before
+        a block keep their indexes.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4], [5, 6], [7, 8]])
+        >>> obj = TrackerEditModel(tracker)
+        >>> obj.remove_rows([3, 0, 1])
+        >>> tracker.get_data()
+        [[5.0, 6.0]]
+        """
+        rows = sorted(set(rows))
+        end = len(rows)
+        while end > 0:
+            start = end - 1
+            while start > 0 and rows[start - 1] == rows[start] - 1:
+                start -= 1
+
+            self.beginRemoveRows(QModelIndex(), rows[start], rows[end - 1])
+            self.tracker.remove_rows(rows[start], rows[end - 1] + 1)
+            self.endRemoveRows()
+            end = start
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Class ButtonDelegate draws a push button with the given text
+    in every cell of a column, like the "X" buttons of the edit table.
+    No widget is created per row; clicking the button of a row emits
+    button_clicked with the row number.
+    """
+    button_clicked = Signal(int)
+
+    def __init__(self, text, parent=None):
+        """Initializes a delegate drawing buttons with text.
+        >>> ButtonDelegate("X").text
+        'X'
+        """
+        super().__init__(parent)
+
+        self.text = text
+
+    def paint(self, painter, option, index):
+        """Draws a push button filling the cell.
+        """
+        button = QStyleOptionButton()
+        button.rect = option.rect
+        button.text = self.text
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):
+        """Emits button_clicked when the button of a row is clicked.
+        """
+        if event.type() == QEvent.MouseButtonRelease and option.rect.contains(event.pos()):
+            self.button_clicked.emit(index.row())
+            return True
+        return False
+
+class TrackerMenuModel(QAbstractTableModel):
+    """Class TrackerMenuModel is the model of the menu table. It shows
+    the trackers of a TrackerRegistry, or only the ones whose name starts
+    with the filter text. The name is the only column with text, the Go, X,
+    Edit and Export buttons of the other columns are drawn by ButtonDelegates.
+    """
+    HEADERS = ("Tracker Name", "Display Data", "Delete Tracker", "Edit Name", "Export Data")
+
+    def __init__(self, registry=None):
+        """Initializes the model with registry. The registry
+        is shared, trackers added through the model are added to it.
+        >>> obj = TrackerMenuModel()
+        >>> len(obj.registry), obj.filter_text, obj.filtered_trackers
+        (0, '', None)
+        """
+        super().__init__()
+
+        self.registry = TrackerRegistry() if registry is None else registry
+        self.filter_text = ""
+        self.filtered_trackers = None   #None when there is no filter.
+
+    def set_trackers(self, registry):
+        """Shows the trackers of registry.
+        >>> tracker = Tracker()
+        >>> obj = TrackerMenuModel()
+        >>> obj.set_trackers(TrackerRegistry([tracker]))
+        >>> obj.get_tracker(0) is tracker
+        True
+        """
+        self.beginResetModel()
+        self.registry = registry
+        self.apply_filter()
+        self.endResetModel()
+
+    def get_visible_trackers(self):
+        """Returns the trackers shown in the menu.
+        """
+        return self.registry.get_trackers() if self.filtered_trackers is None else self.filtered_trackers
+
+    def get_tracker(self, row):
+        """Returns the tracker shown in row.
+        """
+        return self.get_visible_trackers()[row]
+
+    def rowCount(self, parent=None):
+        """Returns the number of trackers shown.
+        >>> trackers = [Tracker(), Tracker()]
+        >>> trackers[1].set_name('Steps')
+        >>> TrackerMenuModel(TrackerRegistry(trackers)).rowCount()
+        2
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.get_visible_trackers())
+
+    def columnCount(self, parent=None):
+        """Returns 5, the name column and the four button columns.
+        >>> TrackerMenuModel().columnCount()
+        5
+        """
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Returns the name of the tracker of the row of index.
+        """
+        if role == Qt.DisplayRole and index.isValid() and index.column() == 0:
+            return self.get_tracker(index.row()).get_name()
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Returns the titles of the columns.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def apply_filter(self):
+        """Updates the trackers shown from self.filter_text.
+        """
+        if self.filter_text:
+            self.filtered_trackers = self.registry.find_prefix(self.filter_text)
         else:
-            return False
-    
-    def replace_y_value(self, x_value, y_value):
-        """Replaces y value using the x value as a
-        key.
-        >>> obj = Tracker()
-        >>> obj.set_data([[2, 6], [5, 10], [6, 20]])
-        >>> obj.replace_y_value(5, 2)
-        >>> obj.get_data()
-        [[2, 6], [5, 2], [6, 20]]
-        >>> obj.set_data([[4, 10], [19, 1], [10, 9]])
-        >>> obj.replace_y_value(10, 9)
-        >>> obj.get_data()
-        [[4, 10], [19, 1], [10, 9]]
-        >>> previous_data = obj.get_data()
-        >>> obj.replace_y_value(4, 10)
-        >>> new_data = obj.get_data()
-        >>> previous_data is new_data
-        False
-        >>> previous_data[0] is new_data[0]
-        False
-        >>> obj.set_data([[]])
-        >>> obj.replace_y_value(9, 10)
-        >>> obj.get_data()
-        [[]]
-        """
-        copy_data = list([list(elem) for elem in self.get_data()])
-        for graph_point in copy_data:
-            if len(graph_point) > 0 and graph_point[0] == x_value:
-                graph_point[1] = y_value
-        self.set_data(copy_data)
-    
-    def sort_tracker_data(self):
-        """Sorts tracker data according to its x value
-        by selection sort algorithm.
-        >>> obj = Tracker()
-        >>> obj.set_data([[45, 10], [10, 20], [20, 100]])
-        >>> obj.sort_tracker_data()
-        >>> obj.get_data()
-        [[10, 20], [20, 100], [45, 10]]
-        >>> obj.set_data([[]])
-        >>> obj.sort_tracker_data()
-        >>> obj.get_data()
-        [[]]
-        >>> obj.set_data([[-10, 90], [-5, 10], [-15, 20]])
-        >>> obj.sort_tracker_data()
-        >>> obj.get_data()
-        [[-15, 20], [-10, 90], [-5, 10]]
-        >>> previous_list = obj.get_data()
-        >>> obj.sort_tracker_data()
-        >>> new_list = obj.get_data()
-        >>> previous_list is new_list
-        False
-        >>> previous_list[0] is new_list[0]
-        False
+            self.filtered_trackers = None
+
+    def set_filter(self, filter_text):
+        """Only shows the trackers whose name starts with
+        filter_text. An empty filter_text shows every tracker.
+        >>> trackers = [Tracker(), Tracker()]
+        >>> trackers[0].set_name('Steps')
+        >>> trackers[1].set_name('Weight')
+        >>> obj = TrackerMenuModel(TrackerRegistry(trackers))
+        >>> obj.set_filter('we')
+        >>> obj.rowCount(), obj.get_tracker(0).get_name()
+        (1, 'Weight')
+        >>> obj.set_filter('')
+        >>> obj.rowCount()
+        2
+        """
+        self.beginResetModel()
+        self.filter_text = filter_text
+        self.apply_filter()
+        self.endResetModel()
+
+    def add_tracker(self, tracker):
+        """Adds tracker to the registry and shows it.
+        >>> obj = TrackerMenuModel()
+        >>> obj.add_tracker(Tracker())
+        >>> obj.rowCount()
+        1
         """
-        copy_data = list([list(elem) for elem in self.get_data()])
+        if self.filtered_trackers is None:
+            self.beginInsertRows(QModelIndex(), len(self.registry), len(self.registry))
+        self.registry.add(tracker)
+        if self.filtered_trackers is None:
+            self.endInsertRows()
+        else:
+            self.set_filter(self.filter_text)
 
-        for index in range(len(copy_data) - 1):
-            smallest_index = index
-            for remaining_index in range(index + 1, len(copy_data)):
-                if copy_data[remaining_index][0] < copy_data[smallest_index][0]:
-                    smallest_index = remaining_index
-            temp_value = copy_data[index]
-            copy_data[index] = copy_data[smallest_index]
-            copy_data[smallest_index] = temp_value
-        self.set_data(copy_data)
+    def remove_tracker(self, tracker):
+        """Removes tracker from the registry and the menu.
+        >>> tracker = Tracker()
+        >>> obj = TrackerMenuModel(TrackerRegistry([tracker]))
+        >>> obj.remove_tracker(tracker)
+        >>> len(obj.registry)
+        0
+        """
+        if self.filtered_trackers is None:
+            row = self.registry.get_row(tracker)
+            self.beginRemoveRows(QModelIndex(), row, row)
+        self.registry.remove(tracker)
+        if self.filtered_trackers is None:
+            self.endRemoveRows()
+        else:
+            self.set_filter(self.filter_text)
+
+    def rename_tracker(self, tracker, new_name):
+        """Changes the name of tracker and updates its row.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerMenuModel(TrackerRegistry([tracker]))
+        >>> obj.rename_tracker(tracker, 'Walk')
+        >>> tracker.get_name(), obj.registry.find_prefix('w') == [tracker]
+        ('Walk', True)
+        """
+        self.registry.rename(tracker, new_name)
+
+        if self.filtered_trackers is None:
+            row = self.registry.get_row(tracker)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+        else:
+            self.set_filter(self.filter_text)
 
 class MainWindow(QMainWindow):
     """Class MenuWindow is a QMainWindow class that is in charge
     of displaying the application for user interaction.
     """
-    def __init__(self):
-        """Initializes window for menu of ITrack.
+    def __init__(self, storage_location=None):
+        """Initializes window for menu of ITrack. The trackers are stored
+        in the directory of storage_location, which is resolved from the
+        environment and the default location if it is not given.
         >>> obj = MainWindow()
         >>> dir_address = obj.TRACKER_INFO_DIR
-        >>> obj.tracker_list
+        >>> obj.storage_location.get_path() == dir_address
+        True
+        >>> obj.TRACKER_FILE_FORMAT
+        'text'
+        >>> obj.MAX_LOADED_TRACKERS
+        >>> obj.loaded_trackers
+        OrderedDict()
+        >>> obj.LAZY_LOADING
+        True
+        >>> obj.LOADER_WORKERS
+        >>> obj.VERIFY_FILES
+        False
+        >>> obj.quarantined_files
         []
+        >>> obj.AUTOSAVE_INTERVAL
+        300000
+        >>> obj.SAVE_TIMEOUT
+        30
+        >>> obj.GRAPH_SAMPLING_METHOD
+        'minmax'
+        >>> obj.GRAPH_ANIMATION_LIMIT
+        1000
+        >>> obj.graph_preparer.thread.is_alive()
+        True
+        >>> obj.save_worker.thread.is_alive()
+        True
+        >>> obj.tracker_model.tracker
+        >>> obj.edit_model.tracker
+        >>> len(obj.tracker_registry)
+        0
         >>> some_table = obj.menu_table
         >>> obj.tracker_selected
         >>> obj.add_row_window
@@ -324,26 +721,44 @@ class MainWindow(QMainWindow):
         >>> obj.new_y_value
         0
         >>> obj.warning_window
-        >>> obj.edit_table
-        >>> obj.edit_tracker_name_button
-        >>> obj.go_to_button
-        >>> obj.tracker_name
-        ''
-        >>> obj.delete_button
+        >>> some_edit_table = obj.edit_table
+        >>> obj.menu_model.registry is obj.tracker_registry
+        True
         >>> obj.edit_tracker_name_window
         >>> obj.new_tracker_user_input
         >>> obj.axis_title_user_input
         >>> obj.edit_axis_window
-        >>> some_layout = obj.main_layout
+        >>> some_screens = obj.screens
+        >>> some_screen = obj.menu_screen
         """
         super().__init__()
         
         self.setWindowTitle("ITrack")
         self.setMinimumSize(QSize(685, 685))
 
-        self.TRACKER_INFO_DIR = path.join(getcwd(), "tracker_info")
-        self.tracker_list = []
+        self.storage_location = StorageLocation.resolve([]) if storage_location is None else storage_location
+        self.TRACKER_INFO_DIR = self.storage_location.get_path()
+        self.TRACKER_FILE_FORMAT = TrackerFile.TEXT_FORMAT   #Format used for new trackers. Existing files keep their format.
+        self.MAX_LOADED_TRACKERS = None     #Number of opened trackers kept in memory. None keeps all of them.
+        self.LAZY_LOADING = True    #If False, the points of every tracker are loaded at startup.
+        self.LOADER_WORKERS = None  #Number of workers used to read tracker files. None uses the number of cores.
+        self.VERIFY_FILES = False   #If True, every tracker file is checksummed at startup. Otherwise files are checked when opened.
+        self.MAX_INVALID_LINES_SHOWN = 20    #Number of skipped line numbers listed when a tracker file has lines that are not points.
+        self.AUTOSAVE_INTERVAL = 5 * 60 * 1000  #Milliseconds between automatic saves.
+        self.SAVE_TIMEOUT = 30  #Seconds to wait for pending saves when the application closes.
+        self.LOCK_TIMEOUT = 30  #Seconds to wait at startup for a command line job to release the trackers.
+        self.GRAPH_SAMPLING_METHOD = GraphSampler.MIN_MAX    #GraphSampler.LTTB keeps the shape better but is slower.
+        self.GRAPH_ANIMATION_LIMIT = 1000   #Graphs with more points than this are drawn without animations.
+        self.GRAPH_PLACEHOLDER_TEXT = "Preparing graph..."    #Shown over the graph while its points are prepared.
+        self.save_worker = TrackerSaveWorker()
+        self.tracker_model = TrackerTableModel()
+        self.edit_model = TrackerEditModel()
+        self.graph_preparer = GraphPreparer()
+        self.loaded_trackers = OrderedDict()
+        self.tracker_registry = TrackerRegistry()
+        self.menu_model = TrackerMenuModel(self.tracker_registry)
         self.menu_table = None
+        self.menu_filter_input = None
         self.tracker_selected = None
         self.add_row_window = None
         self.new_x_value_input = None
@@ -351,18 +766,32 @@ class MainWindow(QMainWindow):
         self.new_x_value = 0
         self.new_y_value = 0
         self.warning_window = None
+        self.quarantined_files = []
+        self.orphaned_files = set()     #Files of trackers renamed or deleted in this session.
+        self.storage_lock = None
         self.edit_table = None
-        self.main_layout = None
-        self.edit_tracker_name_button = None
-        self.go_to_button = None
-        self.tracker_name = ""
-        self.delete_button = None
         self.edit_tracker_name_window = None
         self.new_tracker_user_input = None
         self.axis_title_user_input = None
         self.edit_axis_window = None
 
-        self.main_layout = self.get_menu_layout()
+        self.screens = QStackedWidget()
+        self.menu_screen = self.get_screen(self.get_menu_layout())
+        self.table_screen = self.get_screen(self.get_table_layout())
+        self.graph_screen = self.get_screen(self.get_graph_layout())
+        self.edit_screen = self.get_screen(self.get_edit_layout())
+
+        self.screens.setCurrentWidget(self.menu_screen)
+        self.setCentralWidget(self.screens)
+
+        self.graph_preparer.points_ready.connect(self.show_graph_points, Qt.QueuedConnection)
+        self.graph_preparer.preparation_failed.connect(self.show_graph_error, Qt.QueuedConnection)
+        self.edit_model.invalid_value_entered.connect(self.invalid_input_entered_in_edit_table)
+        self.edit_model.x_value_repeated.connect(self.x_value_repeat_entered_in_edit_table)
+
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(self.AUTOSAVE_INTERVAL)
 
     def check_for_valid_tracker_name(self, user_input):
         """Checks the input of user for new tracker name.
@@ -371,7 +800,7 @@ class MainWindow(QMainWindow):
         >>> obj = MainWindow()
         >>> tracker = Tracker()
         >>> tracker.set_name("SomeTracker")
-        >>> obj.tracker_list.append(tracker)
+        >>> obj.tracker_registry.add(tracker)
         >>> obj.check_for_valid_tracker_name('')
         False
         >>> obj.check_for_valid_tracker_name('AnotherTracker')
@@ -385,18 +814,7 @@ class MainWindow(QMainWindow):
         >>> obj.check_for_valid_tracker_name(':something')
         False
         """
-        all_trackers = self.tracker_list
-
-        if len(user_input) == 0:
-            return False
-        elif '\\' in user_input or '/' in user_input or ':' in user_input:
-            return False
-        else:
-            for tracker in all_trackers:
-                if tracker.get_name() == user_input:
-                    return False
-            else:
-                return True
+        return self.tracker_registry.is_name_available(user_input)
     
     def execute_invalid_name_window(self):
         """Pops up a QMessageBox warning
@@ -414,22 +832,135 @@ class MainWindow(QMainWindow):
     def add_tracker_confirmed(self):
         """Creates a new Tracker() object
         when the add Tracker button is confirmed
-        and is added to the field self.tracker_list.
+        and is added to self.tracker_registry.
         Window that prompts user to enter new name for
         new tracker is closed.
         """
         if self.check_for_valid_tracker_name(self.new_tracker_user_input.text()):
-            new_tracker = Tracker()
-
-            new_tracker.set_name(self.new_tracker_user_input.text())
-            self.tracker_list.append(new_tracker)
-
-            self.render_menu_window()
+            self.create_tracker(self.new_tracker_user_input.text())
 
             self.add_window.accept()
         else:
             self.execute_invalid_name_window()
         
+    def create_tracker(self, name):
+        """Creates a new empty tracker called name, with its
+        file and journal, adds it to the menu and returns it.
+        """
+        new_tracker = Tracker()
+
+        new_tracker.set_name(name)
+        new_tracker.file_format = self.TRACKER_FILE_FORMAT
+        new_tracker.set_journal(TrackerJournal(self.TRACKER_INFO_DIR, new_tracker, self.save_worker))
+        new_tracker.journal.compact()   #Creates the tracker file right away.
+        self.menu_model.add_tracker(new_tracker)
+        return new_tracker
+
+    def ask_import_options(self):
+        """Asks the user for a CSV or TSV file to import and for the
+        duplicate policy to use. Returns a TrackerImporter and the path
+        of the file, or None if the user canceled.
+        """
+        policies = {"Keep the last value": TrackerImporter.KEEP_LAST,
+            "Keep the first value": TrackerImporter.KEEP_FIRST,
+            "Keep the mean of the values": TrackerImporter.MEAN}
+        file_path = QFileDialog.getOpenFileName(self, "Import Points", "",
+            "CSV and TSV files (*.csv *.tsv *.tab *.txt);;All files (*)")[0]
+        if not file_path:
+            return None
+        policy, accepted = QInputDialog.getItem(self, "Repeated X Values",
+            "When an x value is repeated:", list(policies), 0, False)
+        if not accepted:
+            return None
+        return TrackerImporter(policies[policy]), file_path
+
+    def run_import(self, importer, file_path, tracker):
+        """Imports file_path into tracker with importer while a progress
+        window is shown. Warns the user about the lines that were skipped.
+        """
+        progress_window = QProgressDialog("Importing " + path.basename(file_path) + "...", None, 0, 1000, self)
+
+        def show_progress(characters_read, total_size):
+            progress_window.setValue(characters_read * 1000 // max(total_size, 1))
+            QApplication.processEvents()
+
+        progress_window.setWindowTitle("Import")
+        progress_window.setWindowModality(Qt.WindowModal)
+        progress_window.setMinimumDuration(0)
+        points_read = importer.import_file(file_path, tracker, show_progress)
+        progress_window.close()
+
+        if importer.invalid_lines:
+            self.warning_window = QMessageBox()
+            self.warning_window.setWindowTitle("Warning")
+            self.warning_window.setIcon(QMessageBox.Warning)
+            self.warning_window.setStandardButtons(QMessageBox.Ok)
+            self.warning_window.setText(str(points_read) + " points were imported. " +
+                str(len(importer.invalid_lines)) + " lines were skipped because they are not numbers, starting with line " +
+                str(importer.invalid_lines[0]) + ".")
+            self.warning_window.exec()
+
+    def import_tracker_clicked(self):
+        """Creates a new tracker from a CSV or TSV file. The name of
+        the file is suggested as the name of the tracker and the first
+        row, if it is not made of numbers, is used as the axis titles.
+        """
+        import_options = self.ask_import_options()
+        if import_options is None:
+            return
+        importer, file_path = import_options
+        name, accepted = QInputDialog.getText(self, "Import Tracker", "Enter name for new tracker.",
+            QLineEdit.Normal, path.splitext(path.basename(file_path))[0])
+        if not accepted:
+            return
+        if not self.check_for_valid_tracker_name(name):
+            self.execute_invalid_name_window()
+            return
+
+        new_tracker = self.create_tracker(name)
+        self.run_import(importer, file_path, new_tracker)
+        if importer.x_axis_title:
+            new_tracker.set_x_axis_title(importer.x_axis_title)
+            new_tracker.set_y_axis_title(importer.y_axis_title)
+
+    def import_rows_clicked(self):
+        """Adds the points of a CSV or TSV file to the tracker
+        selected and refreshes its table once.
+        """
+        import_options = self.ask_import_options()
+        if import_options is None:
+            return
+        importer, file_path = import_options
+
+        self.run_import(importer, file_path, self.tracker_selected)
+        self.tracker_model.set_tracker(self.tracker_selected)
+        self.change_to_graph_button.setDisabled(self.tracker_model.rowCount() <= 1)
+
+    def export_tracker_clicked(self, row):
+        """Asks the user for a file and exports the points of the tracker
+        in row to it. The format is chosen from the extension of the file.
+        """
+        self.set_tracker_selected(row)
+        file_path = QFileDialog.getSaveFileName(self, "Export Tracker", self.tracker_selected.get_name() + ".csv",
+            "CSV files (*.csv);;TSV files (*.tsv);;JSON Lines files (*.jsonl);;Columnar files (*.itc)")[0]
+        if not file_path:
+            return
+        exporter = TrackerExporter(TrackerExporter.get_format(file_path))
+        progress_window = QProgressDialog("Exporting " + self.tracker_selected.get_name() + "...", None, 0, 1000, self)
+
+        def show_progress(points_written, point_count):
+            progress_window.setValue(points_written * 1000 // max(point_count, 1))
+            QApplication.processEvents()
+
+        progress_window.setWindowTitle("Export")
+        progress_window.setWindowModality(Qt.WindowModal)
+        progress_window.setMinimumDuration(0)
+        if not self.load_tracker(self.tracker_selected):
+            progress_window.close()
+            return
+        exporter.export(self.tracker_selected, file_path, show_progress)
+        progress_window.close()
+
     def invalid_input_entered_in_edit_table(self):
         """Pops up a QMessageBox when the
         value entered is not a number.
@@ -451,34 +982,6 @@ class MainWindow(QMainWindow):
 
         self.warning_window.exec()
     
-    def edit_tracker_data(self, row, col):
-        """This signal is triggered when the user edits
-        a value in the edit table. Given row and column
-        given by the signal, this method changes the data
-        in the tracker object with the new data if valid, that is
-        if the number returned by the user is a number. Otherwise,
-        it pops up a warning window stating that the value entered
-        is invalid.
-        """
-        tracker_data = self.tracker_selected.get_data()
-        try:
-            new_data = float(self.edit_table.item(row, col).text())
-            if col == 0:    #checks if value changed is a x value.
-                if not self.tracker_selected.check_for_x_repeats(new_data):
-                    tracker_data[row][col] = new_data
-                else:
-                    self.x_value_repeat_entered_in_edit_table()
-                    self.edit_table.blockSignals(True)
-                    self.edit_table.setItem(row, col, QTableWidgetItem(str(tracker_data[row][col])))
-                    self.edit_table.blockSignals(False)
-            else:   #Gets executed if value changed is a y value.
-                tracker_data[row][col] = new_data
-        except ValueError:
-            self.invalid_input_entered_in_edit_table()
-            self.edit_table.blockSignals(True)
-            self.edit_table.setItem(row, col, QTableWidgetItem(str(tracker_data[row][col])))   #Replaces the value entered with previous value.
-            self.edit_table.blockSignals(False)
-
     def edit_tracker_canceled(self):
         """This method is called when the user clicks
         the cancel button in the edit window. This method will
@@ -502,7 +1005,7 @@ class MainWindow(QMainWindow):
         the confirm button in the edit window. This method 
         will first ask for confirmation. If the user accepts, the
         tabular window will be rendered again with the changes made to the
-        data.
+        data, and the undo log of the edit session is dropped.
         """
         self.warning_window = QMessageBox()
 
@@ -512,7 +1015,7 @@ class MainWindow(QMainWindow):
         self.warning_window.setText("Are you sure you want to apply all changes made to the data?")
 
         if self.warning_window.exec() == QMessageBox.Yes:
-            self.tracker_selected.sort_tracker_data()
+            self.tracker_selected.discard_back_up_data()
             self.render_tabular_window()
 
     def add_tracker_canceled(self):
@@ -548,8 +1051,8 @@ class MainWindow(QMainWindow):
 
     def delete_tracker_selected(self):
         """This method first asks for confirmation. If user confirms,
-        this method searches for self.tracker_selected in
-        self.tracker_list and deletes it from the list.
+        self.tracker_selected is deleted from self.tracker_registry
+        along with its file.
         """
         self.warning_window = QMessageBox()
         self.warning_window.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
@@ -558,13 +1061,16 @@ class MainWindow(QMainWindow):
         self.warning_window.setWindowTitle("Warning")
 
         if self.warning_window.exec() == QMessageBox.Yes:
-            self.tracker_list.remove(self.tracker_selected)
+            self.orphaned_files.add(path.join(self.TRACKER_INFO_DIR, self.tracker_selected.get_name()))
+            if self.tracker_selected.journal is not None:
+                self.tracker_selected.journal.delete()
+            self.loaded_trackers.pop(self.tracker_selected, None)
+            self.menu_model.remove_tracker(self.tracker_selected)
     
-    def remove_data_row(self):
+    def remove_data_row(self, row):
         """This method asks confirmation first in order to delete
-        a row from the data. If user confirms, this method finds
-        the clicked delete button and uses its location to remove
-        the row from the tracker data.
+        a row from the data. If user confirms, the row whose delete
+        button was clicked is removed from the tracker data.
         """
         self.warning_window = QMessageBox()
         self.warning_window.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
@@ -573,19 +1079,24 @@ class MainWindow(QMainWindow):
         self.warning_window.setWindowTitle("Warning")
 
         if self.warning_window.exec() == QMessageBox.Yes:
-            tracker_data = self.tracker_selected.get_data()
-            row = 0
-            widget_found = False
-            while True:
-                for col in range(self.edit_table.columnCount()):
-                    if self.edit_table.cellWidget(row, col) == self.sender():
-                        widget_found = True
-                        break
-                if widget_found:
-                    break
-                else:
-                    row += 1
-            tracker_data.pop(row)
+            self.edit_model.remove_rows([row])
+
+    def remove_selected_rows(self):
+        """Asks confirmation first and then removes every
+        row selected in the edit table from the tracker data.
+        """
+        rows = [index.row() for index in self.edit_table.selectionModel().selectedRows()]
+        if not rows:
+            return
+
+        self.warning_window = QMessageBox()
+        self.warning_window.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self.warning_window.setText("Are you sure you want to delete the " + str(len(rows)) + " rows selected?")
+        self.warning_window.setIcon(QMessageBox.Warning)
+        self.warning_window.setWindowTitle("Warning")
+
+        if self.warning_window.exec() == QMessageBox.Yes:
+            self.edit_model.remove_rows(rows)
 
     def edit_tracker_name_confirmed(self):
         """This method gets executed when the user
@@ -597,9 +1108,9 @@ class MainWindow(QMainWindow):
         tracker = self.tracker_selected
 
         if self.check_for_valid_tracker_name(self.new_tracker_user_input.text()):
-            tracker.set_name(self.new_tracker_user_input.text())
+            self.orphaned_files.add(path.join(self.TRACKER_INFO_DIR, tracker.get_name()))
+            self.menu_model.rename_tracker(tracker, self.new_tracker_user_input.text())
 
-            self.render_menu_window()
             self.edit_tracker_name_window.accept()
         else:
             self.execute_invalid_name_window()
@@ -634,31 +1145,137 @@ class MainWindow(QMainWindow):
         self.edit_tracker_name_window.setLayout(window_layout)
         self.edit_tracker_name_window.show()
 
-    def set_tracker_selected(self):
-        """Searches for the row of the button clicked
-        and uses that number as an index for tracker_list.
-        This way, the program will be able to save in a
-        field (self.tracker_selected) the tracker
-        that needs to be displayed.
+    def set_tracker_selected(self, row):
+        """Saves in the field self.tracker_selected the
+        tracker shown in row of the menu, the one that
+        needs to be displayed.
+        >>> obj = MainWindow()
+        >>> tracker = Tracker()
+        >>> obj.menu_model.add_tracker(tracker)
+        >>> obj.set_tracker_selected(0)
+        >>> obj.tracker_selected is tracker
+        True
+        """
+        self.tracker_selected = self.menu_model.get_tracker(row)
+
+    def go_to_tracker_clicked(self, row):
+        """Shows the table of the tracker in row
+        when its Go button is clicked.
         """
-        row = 0
-        widget_found = False
-        while True:
-            for col in range(self.menu_table.columnCount()):
-                if self.menu_table.cellWidget(row, col) == self.sender():
-                    widget_found = True
+        self.set_tracker_selected(row)
+        self.render_tabular_window()
+
+    def delete_tracker_clicked(self, row):
+        """Asks to delete the tracker in row
+        when its X button is clicked.
+        """
+        self.set_tracker_selected(row)
+        self.delete_tracker_selected()
+
+    def edit_tracker_name_clicked(self, row):
+        """Asks for a new name for the tracker in row
+        when its Edit button is clicked.
+        """
+        self.set_tracker_selected(row)
+        self.edit_tracker_name()
+
+    def load_tracker(self, tracker):
+        """Loads the points of tracker if needed and marks it as
+        the most recently used tracker. If more than self.MAX_LOADED_TRACKERS
+        trackers are loaded, the least recently used ones are unloaded.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow()
+        >>> obj.MAX_LOADED_TRACKERS = 1
+        >>> trackers = [Tracker(), Tracker()]
+        >>> for index, tracker in enumerate(trackers):
+        ...     tracker.file_path = path.join(mkdtemp(), 'Steps')
+        ...     _ = TrackerFile.write_text(tracker.file_path, 'X', 'Y', [index], [index])
+        ...     _ = obj.load_tracker(tracker)
+        >>> trackers[0].loaded, trackers[1].loaded
+        (False, True)
+        >>> len(obj.loaded_trackers)
+        1
+
+        Corrupt trackers are quarantined and False is returned.
+        Returns True otherwise. Lines of a text file that are not points
+        are skipped and listed in a warning.
+        """
+        parser = TrackerTextParser()
+        try:
+            tracker.load_data(parser=parser)
+        except (OSError, ValueError):
+            self.quarantine_tracker(tracker)
+            self.execute_quarantine_window()
+            return False
+        if parser.invalid_lines:
+            self.execute_invalid_lines_window(tracker, parser.invalid_lines)
+        self.loaded_trackers[tracker] = None
+        self.loaded_trackers.move_to_end(tracker)
+
+        if self.MAX_LOADED_TRACKERS is not None:
+            for old_tracker in list(self.loaded_trackers):
+                if len(self.loaded_trackers) <= self.MAX_LOADED_TRACKERS:
                     break
-            if widget_found:
-                break
-            else:
-                row += 1
-        self.tracker_selected = self.tracker_list[row]
+                if old_tracker is not tracker and old_tracker.unload_data():
+                    del self.loaded_trackers[old_tracker]
+        return True
+
+    def quarantine_tracker(self, tracker):
+        """Moves the file of tracker, which cannot be read, to the
+        quarantine directory and removes the tracker from the menu.
+        The new path of the file is added to self.quarantined_files.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow(StorageLocation(mkdtemp()))
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> tracker.file_path = path.join(obj.TRACKER_INFO_DIR, 'Steps')
+        >>> _ = TrackerFile.write_text(tracker.file_path, 'X', 'Y', [], [])
+        >>> obj.menu_model.add_tracker(tracker)
+        >>> obj.quarantine_tracker(tracker)
+        >>> len(obj.tracker_registry), path.exists(tracker.file_path), len(obj.quarantined_files)
+        (0, False, 1)
+        """
+        if tracker.journal is not None:
+            tracker.journal.close()
+        self.quarantined_files.append(self.storage_location.quarantine(tracker.file_path))
+        self.loaded_trackers.pop(tracker, None)
+        self.menu_model.remove_tracker(tracker)
+
+    def execute_quarantine_window(self):
+        """Pops up a QMessageBox telling the user which tracker
+        files were corrupt and where they were moved to.
+        """
+        self.warning_window = QMessageBox()
+        self.warning_window.setIcon(QMessageBox.Warning)
+        self.warning_window.setText("These tracker files are damaged and were moved out of the way:\n" +
+            "\n".join(self.quarantined_files))
+        self.warning_window.setStandardButtons(QMessageBox.Ok)
+        self.warning_window.setWindowTitle("Damaged Trackers")
+        self.quarantined_files = []
+
+        self.warning_window.exec()
+
+    def execute_invalid_lines_window(self, tracker, invalid_lines):
+        """Pops up a QMessageBox telling the user which lines of the
+        file of tracker were not points and were skipped.
+        """
+        line_numbers = ", ".join(map(str, invalid_lines[:self.MAX_INVALID_LINES_SHOWN]))
+        if len(invalid_lines) > self.MAX_INVALID_LINES_SHOWN:
+            line_numbers += f" and {len(invalid_lines) - self.MAX_INVALID_LINES_SHOWN} more"
+        self.warning_window = QMessageBox()
+        self.warning_window.setIcon(QMessageBox.Warning)
+        self.warning_window.setText(f"These lines of {tracker.file_path} are not points and were skipped:\n" +
+            line_numbers)
+        self.warning_window.setStandardButtons(QMessageBox.Ok)
+        self.warning_window.setWindowTitle("Skipped Lines")
+
+        self.warning_window.exec()
     
     def create_back_up_for_tracker_data(self):
         """When the edit button in the table window is clicked, 
-        this method will be called to create a copy of the data
-        stored in tracker in case the user does not want to confirm
-        the changes done in the data.
+        this method will be called to start an edit session on the
+        tracker, which logs how to take back every change in case the
+        user does not want to confirm the changes done in the data.
         """
         self.tracker_selected.set_back_up_data()
     
@@ -726,17 +1343,9 @@ class MainWindow(QMainWindow):
             x_repeats = False
 
         if valid_input and not x_repeats:
-            tracker_data = self.tracker_selected.get_data()
-            new_graph_point = []
-            
-            new_graph_point.append(self.new_x_value)
-            new_graph_point.append(self.new_y_value)
+            self.tracker_model.add_point(self.new_x_value, self.new_y_value)
 
-            tracker_data.append(new_graph_point)
-
-            self.tracker_selected.sort_tracker_data()
-
-            self.render_tabular_window()
+            self.change_to_graph_button.setDisabled(self.tracker_model.rowCount() <= 1)
             self.add_row_window.accept()
 
         else:
@@ -753,8 +1362,7 @@ class MainWindow(QMainWindow):
                 self.warning_window.setStandardButtons(QMessageBox.Save | QMessageBox.Cancel)
 
             if self.warning_window.exec() == QMessageBox.Save:
-                self.tracker_selected.replace_y_value(self.new_x_value, self.new_y_value)
-                self.render_tabular_window()
+                self.tracker_model.replace_y_value(self.new_x_value, self.new_y_value)
                 self.add_row_window.accept()
 
     def add_new_row_canceled(self):
@@ -813,8 +1421,7 @@ class MainWindow(QMainWindow):
         pop up a window with an error message.
         """
         if len(self.axis_title_user_input.text()) > 0 and '\\' not in self.axis_title_user_input.text():
-            self.tracker_selected.set_x_axis_title(self.axis_title_user_input.text())
-            self.render_edit_window()
+            self.edit_model.set_x_axis_title(self.axis_title_user_input.text())
             self.edit_axis_window.accept()
         else:
             self.invalid_axis_title_name()
@@ -826,8 +1433,7 @@ class MainWindow(QMainWindow):
         pop up a window with an error message.
         """
         if len(self.axis_title_user_input.text()) > 0 and '\\' not in self.axis_title_user_input.text():
-            self.tracker_selected.set_y_axis_title(self.axis_title_user_input.text())
-            self.render_edit_window()
+            self.edit_model.set_y_axis_title(self.axis_title_user_input.text())
             self.edit_axis_window.accept()
         else:
             self.invalid_axis_title_name()
@@ -886,118 +1492,199 @@ class MainWindow(QMainWindow):
         self.edit_axis_window.show()
     
     def get_tracker_table(self):
-        """Returns a QTableWidget that contains the information stored
-        in the tracker selected.
+        """Returns a QTableView that shows the points of the tracker
+        selected through self.tracker_model.
         """
-        tracker_data = self.tracker_selected.get_data()
-        tracker_table = QTableWidget(len(tracker_data), 2)
+        tracker_table = QTableView()
 
+        tracker_table.setModel(self.tracker_model)
         tracker_table.setFont(QFont("Comic Sans MS", 11))
         tracker_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        tracker_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)     #Rows are never measured one by one.
         tracker_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         tracker_table.setSelectionMode(QAbstractItemView.NoSelection)
-        tracker_table.setHorizontalHeaderItem(0, QTableWidgetItem(self.tracker_selected.get_x_axis_title()))
-        tracker_table.setHorizontalHeaderItem(1, QTableWidgetItem(self.tracker_selected.get_y_axis_title()))
         tracker_table.horizontalHeader().setDefaultAlignment(Qt.AlignHCenter)
         tracker_table.horizontalHeader().setFont(QFont("Comic Sans MS", 12, italic=True))
         tracker_table.verticalHeader().hide()
-
-        for index in range(len(tracker_data)):
-            x_value = tracker_data[index][0]
-            y_value = tracker_data[index][1]
-            tracker_table.setItem(index, 0, QTableWidgetItem(str(x_value)))
-            tracker_table.setItem(index, 1, QTableWidgetItem(str(y_value)))
         
         return tracker_table
 
     def get_menu_table(self):
-        """Returns a QTableWidget that contains all the trackers.
+        """Returns a QTableView that shows the trackers through
+        self.menu_model, with delegates drawing the buttons of each row.
         """
-        trackers_table = QTableWidget(len(self.tracker_list), 4)
+        trackers_table = QTableView()
+        go_to_delegate = ButtonDelegate("Go", trackers_table)
+        delete_delegate = ButtonDelegate("X", trackers_table)
+        edit_name_delegate = ButtonDelegate("Edit", trackers_table)
+        export_delegate = ButtonDelegate("Export", trackers_table)
+
+        trackers_table.setModel(self.menu_model)
+        trackers_table.setItemDelegateForColumn(1, go_to_delegate)
+        trackers_table.setItemDelegateForColumn(2, delete_delegate)
+        trackers_table.setItemDelegateForColumn(3, edit_name_delegate)
+        trackers_table.setItemDelegateForColumn(4, export_delegate)
         trackers_table.setFont(QFont("Comic Sans MS", 11))
         trackers_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         trackers_table.setSelectionMode(QAbstractItemView.NoSelection)
         trackers_table.setShowGrid(False)
-        trackers_table.setHorizontalHeaderItem(0, QTableWidgetItem("Tracker Name"))
-        trackers_table.setHorizontalHeaderItem(1, QTableWidgetItem("Display Data"))
-        trackers_table.setHorizontalHeaderItem(2, QTableWidgetItem("Delete Tracker"))
-        trackers_table.setHorizontalHeaderItem(3, QTableWidgetItem("Edit Name"))
         trackers_table.horizontalHeader().setDefaultAlignment(Qt.AlignHCenter)
         trackers_table.horizontalHeader().setFont(QFont("Comic Sans MS", 12, italic=True))
         trackers_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        trackers_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        trackers_table.verticalHeader().hide()
 
-        for index in range(len(self.tracker_list)):
-            self.delete_button = QPushButton("X")
-            self.go_to_button = QPushButton("Go")
-            self.tracker_name = self.tracker_list[index].get_name()
-            self.edit_tracker_name_button = QPushButton("Edit")
-
-            self.go_to_button.clicked.connect(self.set_tracker_selected)
-            self.go_to_button.clicked.connect(self.render_tabular_window)
-            self.delete_button.clicked.connect(self.set_tracker_selected)
-            self.delete_button.clicked.connect(self.delete_tracker_selected)
-            self.delete_button.clicked.connect(self.render_menu_window)
-            self.edit_tracker_name_button.clicked.connect(self.set_tracker_selected)
-            self.edit_tracker_name_button.clicked.connect(self.edit_tracker_name)
-
-            trackers_table.setCellWidget(index, 0, QLabel(self.tracker_name))
-            trackers_table.setCellWidget(index, 1, self.go_to_button)
-            trackers_table.setCellWidget(index, 2, self.delete_button)
-            trackers_table.setCellWidget(index, 3, self.edit_tracker_name_button)
+        go_to_delegate.button_clicked.connect(self.go_to_tracker_clicked)
+        delete_delegate.button_clicked.connect(self.delete_tracker_clicked)
+        edit_name_delegate.button_clicked.connect(self.edit_tracker_name_clicked)
+        export_delegate.button_clicked.connect(self.export_tracker_clicked)
 
         return trackers_table
     
     def get_graph_view(self):
-        """Returns a QChartView object representing the graph
-        that needs to be shown.
+        """Returns a QChartView object with an empty graph.
+        Its points are set by refresh_graph_view.
         """
         graph = QtCharts.QChart()
-        graph_view = QtCharts.QChartView()
-        data_line = QtCharts.QLineSeries()
-        x_axis = QtCharts.QValueAxis()
-        y_axis = QtCharts.QValueAxis()
+        graph_view = TrackerChartView()
+        self.graph_chart = graph
+        self.graph_view = graph_view
+        self.graph_series = QtCharts.QLineSeries()
+        self.graph_x_axis = QtCharts.QValueAxis()
+        self.graph_y_axis = QtCharts.QValueAxis()
 
         graph.legend().hide()
         graph.setAnimationOptions(QtCharts.QChart.SeriesAnimations)
 
-        x_axis.setTitleText(self.tracker_selected.get_x_axis_title())
-        y_axis.setTitleText(self.tracker_selected.get_y_axis_title())
-        x_axis.setLabelsFont(QFont("Comic Sans MS", 12))
-        y_axis.setLabelsFont(QFont("Comic Sans MS", 12))
-
-        graph.addAxis(x_axis, Qt.AlignBottom)
-        graph.addAxis(y_axis, Qt.AlignLeft)
+        self.graph_x_axis.setLabelsFont(QFont("Comic Sans MS", 12))
+        self.graph_y_axis.setLabelsFont(QFont("Comic Sans MS", 12))
 
-        for graph_point in self.tracker_selected.get_data():
-            data_line.append(graph_point[0], graph_point[1])
+        graph.addAxis(self.graph_x_axis, Qt.AlignBottom)
+        graph.addAxis(self.graph_y_axis, Qt.AlignLeft)
+        graph.addSeries(self.graph_series)
 
-        graph.addSeries(data_line)
-
-        data_line.attachAxis(x_axis)
-        data_line.attachAxis(y_axis)
-        data_line.setPointsVisible(True)
+        self.graph_series.attachAxis(self.graph_x_axis)
+        self.graph_series.attachAxis(self.graph_y_axis)
+        self.graph_x_axis.rangeChanged.connect(self.update_graph_points)
 
         graph_view.setChart(graph)
         graph_view.setRenderHint(QPainter.Antialiasing)
 
         return graph_view
 
+    def refresh_graph_view(self):
+        """Shows the axis titles of the tracker selected in the
+        graph and zooms out to show all of its points. The y range
+        is found by the graph preparer along with the points.
+        """
+        x_values = self.tracker_selected.get_column(0)
+
+        self.graph_x_axis.setTitleText(self.tracker_selected.get_x_axis_title())
+        self.graph_y_axis.setTitleText(self.tracker_selected.get_y_axis_title())
+        self.graph_series.clear()   #The points of the tracker shown before must not be seen.
+
+        if len(x_values) > 0:
+            self.graph_x_axis.blockSignals(True)
+            self.graph_x_axis.setRange(x_values[0], x_values[-1])    #The x values are sorted.
+            self.graph_x_axis.blockSignals(False)
+            self.update_graph_points(x_values[0], x_values[-1], fit_y=True)
+
+    def update_graph_points(self, x_min, x_max, fit_y=False):
+        """Called when the x range of the graph changes, after zooming
+        or panning. The points between x_min and x_max are prepared by
+        self.graph_preparer and a placeholder is shown until they are ready.
+        If fit_y is True the y axis is set to the range of all the points.
+        """
+        if self.tracker_selected is None or not self.tracker_selected.loaded:
+            return
+        tracker = self.tracker_selected
+        x_values = tracker.get_column(0)
+        first = max(bisect_left(x_values, x_min) - 1, 0)    #Keeps the line going to the edges of the graph.
+        last = min(bisect_right(x_values, x_max) + 1, len(x_values))
+        width = max(self.graph_view.width(), GraphSampler.MIN_WIDTH)
+        method = self.GRAPH_SAMPLING_METHOD
+
+        self.graph_placeholder.setText(self.GRAPH_PLACEHOLDER_TEXT)
+        self.graph_placeholder.show()
+        self.graph_preparer.submit(lambda: self.get_graph_points(tracker, first, last, width, method, fit_y))
+
+    @staticmethod
+    def get_graph_points(tracker, first, last, width, method, fit_y=False):
+        """Returns the points of tracker with indexes first to last - 1
+        reduced to about two per pixel of a graph width pixels wide, as a list
+        of QPointF, and the lowest and highest y value of the tracker if fit_y
+        is True (None otherwise). With GraphSampler.MIN_MAX the points are
+        taken from the pyramid of the tracker, which always gives the y range.
+        This is called from the thread of the graph preparer.
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4]])
+        >>> points, y_range = MainWindow.get_graph_points(tracker, 0, 2, 100, GraphSampler.MIN_MAX, True)
+        >>> len(points), y_range
+        (2, (2.0, 4.0))
+        """
+        if method == GraphSampler.MIN_MAX:
+            sampled_x, sampled_y = tracker.get_pyramid().get_points(first, last, width)
+        else:
+            with tracker.columns_lock:  #Copies the points while the window cannot change them.
+                x_values = tracker.get_column(0)[first:last]
+                y_values = tracker.get_column(1)[first:last]
+            sampled_x, sampled_y = GraphSampler.sample(x_values, y_values, width, method)
+        y_range = tracker.get_pyramid().get_y_range() if fit_y else None
+        return [QPointF(x_value, y_value) for x_value, y_value in zip(sampled_x, sampled_y)], y_range
+
+    def show_graph_points(self, request_id, points, y_range):
+        """Called in the thread of the window when the graph preparer
+        finished points. The points replace the ones in the series in one
+        call, unless a newer request was made since. The y axis is set
+        to y_range unless it is None.
+        """
+        if not self.graph_preparer.is_current(request_id):
+            return
+        if y_range is not None:
+            self.graph_y_axis.setRange(*y_range)
+        small_graph = len(points) <= self.GRAPH_ANIMATION_LIMIT
+
+        self.graph_chart.setAnimationOptions(QtCharts.QChart.SeriesAnimations if small_graph else
+            QtCharts.QChart.NoAnimation)
+        self.graph_series.setPointsVisible(small_graph)
+        self.graph_series.replace(points)
+        self.graph_placeholder.hide()
+
+    def show_graph_error(self, request_id, message):
+        """Called in the thread of the window when the graph preparer
+        failed to prepare points. The graph is emptied and the placeholder
+        tells the user why, unless a newer request was made since.
+        """
+        if not self.graph_preparer.is_current(request_id):
+            return
+        self.graph_series.clear()
+        self.graph_placeholder.setText(f"The graph could not be drawn: {message}")
+        self.graph_placeholder.show()
+
     def get_menu_layout(self):
         """Sets layout to include all the trackers
         currently saved. Returns layout to render.
         """
         self.menu_table = self.get_menu_table()
+        self.menu_filter_input = QLineEdit()
         menu_layout = QGridLayout()
         add_button = QPushButton("Add New Tracker")
+        import_button = QPushButton("Import Tracker")
         menu_header = QLabel("ITrack Menu")
 
         add_button.setFont(QFont("Comic Sans MS", 9))
         add_button.clicked.connect(self.add_tracker)
+        import_button.setFont(QFont("Comic Sans MS", 9))
+        import_button.clicked.connect(self.import_tracker_clicked)
         menu_header.setFont(QFont("Comic Sans MS", 15))
+        self.menu_filter_input.setPlaceholderText("Search trackers")
+        self.menu_filter_input.textChanged.connect(self.menu_model.set_filter)
         
         menu_layout.addWidget(menu_header, 0, 0)
-        menu_layout.addWidget(self.menu_table, 1, 0)
+        menu_layout.addWidget(self.menu_filter_input, 0, 1)
+        menu_layout.addWidget(self.menu_table, 1, 0, 1, 2)
         menu_layout.addWidget(add_button, 2, 0)
+        menu_layout.addWidget(import_button, 2, 1)
 
         return menu_layout
     
@@ -1007,31 +1694,32 @@ class MainWindow(QMainWindow):
         """
         table_layout = QGridLayout()
         back_to_menu_button = QPushButton("Back to Menu")
-        change_to_graph_button = QPushButton("Set to Graphical Form")
+        self.change_to_graph_button = QPushButton("Set to Graphical Form")
         add_new_row_button = QPushButton("Add New Row")
+        import_rows_button = QPushButton("Import Rows")
         edit_button = QPushButton("Edit tracker")
-        tracker_header = QLabel(self.tracker_selected.get_name())
-
-        if len(self.tracker_selected.get_data()) <= 1:
-            change_to_graph_button.setDisabled(True)
+        self.table_header = QLabel()
 
-        tracker_header.setFont(QFont("Comic Sans MS", 14))
+        self.table_header.setFont(QFont("Comic Sans MS", 14))
         back_to_menu_button.setFont(QFont("Comic Sans MS", 9))
         back_to_menu_button.clicked.connect(self.render_menu_window)
-        change_to_graph_button.clicked.connect(self.render_graph_window)
-        change_to_graph_button.setFont(QFont("Comic Sans MS", 9))
+        self.change_to_graph_button.clicked.connect(self.render_graph_window)
+        self.change_to_graph_button.setFont(QFont("Comic Sans MS", 9))
         add_new_row_button.clicked.connect(self.add_row_button_clicked)
         add_new_row_button.setFont(QFont("Comic Sans MS", 10))
+        import_rows_button.clicked.connect(self.import_rows_clicked)
+        import_rows_button.setFont(QFont("Comic Sans MS", 10))
         edit_button.clicked.connect(self.create_back_up_for_tracker_data)
         edit_button.clicked.connect(self.render_edit_window)
         edit_button.setFont(QFont("Comic Sans MS", 9))
 
-        table_layout.addWidget(tracker_header, 0, 0, 1, 2)
+        table_layout.addWidget(self.table_header, 0, 0)
+        table_layout.addWidget(import_rows_button, 0, 1)
         table_layout.addWidget(add_new_row_button, 0, 2)
         table_layout.addWidget(self.get_tracker_table(), 1, 0, 1, 3)
         table_layout.addWidget(back_to_menu_button, 2, 0)
         table_layout.addWidget(edit_button, 2, 1)
-        table_layout.addWidget(change_to_graph_button, 2, 2)
+        table_layout.addWidget(self.change_to_graph_button, 2, 2)
 
         return table_layout
 
@@ -1042,51 +1730,50 @@ class MainWindow(QMainWindow):
         graph_window_layout = QGridLayout()
         tabular_form_button = QPushButton("Return to Tabular Form")
         back_to_trackers_menu = QPushButton("Return to Menu")
+        reset_zoom_button = QPushButton("Reset Zoom")
+        self.graph_placeholder = QLabel(self.GRAPH_PLACEHOLDER_TEXT)
         graph_frame = self.get_graph_view()
-        tracker_header = QLabel(self.tracker_selected.get_name())
+        self.graph_header = QLabel()
 
         tabular_form_button.clicked.connect(self.render_tabular_window)
         back_to_trackers_menu.clicked.connect(self.render_menu_window)
-        tracker_header.setFont(QFont("Comic Sans MS", 14))
+        self.graph_header.setFont(QFont("Comic Sans MS", 14))
         back_to_trackers_menu.setFont(QFont("Comic Sans MS", 9))
         tabular_form_button.setFont(QFont("Comic Sans MS", 9))
-
-        graph_window_layout.addWidget(tracker_header, 0, 0, 1, 2)
+        reset_zoom_button.clicked.connect(self.refresh_graph_view)
+        reset_zoom_button.setFont(QFont("Comic Sans MS", 9))
+        self.graph_placeholder.setFont(QFont("Comic Sans MS", 12, italic=True))
+        self.graph_placeholder.setAlignment(Qt.AlignCenter)
+        self.graph_placeholder.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.graph_placeholder.hide()
+
+        graph_window_layout.addWidget(self.graph_header, 0, 0)
+        graph_window_layout.addWidget(reset_zoom_button, 0, 1)
         graph_window_layout.addWidget(graph_frame, 1, 0, 1, 2)
+        graph_window_layout.addWidget(self.graph_placeholder, 1, 0, 1, 2)     #Drawn over the graph.
         graph_window_layout.addWidget(back_to_trackers_menu, 2, 0)
         graph_window_layout.addWidget(tabular_form_button, 2, 1)
 
         return graph_window_layout
     
     def get_edit_table(self):
-        """Returns a QTableWidget containing all the values of the
-        tracker. This table is allowed to be edited.
+        """Returns a QTableView showing the values of the tracker
+        through self.edit_model. The values can be edited in place
+        and several rows can be selected to delete them at once.
         """
-        table_data = self.tracker_selected.get_data()
-        self.edit_table = QTableWidget(len(table_data), 3)
+        self.edit_table = QTableView()
+        delete_delegate = ButtonDelegate("X", self.edit_table)
 
-        self.edit_table.blockSignals(True)
+        self.edit_table.setModel(self.edit_model)
+        self.edit_table.setItemDelegateForColumn(TrackerEditModel.DELETE_COLUMN, delete_delegate)
+        self.edit_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.edit_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.edit_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.edit_table.setHorizontalHeaderItem(0, QTableWidgetItem(self.tracker_selected.get_x_axis_title()))
-        self.edit_table.setHorizontalHeaderItem(1, QTableWidgetItem(self.tracker_selected.get_y_axis_title()))
-        self.edit_table.setHorizontalHeaderItem(2, QTableWidgetItem("Delete Row"))
+        self.edit_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.edit_table.horizontalHeader().setDefaultAlignment(Qt.AlignHCenter)
         self.edit_table.verticalHeader().hide()
 
-        self.edit_table.cellChanged.connect(self.edit_tracker_data)
-
-        for index in range(len(table_data)):
-            x_value = table_data[index][0]
-            y_value = table_data[index][1]
-            remove_row_button = QPushButton("X")
-
-            remove_row_button.clicked.connect(self.remove_data_row)
-            remove_row_button.clicked.connect(self.render_edit_window)
-
-            self.edit_table.setItem(index, 0, QTableWidgetItem(str(x_value)))
-            self.edit_table.setItem(index, 1, QTableWidgetItem(str(y_value)))
-            self.edit_table.setCellWidget(index, 2, remove_row_button)
-        self.edit_table.blockSignals(False)
+        delete_delegate.button_clicked.connect(self.remove_data_row)
         
         return self.edit_table
     
@@ -1099,165 +1786,325 @@ class MainWindow(QMainWindow):
         cancel_edit_button = QPushButton("Cancel")
         edit_x_axis_button = QPushButton("Edit X-Axis Title")
         edit_y_axis_button = QPushButton("Edit Y-Axis Title")
-        tracker_title = QLabel(self.tracker_selected.get_name() + ": Edit Window")
+        delete_rows_button = QPushButton("Delete Selected Rows")
+        self.edit_header = QLabel()
 
-        tracker_title.setFont(QFont("Comic Sans MS", 14, italic=True))
+        self.edit_header.setFont(QFont("Comic Sans MS", 14, italic=True))
         edit_x_axis_button.clicked.connect(self.edit_x_axis_title)
         edit_y_axis_button.clicked.connect(self.edit_y_axis_title)
         edit_x_axis_button.setFont(QFont("Comic Sans MS", 9))
         edit_y_axis_button.setFont(QFont("Comic Sans MS", 9))
+        delete_rows_button.clicked.connect(self.remove_selected_rows)
+        delete_rows_button.setFont(QFont("Comic Sans MS", 9))
         cancel_edit_button.clicked.connect(self.edit_tracker_canceled)
         cancel_edit_button.setFont(QFont("Comic Sans MS", 9))
         confirm_edit_button.clicked.connect(self.edit_tracker_confirmed)
         confirm_edit_button.setFont(QFont("Comic Sans MS", 9))
 
-        edit_window_layout.addWidget(tracker_title, 0, 0, 1, 2)
-        edit_window_layout.addWidget(edit_table_widget, 1, 0, 1, 2)
+        edit_window_layout.addWidget(self.edit_header, 0, 0, 1, 2)
+        edit_window_layout.addWidget(delete_rows_button, 0, 2)
+        edit_window_layout.addWidget(edit_table_widget, 1, 0, 1, 3)
         edit_window_layout.addWidget(edit_x_axis_button, 2, 0)
-        edit_window_layout.addWidget(edit_y_axis_button, 2, 1)
+        edit_window_layout.addWidget(edit_y_axis_button, 2, 1, 1, 2)
         edit_window_layout.addWidget(confirm_edit_button, 3, 0)
-        edit_window_layout.addWidget(cancel_edit_button, 3, 1)
+        edit_window_layout.addWidget(cancel_edit_button, 3, 1, 1, 2)
 
         return edit_window_layout
 
-    def delete_widgets_in_layout(self):
-        """Deletes current widgets in window in order
-        to substitute them with different widgets.
+    def get_screen(self, layout):
+        """Puts layout in a new widget, adds it to
+        self.screens and returns the widget.
         """
-        while True:
-            widget_to_remove = self.main_layout.takeAt(0)
-            if widget_to_remove == None:
-                break
-            else:
-                widget_to_remove.widget().deleteLater()
-    
+        screen = QWidget()
+
+        screen.setLayout(layout)
+        self.screens.addWidget(screen)
+        return screen
+
     def render_tabular_window(self):
-        """Renders main_layout obtained from method get_table_layout.
+        """Shows the screen of the table values of the tracker selected.
+        The points of the tracker selected are loaded the first time
+        it is opened.
         """
-        self.delete_widgets_in_layout()
-        self.main_layout = self.get_table_layout()
-        layout_container = QWidget()
-
-        layout_container.setLayout(self.main_layout)
-        self.setCentralWidget(layout_container)
+        self.graph_preparer.cancel()
+        if not self.load_tracker(self.tracker_selected):
+            return
+        self.tracker_model.set_tracker(self.tracker_selected)
+        self.table_header.setText(self.tracker_selected.get_name())
+        self.change_to_graph_button.setDisabled(self.tracker_model.rowCount() <= 1)
+
+        self.screens.setCurrentWidget(self.table_screen)
     
     def render_menu_window(self):
-        """Renders main_layout obtained from method get_menu_layout.
+        """Shows the screen of the menu with all the trackers.
         """
-        self.delete_widgets_in_layout()
-        self.main_layout = self.get_menu_layout()
-        layout_container = QWidget()
-
-        layout_container.setLayout(self.main_layout)
-        self.setCentralWidget(layout_container)
+        self.graph_preparer.cancel()
+        self.screens.setCurrentWidget(self.menu_screen)
     
     def render_graph_window(self):
-        """Renders main_layout obtained from method get_graph_layout.
+        """Shows the screen of the graphical representation
+        of the tracker selected.
         """
-        self.delete_widgets_in_layout()
-        self.main_layout = self.get_graph_layout()
-        layout_container = QWidget()
+        self.graph_header.setText(self.tracker_selected.get_name())
+        self.refresh_graph_view()
 
-        layout_container.setLayout(self.main_layout)
-        self.setCentralWidget(layout_container)
+        self.screens.setCurrentWidget(self.graph_screen)
     
     def render_edit_window(self):
-        """Renders main_layout obtained from the method
-        get_edit_layout.
+        """Shows the screen of the edit window of the tracker selected.
         """
-        self.delete_widgets_in_layout()
-        self.main_layout = self.get_edit_layout()
-        layout_container = QWidget()
+        self.edit_model.set_tracker(self.tracker_selected)
+        self.edit_header.setText(self.tracker_selected.get_name() + ": Edit Window")
 
-        layout_container.setLayout(self.main_layout)
-        self.setCentralWidget(layout_container)
+        self.screens.setCurrentWidget(self.edit_screen)
     
     def check_for_trash_files(self):
-        """Deletes any file that is not found in self.tracker_list
+        """Deletes the files this session left behind: the old files of
+        trackers that were renamed or deleted (self.orphaned_files), unless
+        a tracker has that name again, and temporary files of interrupted
+        writes. Files the application does not know about, like trackers
+        created by itrack_cli.py, are kept.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow()
+        >>> obj.TRACKER_INFO_DIR = mkdtemp()
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj.tracker_registry.add(tracker)
+        >>> for name in ('Steps', 'Walk', 'Run'):
+        ...     _ = TrackerFile.write_text(path.join(obj.TRACKER_INFO_DIR, name), 'X', 'Y', [], [])
+        >>> obj.orphaned_files.update(path.join(obj.TRACKER_INFO_DIR, name) for name in ('Steps', 'Walk'))
+        >>> open(TrackerFile.get_temp_path(path.join(obj.TRACKER_INFO_DIR, 'Steps')), 'w').close()
+        >>> obj.check_for_trash_files()
+        >>> sorted(name for name in listdir(obj.TRACKER_INFO_DIR) if not name.startswith('.'))
+        ['Run', 'Steps']
+        >>> listdir(path.join(obj.TRACKER_INFO_DIR, TrackerJournal.JOURNAL_DIR_NAME))
+        []
+        """
+        for file_path in self.orphaned_files:
+            if path.basename(file_path) not in self.tracker_registry and path.exists(file_path):
+                remove(file_path)
+        self.orphaned_files = set()
+
+        journal_dir = path.join(self.TRACKER_INFO_DIR, TrackerJournal.JOURNAL_DIR_NAME)
+        if path.isdir(journal_dir):
+            for file_name in listdir(journal_dir):
+                if file_name.endswith(TrackerFile.TEMP_SUFFIX):
+                    remove(path.join(journal_dir, file_name))
+
+    def queue_tracker_save(self, tracker):
+        """Takes a snapshot of tracker and queues it in the
+        save worker. The tracker is marked as saved up to the
+        snapshot once its file is written.
+        """
+        generation = tracker.generation
+        file_path = path.join(self.TRACKER_INFO_DIR, tracker.get_name())
+        snapshot = (tracker.file_format, tracker.get_x_axis_title(), tracker.get_y_axis_title(),
+            *tracker.copy_columns())
+
+        self.save_worker.submit(file_path, snapshot, lambda: tracker.mark_saved(generation))
+
+    def autosave(self):
+        """Called every self.AUTOSAVE_INTERVAL milliseconds. Queues a save
+        of every tracker with unsaved changes and compacts the journals that
+        have entries, without waiting for any of them to be written.
         """
-        for dir_name, sub_name, files in walk(self.TRACKER_INFO_DIR):
-            tracker_names = [tracker.get_name() for tracker in self.tracker_list]
-            for file in files:
-                if path.basename(file) not in tracker_names:
-                    remove(path.join(dir_name, file))
+        for tracker in self.tracker_registry:
+            if tracker.is_dirty():
+                self.queue_tracker_save(tracker)
+            elif tracker.journal is not None and tracker.journal.entries > 0 and not tracker.journal.is_compacting():
+                tracker.journal.compact()
 
     def save_data_in_files(self):
         """When the application closes, this method will
-        be in charge of saving all the data from all the trackers
-        stored in self.tracker_list in their respective files.
+        be in charge of making sure the data from all the trackers
+        stored in self.tracker_registry is saved in their respective files.
+        Trackers without unsaved changes are skipped. Changes recorded
+        in a journal are already on disk, so journals are only closed.
+        The files are written by the save worker, waiting at most
+        self.SAVE_TIMEOUT seconds for it. Returns the number of trackers
+        and bytes written.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow()
+        >>> obj.TRACKER_INFO_DIR = path.join(mkdtemp(), "tracker_info")
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> tracker.add_graph_point(1, 2)
+        True
+        >>> obj.tracker_registry.add(tracker)
+        >>> obj.save_data_in_files()
+        (1, 38)
+        >>> obj.save_data_in_files()
+        (0, 0)
         """
+        for tracker in self.tracker_registry:
+            if tracker.is_dirty():
+                tracker.load_data()     #Its old file may be removed as trash if it was renamed.
         self.check_for_trash_files()
         self.generate_tracker_data_directory()
 
-        all_trackers = self.tracker_list
+        all_trackers = self.tracker_registry.get_trackers()
 
+        self.save_worker.flush(self.SAVE_TIMEOUT)
         for tracker in all_trackers:
-            tracker_obj = tracker
-            tracker_data = tracker_obj.get_data()
-            tracker_name = tracker_obj.get_name()
-            tracker_x_axis = tracker_obj.get_x_axis_title()
-            tracker_y_axis = tracker_obj.get_y_axis_title()
-            file_name = tracker_name
-            file_path = path.join(self.TRACKER_INFO_DIR, file_name)
-
-            with open(file_path, 'w') as file:
-                file.write(f"{tracker_x_axis}\n")
-                file.write(f"{tracker_y_axis}\n")
-                for graph_point in tracker_data:
-                    file.write(f"{graph_point[0]} {graph_point[1]}\n")
+            if tracker.journal is not None:
+                tracker.journal.close()
+        files_written = self.save_worker.files_written
+        bytes_written = self.save_worker.bytes_written
+
+        for tracker in all_trackers:
+            if tracker.is_dirty():
+                self.queue_tracker_save(tracker)
+        self.save_worker.flush(self.SAVE_TIMEOUT)
+        return self.save_worker.files_written - files_written, self.save_worker.bytes_written - bytes_written
     
     def generate_tracker_data_directory(self):
         """Checks if directory tracker_info
         exists. If not, the directory is created.
         """
-        for dir_name, sub_name, files in walk(getcwd()):
-            if dir_name == self.TRACKER_INFO_DIR:
-                break
-        else:
-            mkdir(self.TRACKER_INFO_DIR)
+        makedirs(self.TRACKER_INFO_DIR, exist_ok=True)
     
+    def lock_storage(self):
+        """Takes the StorageLock of self.TRACKER_INFO_DIR for the whole
+        session, so itrack_cli.py waits instead of changing trackers the
+        application has in memory. Returns False, after telling the user,
+        if another program holds it for more than self.LOCK_TIMEOUT seconds.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow(StorageLocation(mkdtemp()))
+        >>> obj.lock_storage()
+        True
+        >>> StorageLock(obj.TRACKER_INFO_DIR).acquire(0)
+        False
+        >>> obj.storage_lock.release()
+        """
+        self.generate_tracker_data_directory()
+        self.storage_lock = StorageLock(self.TRACKER_INFO_DIR)
+        if self.storage_lock.acquire(self.LOCK_TIMEOUT):
+            return True
+
+        self.warning_window = QMessageBox()
+        self.warning_window.setIcon(QMessageBox.Warning)
+        self.warning_window.setText("The trackers in " + self.TRACKER_INFO_DIR +
+            " are in use by another ITrack window or a command line job.")
+        self.warning_window.setStandardButtons(QMessageBox.Ok)
+        self.warning_window.setWindowTitle("Trackers In Use")
+        self.warning_window.exec()
+        return False
+
     def load_tracker_data(self):
-        """Loads all the data inside the
-        directory tracker_info. Stores the data
-        in its trackers respectively and assembles everything together
-        in self.tracker_list.
+        """Loads the names and axis titles of all the trackers
+        inside the directory tracker_info and assembles everything together
+        in self.tracker_registry, sorted by file path. Only the files
+        directly inside tracker_info are trackers, since their journals and
+        saves are kept there; subdirectories are ignored.
+        The points of a tracker are only read when it is opened, unless its
+        journal has changes left by the previous session (which are folded
+        into its file right away) or self.LAZY_LOADING is False. Files are
+        read by a TrackerLoader with self.LOADER_WORKERS workers. Checksums
+        are checked when the points of a file are read, so startup only reads
+        headers; if self.VERIFY_FILES is True every file is checked at startup
+        instead. Corrupt files are quarantined instead of stopping the
+        application, and the user is told about them.
+        >>> from tempfile import mkdtemp
+        >>> obj = MainWindow(StorageLocation(mkdtemp()))
+        >>> obj.generate_tracker_data_directory()
+        >>> _ = TrackerFile.write_text(path.join(obj.TRACKER_INFO_DIR, 'Steps'), 'X', 'Y', [1.0], [2.0])
+        >>> with open(path.join(obj.TRACKER_INFO_DIR, 'Walk'), 'wb') as file_obj:
+        ...     _ = file_obj.write(TrackerFile.get_checksum_line(0) + b'X\\nY\\n1.0 2.0\\n')
+        >>> with open(path.join(obj.TRACKER_INFO_DIR, 'Bad'), 'wb') as file_obj:
+        ...     _ = file_obj.write(b'\\xff\\xfe\\n')
+        >>> makedirs(path.join(obj.TRACKER_INFO_DIR, 'old'))
+        >>> _ = TrackerFile.write_text(path.join(obj.TRACKER_INFO_DIR, 'old', 'Run'), 'X', 'Y', [], [])
+        >>> obj.execute_quarantine_window = lambda: None
+        >>> obj.load_tracker_data()
+        >>> [tracker.get_name() for tracker in obj.tracker_registry], len(obj.quarantined_files)
+        (['Steps', 'Walk'], 1)
+        >>> obj.load_tracker(obj.tracker_registry.get('Walk'))
+        False
+        >>> [tracker.get_name() for tracker in obj.tracker_registry]
+        ['Steps']
+
+        With self.VERIFY_FILES set, corrupt files are found at startup.
+        >>> obj = MainWindow(StorageLocation(mkdtemp()))
+        >>> obj.VERIFY_FILES = True
+        >>> obj.generate_tracker_data_directory()
+        >>> with open(path.join(obj.TRACKER_INFO_DIR, 'Walk'), 'wb') as file_obj:
+        ...     _ = file_obj.write(TrackerFile.get_checksum_line(0) + b'X\\nY\\n1.0 2.0\\n')
+        >>> obj.execute_quarantine_window = lambda: None
+        >>> obj.load_tracker_data()
+        >>> len(obj.tracker_registry), len(obj.quarantined_files)
+        (0, 1)
+
+        With self.LAZY_LOADING off, a file that cannot be read is quarantined
+        and the other trackers are still loaded.
+        >>> obj = MainWindow(StorageLocation(mkdtemp()))
+        >>> obj.LAZY_LOADING = False
+        >>> obj.generate_tracker_data_directory()
+        >>> _ = TrackerFile.write_text(path.join(obj.TRACKER_INFO_DIR, 'Steps'), 'X', 'Y', [1.0], [2.0])
+        >>> with open(path.join(obj.TRACKER_INFO_DIR, 'Walk'), 'wb') as file_obj:
+        ...     _ = file_obj.write(TrackerFile.get_checksum_line(0) + b'X\\nY\\n1.0 2.0\\n')
+        >>> obj.execute_quarantine_window = lambda: None
+        >>> obj.load_tracker_data()
+        >>> [tracker.get_name() for tracker in obj.loaded_trackers], len(obj.quarantined_files)
+        (['Steps'], 1)
         """
         self.generate_tracker_data_directory()
+        loader = TrackerLoader(self.LOADER_WORKERS)
+        trackers_to_load = []
 
-        for dir_name, sub_name, files in walk(self.TRACKER_INFO_DIR):
-            for file in files:
-                with open(path.join(dir_name, file), 'r') as file_obj:
-                    new_tracker = Tracker()
-                    tracker_data = []
-
-                    new_tracker.set_name(path.basename(file))
-
-                    x_axis_title = file_obj.readline().replace('\n', '')
-                    y_axis_title = file_obj.readline().replace('\n', '')
-
-                    new_tracker.set_x_axis_title(x_axis_title)
-                    new_tracker.set_y_axis_title(y_axis_title)
-                    while True:
-                        file_line = file_obj.readline()
-                        if not file_line:
-                            break
-                        else:
-                            x_value, y_value = file_line.split()
-                            graph_point = [float(x_value), float(y_value)]
-                            tracker_data.append(graph_point)
-                    new_tracker.set_data(tracker_data)
-                    self.tracker_list.append(new_tracker)
+        dir_name, sub_names, file_names = next(walk(self.TRACKER_INFO_DIR))
+        file_paths = sorted(path.join(dir_name, file_name) for file_name in file_names)
+
+        for file_path, header in zip(file_paths, loader.read_headers(file_paths, self.VERIFY_FILES)):
+            if header is None:
+                self.quarantined_files.append(self.storage_location.quarantine(file_path))
+                continue
+            new_tracker = Tracker()
+            file_format, x_axis_title, y_axis_title = header
+
+            new_tracker.set_name(path.basename(file_path))
+            new_tracker.file_format = file_format
+            new_tracker.set_x_axis_title(x_axis_title)
+            new_tracker.set_y_axis_title(y_axis_title)
+            new_tracker.loaded = False
+
+            journal = TrackerJournal(self.TRACKER_INFO_DIR, new_tracker, self.save_worker)
+            new_tracker.set_journal(journal)
+            new_tracker.file_path = file_path
+            if journal.has_entries() or not self.LAZY_LOADING:
+                trackers_to_load.append(new_tracker)
+            new_tracker.mark_saved()
+            self.tracker_registry.add(new_tracker)
+
+        loaded_files = loader.read_files([tracker.file_path for tracker in trackers_to_load])
+        for tracker, file_contents in zip(trackers_to_load, loaded_files):
+            if file_contents is None:
+                self.quarantine_tracker(tracker)
+                continue
+            try:
+                tracker.load_data(file_contents)
+            except (OSError, ValueError):
+                self.quarantine_tracker(tracker)
+                continue
+            if tracker.journal.has_entries():
+                tracker.journal.compact()
+            tracker.mark_saved()
+            self.loaded_trackers[tracker] = None
+        self.menu_model.set_trackers(self.tracker_registry)
         self.render_menu_window()
+        if self.quarantined_files:
+            self.execute_quarantine_window()
 
-app = QApplication()
-app_window = MainWindow()
+if __name__ == '__main__':
+    app = QApplication()
+    app_window = MainWindow(StorageLocation.resolve())
 
-app_window.load_tracker_data()
+    if app_window.lock_storage():
+        app_window.load_tracker_data()
 
-app_window.show()
-app.exec_()
+        app_window.show()
+        app.exec_()
 
-app_window.save_data_in_files()
+        app_window.save_data_in_files()
+        app_window.storage_lock.release()
 
-if __name__ == '__main__':
     doctest.testmod()
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+ITrack Command Line
+Lists, changes and queries trackers from scripts and scheduled jobs.
+It is built on itrack_core.py and does not import PySide2. Usage:
+    python itrack_cli.py [--data-dir DIR | --database FILE] list
+    python itrack_cli.py [--data-dir DIR | --database FILE] add NAME [X Y ...] [--create]
+    python itrack_cli.py [--data-dir DIR | --database FILE] replace NAME [X Y ...] [--create]
+    python itrack_cli.py [--data-dir DIR | --database FILE] dump NAME [--from X] [--to X]
+    python itrack_cli.py [--data-dir DIR | --database FILE] stats NAME [--from X] [--to X]
+    python itrack_cli.py [--data-dir DIR | --database FILE] migrate DATABASE
+add and replace read the points from the standard input when no
+points are given, one "x y" (or "x,y") pair per line. The trackers are
+the tracker files unless --database names a SQLite database to use
+instead; migrate copies every tracker into such a database.
+"""
+import sqlite3
+import sys
+from argparse import ArgumentParser
+from array import array
+from itertools import islice
+from itrack_core import StorageLocation, TrackerFileStore, TrackerSQLiteStore, TrackerTextParser
+
+class TrackerCommandLine:
+    """Class TrackerCommandLine runs one command on the trackers of a
+    TrackerStore: the tracker files of a StorageLocation, or a SQLite
+    database. Changes only touch the tracker they are made to, and range
+    queries are answered by the store (from its index, for a database).
+    Points are parsed in chunks of CHUNK_SIZE lines.
+    """
+    CHUNK_SIZE = 1 << 16
+    DUMP_CHUNK_SIZE = 1 << 14
+    DATABASE_FLAG = "--database"
+
+    def __init__(self, store, output=None):
+        """Initializes a TrackerCommandLine working on the trackers
+        of store and writing to output (the standard output if None).
+        >>> obj = TrackerCommandLine(TrackerFileStore(StorageLocation('tracker_info')))
+        >>> obj.output is sys.stdout
+        True
+        """
+        self.store = store
+        self.output = sys.stdout if output is None else output
+
+    @classmethod
+    def open_store(cls, arguments=None, environment=None):
+        """Returns the store chosen by the command line arguments: a
+        TrackerSQLiteStore if --database is given, and a TrackerFileStore
+        for the resolved StorageLocation otherwise.
+        >>> from os import path
+        >>> from tempfile import mkdtemp
+        >>> type(TrackerCommandLine.open_store(['--database', path.join(mkdtemp(), 'trackers.db'), 'list'])).__name__
+        'TrackerSQLiteStore'
+        >>> TrackerCommandLine.open_store(['--data-dir', '/data/trackers', 'list'], {}).tracker_info_dir == path.abspath('/data/trackers')
+        True
+        """
+        arguments = sys.argv[1:] if arguments is None else arguments
+        parser = ArgumentParser(add_help=False)
+        parser.add_argument(cls.DATABASE_FLAG, dest="database")
+        known_arguments, other_arguments = parser.parse_known_args(arguments)
+
+        if known_arguments.database:
+            return TrackerSQLiteStore(known_arguments.database)
+        return TrackerFileStore(StorageLocation.resolve(arguments, environment))
+
+    @staticmethod
+    def get_parser():
+        """Returns the ArgumentParser of the command line.
+        >>> arguments = TrackerCommandLine.get_parser().parse_args(['dump', 'Steps', '--from', '2'])
+        >>> arguments.command, arguments.name, arguments.first, arguments.last
+        ('dump', 'Steps', 2.0, None)
+        """
+        parser = ArgumentParser(description="Lists, changes and queries ITrack trackers.")
+        parser.add_argument(StorageLocation.COMMAND_LINE_FLAG, dest="data_dir",
+            help="directory of the tracker files (default: " + StorageLocation.ENVIRONMENT_VARIABLE +
+            " or tracker_info next to the scripts)")
+        parser.add_argument(TrackerCommandLine.DATABASE_FLAG, dest="database",
+            help="SQLite database of the trackers, used instead of the tracker files")
+        commands = parser.add_subparsers(dest="command", required=True)
+
+        commands.add_parser("list", help="list the trackers and their axis titles")
+        for command, help_text in (("add", "add points, replacing the y value of repeated x values"),
+            ("replace", "replace all the points of a tracker")):
+            command_parser = commands.add_parser(command, help=help_text)
+            command_parser.add_argument("name")
+            command_parser.add_argument("values", nargs="*", metavar="X Y",
+                help="points to add; read from the standard input if none are given")
+            command_parser.add_argument("--create", action="store_true", help="create the tracker if it does not exist")
+        for command, help_text in (("dump", "print the points of a tracker"),
+            ("stats", "print summary statistics of the points of a tracker")):
+            command_parser = commands.add_parser(command, help=help_text)
+            command_parser.add_argument("name")
+            command_parser.add_argument("--from", dest="first", type=float, help="smallest x value")
+            command_parser.add_argument("--to", dest="last", type=float, help="largest x value")
+        command_parser = commands.add_parser("migrate", help="copy every tracker into a SQLite database")
+        command_parser.add_argument("database_path", metavar="DATABASE")
+        return parser
+
+    def read_points(self, file_obj):
+        """Returns the x and y columns of the points in file_obj, one
+        "x y" or "x,y" pair per line. Blank lines and comments are skipped.
+        Lines are parsed CHUNK_SIZE at a time by a TrackerTextParser, and a
+        ValueError telling the number of the first bad line is raised if
+        one is not a pair of numbers.
+        >>> from io import StringIO
+        >>> TrackerCommandLine(TrackerSQLiteStore(':memory:')).read_points(StringIO('1 10\\n\\n2,20 # Sunday\\n'))
+        (array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        >>> TrackerCommandLine(TrackerSQLiteStore(':memory:')).read_points(StringIO('1 10\\n2\\n'))
+        Traceback (most recent call last):
+        ...
+        ValueError: line 2: expected an x and a y value, got '2'
+        """
+        x_values = array('d')
+        y_values = array('d')
+        parser = TrackerTextParser()
+        lines_read = 0
+
+        while True:
+            lines = list(islice(file_obj, self.CHUNK_SIZE))
+            if not lines:
+                break
+            chunk_x_values, chunk_y_values = parser.parse("".join(lines).replace(",", " "), lines_read + 1)
+            if parser.invalid_lines:
+                line_number = parser.invalid_lines[0]
+                raise ValueError(f"line {line_number}: expected an x and a y value, "
+                                 f"got {lines[line_number - lines_read - 1].strip()!r}")
+            x_values.extend(chunk_x_values)
+            y_values.extend(chunk_y_values)
+            lines_read += len(lines)
+        return x_values, y_values
+
+    @staticmethod
+    def get_values(arguments):
+        """Returns the x and y columns of points given as a flat list of
+        command line arguments.
+        >>> TrackerCommandLine.get_values(['1', '10', '2', '20'])
+        (array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        >>> TrackerCommandLine.get_values(['1'])
+        Traceback (most recent call last):
+        ...
+        ValueError: points must be given as x and y pairs
+        """
+        if len(arguments) % 2 == 1:
+            raise ValueError("points must be given as x and y pairs")
+        values = array('d', map(float, arguments))
+        return values[0::2], values[1::2]
+
+    def list_trackers(self):
+        """Writes the name and axis titles of every tracker, one tracker
+        per line separated by tabs.
+        >>> from tempfile import mkdtemp
+        >>> from io import StringIO
+        >>> obj = TrackerCommandLine(TrackerFileStore(StorageLocation(mkdtemp())), StringIO())
+        >>> obj.store.write('Steps', 'Day', 'Steps', [], [])
+        >>> obj.list_trackers()
+        >>> obj.output.getvalue()
+        'Steps\\tDay\\tSteps\\n'
+        """
+        names = self.store.get_names()
+
+        for name, (x_axis_title, y_axis_title) in zip(names, self.store.read_headers(names)):
+            self.output.write(f"{name}\t{x_axis_title}\t{y_axis_title}\n")
+
+    def dump(self, name, first=None, last=None):
+        """Writes the points of the tracker called name with an x value
+        between first and last, one "x y" pair per line.
+        >>> obj = TrackerCommandLine(TrackerSQLiteStore(':memory:'))
+        >>> obj.store.add_points('Steps', array('d', [1, 2, 3]), array('d', [10, 20, 30]), create=True)
+        >>> obj.dump('Steps', first=1.5)
+        2.0 20.0
+        3.0 30.0
+        """
+        x_values, y_values = self.store.read_range(name, first, last)
+
+        for start in range(0, len(x_values), self.DUMP_CHUNK_SIZE):
+            stop = min(start + self.DUMP_CHUNK_SIZE, len(x_values))
+            self.output.write("".join(f"{x_values[index]} {y_values[index]}\n" for index in range(start, stop)))
+
+    def migrate(self, database_path):
+        """Copies every tracker into the SQLite database at database_path.
+        Returns the number of trackers copied.
+        >>> from os import path
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerCommandLine(TrackerFileStore(StorageLocation(mkdtemp())))
+        >>> obj.store.add_points('Steps', array('d', [1]), array('d', [10]), create=True)
+        >>> obj.migrate(path.join(mkdtemp(), 'trackers.db'))
+        1
+        """
+        database = TrackerSQLiteStore(database_path)
+        try:
+            return database.copy_from(self.store)
+        finally:
+            database.close()
+
+    def run(self, arguments, input_file=None):
+        """Runs the command given in arguments, reading points from
+        input_file (the standard input if None) when needed. Returns the
+        exit status of the command. Errors are written to the standard error.
+        >>> from tempfile import mkdtemp
+        >>> from io import StringIO
+        >>> obj = TrackerCommandLine(TrackerFileStore(StorageLocation(mkdtemp())), StringIO())
+        >>> obj.run(['add', 'Steps', '--create'], StringIO('1 10\\n2 20\\n'))
+        0
+        >>> obj.run(['stats', 'Steps', '--to', '1'])
+        0
+        >>> obj.output.getvalue().split()
+        ['count', '1', 'first_x', '1.0', 'last_x', '1.0', 'min_y', '10.0', 'max_y', '10.0', 'mean_y', '10.0', 'sum_y', '10.0']
+        >>> obj.run(['dump', 'Walk'])
+        1
+        """
+        arguments = self.get_parser().parse_args(arguments)
+
+        try:
+            if arguments.command == "list":
+                self.list_trackers()
+            elif arguments.command in ("add", "replace"):
+                if arguments.values:
+                    new_x_values, new_y_values = self.get_values(arguments.values)
+                else:
+                    new_x_values, new_y_values = self.read_points(sys.stdin if input_file is None else input_file)
+                self.store.add_points(arguments.name, new_x_values, new_y_values, arguments.create,
+                    arguments.command == "replace")
+            elif arguments.command == "dump":
+                self.dump(arguments.name, arguments.first, arguments.last)
+            elif arguments.command == "stats":
+                for key, value in self.store.get_stats(arguments.name, arguments.first, arguments.last).items():
+                    self.output.write(f"{key}\t{value}\n")
+            elif arguments.command == "migrate":
+                self.migrate(arguments.database_path)
+        except (ValueError, LookupError, OSError, sqlite3.Error) as error:
+            sys.stderr.write(f"itrack_cli: {error}\n")
+            return 1
+        return 0
+
+if __name__ == '__main__':
+    sys.exit(TrackerCommandLine(TrackerCommandLine.open_store()).run(sys.argv[1:]))
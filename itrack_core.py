@@ -0,0 +1,4082 @@
+"""
+ITrack Core
+The trackers and their storage, without any user interface. This module
+does not import PySide2, so it can be used by batch jobs and its doctests
+run without a display. itrack.py builds the application on top of it.
+"""
+import csv
+import doctest
+import json
+import mmap
+import os
+import sqlite3
+import sys
+import struct
+from abc import ABC, abstractmethod
+from argparse import ArgumentParser
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice, repeat
+from math import isfinite
+from os import environ, makedirs, path, remove, replace, walk
+from sys import byteorder
+from threading import Condition, RLock, Thread
+from time import monotonic, sleep
+from zlib import crc32
+try:
+    import fcntl
+except ImportError:     #Windows locks files with msvcrt instead.
+    fcntl = None
+    import msvcrt
+
+class GraphPoint:
+    """Class GraphPoint is a lightweight view of a single
+    point stored in a Tracker. It behaves like the two element
+    list [x, y] that used to be stored in Tracker.data, but reads
+    and writes go straight to the columns of the tracker.
+    """
+    __slots__ = ("tracker", "index")
+
+    def __init__(self, tracker, index):
+        """Initializes a GraphPoint view for the point in
+        position index of tracker.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> point = GraphPoint(obj, 0)
+        >>> point.index
+        0
+        """
+        self.tracker = tracker
+        self.index = index
+
+    def __len__(self):
+        """Every point has an x and a y value.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> len(obj.get_data()[0])
+        2
+        """
+        return 2
+
+    def __getitem__(self, col):
+        """Returns the x value if col is 0 and the y
+        value if col is 1.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> obj.get_data()[0][0]
+        1.0
+        >>> obj.get_data()[0][1]
+        2.0
+        """
+        return self.tracker.get_column(col)[self.index]
+
+    def __setitem__(self, col, value):
+        """Changes the x value if col is 0 or the
+        y value if col is 1. Changing the x value moves
+        the point to keep the data ordered by x, so this view
+        follows the point to its new position.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.get_data()[0][1] = 5
+        >>> obj.get_data()
+        [[1.0, 5.0], [3.0, 4.0]]
+        >>> point = obj.get_data()[0]
+        >>> point[0] = 10
+        >>> obj.get_data()
+        [[3.0, 4.0], [10.0, 5.0]]
+        >>> point.index
+        1
+        """
+        if col == 0:
+            self.index = self.tracker.set_x_value(self.index, value)
+        elif col == 1:
+            self.tracker.set_y_value(self.index, value)
+        else:
+            raise IndexError("tracker column index out of range")
+
+    def __iter__(self):
+        """Yields the x value and then the y value.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> list(obj.get_data()[0])
+        [1.0, 2.0]
+        """
+        yield self.tracker.x_values[self.index]
+        yield self.tracker.y_values[self.index]
+
+    def __eq__(self, other):
+        """Compares the point with any other pair of values.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> obj.get_data()[0] == [1, 2]
+        True
+        >>> obj.get_data()[0] == [2, 1]
+        False
+        """
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        """Returns the point represented as a list.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> obj.get_data()[0]
+        [1.0, 2.0]
+        """
+        return repr(list(self))
+
+class TrackerDataView:
+    """Class TrackerDataView is a list-like view over the x and y
+    columns of a Tracker. It keeps the old list of lists contract
+    (indexing, iterating, append, pop) without storing a list per point.
+    """
+    __slots__ = ("tracker",)
+
+    def __init__(self, tracker):
+        """Initializes a view over the data stored in tracker.
+        >>> obj = Tracker()
+        >>> view = TrackerDataView(obj)
+        >>> view.tracker is obj
+        True
+        """
+        self.tracker = tracker
+
+    def __len__(self):
+        """Returns the number of points stored in the tracker.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> len(obj.get_data())
+        2
+        """
+        return len(self.tracker.x_values)
+
+    def __getitem__(self, index):
+        """Returns a GraphPoint for the given index. Negative
+        indexes count from the end like in a list.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.get_data()[-1]
+        [3.0, 4.0]
+        >>> obj.get_data()[2]
+        Traceback (most recent call last):
+        ...
+        IndexError: tracker data index out of range
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("tracker data index out of range")
+        return GraphPoint(self.tracker, index)
+
+    def __iter__(self):
+        """Yields a GraphPoint for every point in the tracker.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> [point[0] for point in obj.get_data()]
+        [1.0, 3.0]
+        """
+        for index in range(len(self)):
+            yield GraphPoint(self.tracker, index)
+
+    def __eq__(self, other):
+        """Compares the points with any other sequence of pairs.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.get_data() == [[1, 2], [3, 4]]
+        True
+        >>> obj.get_data() == [[1, 2]]
+        False
+        """
+        try:
+            return [list(point) for point in self] == [list(point) for point in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        """Returns the data represented as a list of lists.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.get_data()
+        [[1.0, 2.0], [3.0, 4.0]]
+        """
+        return repr([list(point) for point in self])
+
+    def append(self, graph_point):
+        """Adds a new [x, y] point to the tracker data. Since the
+        data is always ordered by x, the point is inserted in its
+        sorted position rather than at the end.
+        >>> obj = Tracker()
+        >>> obj.get_data().append([5, 6])
+        >>> obj.get_data().append([1, 2])
+        >>> obj.get_data()
+        [[1.0, 2.0], [5.0, 6.0]]
+        """
+        x_value, y_value = graph_point
+        self.tracker.add_graph_point(x_value, y_value)
+
+    def pop(self, index=-1):
+        """Removes the point stored in index and returns
+        it as a [x, y] list.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.get_data().pop(0)
+        [1.0, 2.0]
+        >>> obj.get_data()
+        [[3.0, 4.0]]
+        """
+        return self.tracker.remove_row(index)
+
+class Tracker:
+    """Class Tracker is a class that stores the data of a tracker
+    in two columns of floats (self.x_values and self.y_values) and a string
+    that represents the name given to the tracker. The columns are array('d')
+    buffers so every point costs 16 bytes instead of a list and two floats.
+    The data can still be accessed as a list of [x, y] points through
+    the view returned by get_data(). It also has a field that
+    stores the same values of the data independently in
+    case the data needs to be restored (this field should not be accessed).
+    The titles of the x and y axis are also stored, and a back up is also stored
+    in case the values need to be restored.
+    The points are always kept ordered by their x value, so
+    lookups by x use a binary search over self.x_values.
+    If a TrackerJournal is attached, every change is recorded
+    in it as it happens. Every change also increases self.generation,
+    which is compared with self.saved_generation to know whether the
+    tracker has changes that are not on disk yet.
+    Trackers loaded from a binary file keep the columns as read-only
+    memoryviews of the mapped file until the first change is made.
+    A tracker can be created with only its name and axis titles
+    (self.loaded is False). Its points are read from self.file_path
+    the first time they are needed.
+    The TrackerPyramid used to draw big graphs is built the first time
+    it is needed and updated as the points change.
+    """
+    def __init__(self):
+        """Initializes a Tracker class.
+        >>> obj = Tracker()
+        >>> obj.name
+        ''
+        >>> obj.data
+        []
+        >>> obj.x_values
+        array('d')
+        >>> obj.y_values
+        array('d')
+        >>> obj.undo_log
+        >>> obj.x_axis_title
+        'X-Axis'
+        >>> obj.y_axis_title
+        'Y-Axis'
+        >>> obj.journal
+        >>> obj.generation
+        0
+        >>> obj.saved_generation
+        0
+        >>> obj.file_format
+        'text'
+        >>> obj.file_path
+        >>> obj.loaded
+        True
+        >>> obj.pyramid
+        >>> type(obj.columns_lock).__name__
+        'RLock'
+        """
+        self.name = ""
+        self.x_values = array('d')
+        self.y_values = array('d')
+        self.undo_log = None
+        self.x_axis_title = "X-Axis"
+        self.y_axis_title = "Y-Axis"
+        self.journal = None
+        self.generation = 0
+        self.saved_generation = 0
+        self.file_format = TrackerFile.TEXT_FORMAT
+        self.file_path = None
+        self.loaded = True
+        self.pyramid = None
+        self.columns_lock = RLock()     #Held while the columns change, so other threads read them whole.
+
+    @property
+    def data(self):
+        """List-like view of the data kept for compatibility
+        with code that used the old list of lists field.
+        >>> obj = Tracker()
+        >>> obj.data = [[1, 2]]
+        >>> obj.data
+        [[1.0, 2.0]]
+        """
+        return TrackerDataView(self)
+
+    @data.setter
+    def data(self, new_data):
+        self.set_data(new_data)
+
+    def __str__(self):
+        """Returns a human readable string
+        representing Tracker class.
+        >>> obj = Tracker()
+        >>> print(obj)
+        : []
+        >>> obj.name = 'Hi'
+        >>> obj.data = [[1, 2], [3, 4]]
+        >>> print(obj)
+        Hi: [[1.0, 2.0], [3.0, 4.0]]
+        """
+        return f"{self.name}: {self.data}"
+    
+    def get_name(self):
+        """Returns the name of the tracker saved
+        by the user.
+        >>> obj = Tracker()
+        >>> obj.get_name()
+        ''
+        >>> obj.name = 'Hi'
+        >>> obj.get_name()
+        'Hi'
+        """
+        return self.name
+    
+    def get_data(self):
+        """Returns a list-like view of the data stored in the tracker object.
+        >>> obj = Tracker()
+        >>> obj.get_data()
+        []
+        >>> obj.data = [[1, 2]]
+        >>> obj.get_data()
+        [[1.0, 2.0]]
+        """
+        self.load_data()
+        return TrackerDataView(self)
+    
+    def set_name(self, new_name):
+        """Changes name of field self.name to new_name
+        >>> obj = Tracker()
+        >>> obj.set_name('Hi')
+        >>> obj.get_name()
+        'Hi'
+        >>> obj.set_name('')
+        >>> obj.get_name()
+        ''
+        """
+        self.generation += 1
+        if self.journal is not None:
+            self.journal.rename(new_name)
+            self.mark_saved()
+        self.name = new_name
+
+    def set_journal(self, journal):
+        """Attaches a TrackerJournal where every change made
+        to the tracker will be recorded. None detaches it.
+        >>> obj = Tracker()
+        >>> obj.set_journal(None)
+        >>> obj.journal
+        """
+        self.journal = journal
+
+    def record_change(self, *fields):
+        """Counts a change made to the tracker and records it
+        in the journal of the tracker if it has one. A change recorded
+        in the journal is already on disk.
+        >>> obj = Tracker()
+        >>> obj.record_change("set", 1.0, 2.0)
+        >>> obj.generation
+        1
+        >>> obj.is_dirty()
+        True
+        """
+        self.generation += 1
+        if self.journal is not None:
+            self.journal.record(*fields)
+            self.mark_saved()
+
+    def record_undo(self, *fields):
+        """Adds to the undo log, during an edit session, the change that
+        takes back a change being made: "set x y" (put back a point or
+        its old y value), "del x" (remove a point that was added), "rows
+        x_values y_values" (put back points removed together), "delrange
+        x_first x_last" (remove points put back together), "xtitle t"
+        or "ytitle t" (put back a title) and "columns x_values y_values"
+        (put back columns that were replaced, kept without copying them).
+        >>> obj = Tracker()
+        >>> obj.record_undo("del", 1.0)
+        >>> obj.undo_log
+        >>> obj.set_back_up_data()
+        >>> obj.record_undo("del", 1.0)
+        >>> obj.undo_log
+        [('del', 1.0)]
+        """
+        if self.undo_log is not None:
+            self.undo_log.append(fields)
+
+    def is_dirty(self):
+        """Returns True if the tracker has changes that
+        have not been saved yet.
+        >>> obj = Tracker()
+        >>> obj.is_dirty()
+        False
+        >>> obj.add_graph_point(1, 2)
+        True
+        >>> obj.is_dirty()
+        True
+        >>> obj.mark_saved()
+        >>> obj.is_dirty()
+        False
+        >>> obj.add_graph_point(1, 3)
+        False
+        >>> obj.is_dirty()
+        False
+        """
+        return self.generation != self.saved_generation
+
+    def mark_saved(self, generation=None):
+        """Marks the tracker as saved up to the given generation,
+        or up to its current generation if none is given.
+        >>> obj = Tracker()
+        >>> obj.set_x_axis_title('X')
+        >>> saved = obj.generation
+        >>> obj.set_y_axis_title('Y')
+        >>> obj.mark_saved(saved)
+        >>> obj.is_dirty()
+        True
+        """
+        self.saved_generation = self.generation if generation is None else generation
+    
+    def load_data(self, file_contents=None, parser=None):
+        """Reads the points of the tracker from self.file_path if
+        they were not loaded yet, and applies the changes stored in
+        its journal on top of them. Loading is not counted as a change.
+        If the file was already read (for example by a TrackerLoader),
+        the tuple returned by TrackerFile.read can be given as file_contents.
+        Otherwise a text file is parsed by parser (see TrackerFile.read_text).
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> obj = Tracker()
+        >>> obj.file_path = file_path
+        >>> obj.loaded = False
+        >>> obj.load_data()
+        >>> obj.loaded, obj.is_dirty()
+        (True, False)
+        >>> obj.get_data()
+        [[1.0, 2.0]]
+        """
+        if self.loaded:
+            return
+        journal = self.journal
+        generation = self.generation
+
+        self.journal = None     #Changes replayed from the journal must not be recorded again.
+        try:
+            if journal is not None:
+                journal.wait_for_compaction()
+            if file_contents is None:
+                file_contents = TrackerFile.read(self.file_path, parser)
+            file_format, x_axis_title, y_axis_title, x_values, y_values = file_contents
+            self.set_columns(x_values, y_values, copy=file_format == TrackerFile.TEXT_FORMAT)
+            self.loaded = True
+            if journal is not None:
+                journal.replay()
+        finally:
+            self.journal = journal
+        self.generation = generation
+
+    def unload_data(self):
+        """Drops the points of the tracker from memory so they are read
+        again from its file when needed. Only trackers that are saved and
+        not being edited can be unloaded. Returns True if the data was unloaded.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> obj = Tracker()
+        >>> obj.unload_data()
+        False
+        >>> obj.file_path = file_path
+        >>> obj.unload_data()
+        True
+        >>> obj.x_values, obj.loaded
+        (array('d'), False)
+        >>> obj.get_data()
+        [[1.0, 2.0]]
+        """
+        if not self.loaded or self.file_path is None or self.is_dirty() or self.undo_log is not None:
+            return False
+        with self.columns_lock:
+            self.x_values = array('d')
+            self.y_values = array('d')
+            self.pyramid = None
+        self.loaded = False
+        return True
+
+    def get_column(self, col):
+        """Returns the x column if col is 0 and the
+        y column if col is 1.
+        >>> obj = Tracker()
+        >>> obj.get_column(0) is obj.x_values
+        True
+        >>> obj.get_column(1) is obj.y_values
+        True
+        """
+        if col == 0:    #column 0 stores the x values and column 1 the y values.
+            return self.x_values
+        elif col == 1:
+            return self.y_values
+        else:
+            raise IndexError("tracker column index out of range")
+
+    def set_data(self, new_data):
+        """Changes data stored in the tracker object
+        with new_data, an iterable of [x, y] points.
+        Empty points are ignored.
+        >>> obj = Tracker()
+        >>> obj.set_data([[]])
+        >>> obj.get_data()
+        []
+        >>> obj.set_data([[1, 2], [1, 3]])
+        >>> obj.get_data()
+        [[1.0, 2.0], [1.0, 3.0]]
+        >>> obj.set_data(obj.get_data())
+        >>> obj.get_data()
+        [[1.0, 2.0], [1.0, 3.0]]
+        """
+        x_values = array('d')
+        y_values = array('d')
+        for graph_point in new_data:
+            if len(graph_point) > 0:
+                x_values.append(graph_point[0])
+                y_values.append(graph_point[1])
+        self.set_columns(x_values, y_values)
+
+    @staticmethod
+    def to_column(values):
+        """Returns a new array('d') with the given values. Arrays and
+        memoryviews of floats are copied in a single memory copy.
+        >>> Tracker.to_column([1, 2])
+        array('d', [1.0, 2.0])
+        >>> Tracker.to_column(memoryview(array('d', [3, 4])))
+        array('d', [3.0, 4.0])
+        """
+        column = array('d')
+        if getattr(values, 'typecode', None) == 'd' or getattr(values, 'format', None) == 'd':
+            column.frombytes(memoryview(values).cast('B'))
+        else:
+            column.extend(values)
+        return column
+
+    def copy_columns(self):
+        """Returns independent copies of the x and y columns.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2]])
+        >>> x_values, y_values = obj.copy_columns()
+        >>> x_values is obj.x_values
+        False
+        >>> x_values, y_values
+        (array('d', [1.0]), array('d', [2.0]))
+        """
+        self.load_data()
+        return self.to_column(self.x_values), self.to_column(self.y_values)
+
+    def make_columns_writable(self):
+        """Copies the columns into arrays if they are
+        read-only views of a mapped file.
+        >>> obj = Tracker()
+        >>> obj.set_columns(memoryview(array('d', [1])), memoryview(array('d', [2])), copy=False)
+        >>> type(obj.x_values).__name__
+        'memoryview'
+        >>> obj.make_columns_writable()
+        >>> obj.x_values, obj.y_values
+        (array('d', [1.0]), array('d', [2.0]))
+        """
+        self.load_data()
+        if not isinstance(self.x_values, array) or not isinstance(self.y_values, array):
+            x_values, y_values = self.copy_columns()
+            with self.columns_lock:
+                self.x_values, self.y_values = x_values, y_values
+
+    def set_columns(self, x_values, y_values, copy=True):
+        """Replaces the data stored in the tracker with
+        the given x and y columns. Both columns need to have
+        the same length. The columns are sorted by x if needed.
+        If copy is False the given columns are used as they are,
+        so they must already be sorted (this is used to keep
+        the mapped columns of a binary file without copying them).
+        >>> obj = Tracker()
+        >>> obj.set_columns([1, 2], [3, 4])
+        >>> obj.get_data()
+        [[1.0, 3.0], [2.0, 4.0]]
+        >>> obj.set_columns([2, 1], [3, 4])
+        >>> obj.get_data()
+        [[1.0, 4.0], [2.0, 3.0]]
+        >>> obj.set_columns([1], [])
+        Traceback (most recent call last):
+        ...
+        ValueError: x and y columns must have the same length
+        """
+        if len(x_values) != len(y_values):
+            raise ValueError("x and y columns must have the same length")
+        self.record_undo("columns", self.x_values, self.y_values)   #The old columns are replaced, never changed.
+        if copy:
+            x_values, y_values = self.sort_columns(self.to_column(x_values), self.to_column(y_values))
+        with self.columns_lock:
+            self.x_values = x_values
+            self.y_values = y_values
+            self.pyramid = None
+        self.loaded = True
+        self.generation += 1
+        if self.journal is not None:
+            self.journal.compact()     #A bulk change is cheaper to store as a new snapshot.
+
+    def get_pyramid(self):
+        """Returns the TrackerPyramid of the tracker,
+        creating it the first time it is needed.
+        >>> obj = Tracker()
+        >>> obj.get_pyramid() is obj.get_pyramid()
+        True
+        """
+        self.load_data()
+        if self.pyramid is None:
+            self.pyramid = TrackerPyramid(self)
+        return self.pyramid
+
+    def invalidate_pyramid(self, index, shifted=True):
+        """Tells the pyramid, if there is one, that the point in index
+        changed. shifted is True if the points after index moved because a
+        point was inserted or removed, and False if only its y value changed.
+        """
+        if self.pyramid is not None:
+            self.pyramid.invalidate(index, shifted)
+
+    def find_x_index(self, x_value):
+        """Returns the index of the point with the given
+        x value, or -1 if there is no such point.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4], [5, 6]])
+        >>> obj.find_x_index(3)
+        1
+        >>> obj.find_x_index(4)
+        -1
+        """
+        self.load_data()
+        index = bisect_left(self.x_values, x_value)
+        if index < len(self.x_values) and self.x_values[index] == x_value:
+            return index
+        return -1
+
+    def find_insert_index(self, x_value):
+        """Returns the index where a point with the given
+        x value would be inserted to keep the data sorted.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4], [5, 6]])
+        >>> obj.find_insert_index(4)
+        2
+        >>> obj.find_insert_index(0)
+        0
+        """
+        self.load_data()
+        return bisect_left(self.x_values, x_value)
+
+    def add_graph_point(self, x_value, y_value):
+        """Inserts a new point in its sorted position. Returns
+        False without changing the data if the x value already exists.
+        >>> obj = Tracker()
+        >>> obj.add_graph_point(5, 1)
+        True
+        >>> obj.add_graph_point(2, 3)
+        True
+        >>> obj.add_graph_point(5, 9)
+        False
+        >>> obj.get_data()
+        [[2.0, 3.0], [5.0, 1.0]]
+        """
+        self.load_data()
+        index = bisect_left(self.x_values, x_value)
+        if index < len(self.x_values) and self.x_values[index] == x_value:
+            return False
+        self.make_columns_writable()
+        with self.columns_lock:
+            self.x_values.insert(index, x_value)
+            self.y_values.insert(index, y_value)
+            self.invalidate_pyramid(index)
+        self.record_undo("del", x_value)
+        self.record_change("set", x_value, y_value)
+        return True
+
+    def remove_graph_point(self, x_value):
+        """Removes the point with the given x value. Returns
+        False if there is no such point.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.remove_graph_point(1)
+        True
+        >>> obj.remove_graph_point(1)
+        False
+        >>> obj.get_data()
+        [[3.0, 4.0]]
+        """
+        index = self.find_x_index(x_value)
+        if index == -1:
+            return False
+        self.remove_row(index)
+        return True
+
+    def remove_row(self, index):
+        """Removes the point stored in index and returns
+        it as a [x, y] list.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.remove_row(1)
+        [3.0, 4.0]
+        >>> obj.get_data()
+        [[1.0, 2.0]]
+        """
+        self.make_columns_writable()
+        with self.columns_lock:
+            graph_point = [self.x_values.pop(index), self.y_values.pop(index)]
+            self.invalidate_pyramid(index)
+        self.record_undo("set", *graph_point)
+        self.record_change("del", graph_point[0])
+        return graph_point
+
+    def remove_rows(self, first, last):
+        """Removes the points stored in indexes first to last - 1
+        with one deletion from each column. They are recorded in the
+        journal as a single "delrange" change.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4], [5, 6], [7, 8]])
+        >>> obj.set_back_up_data()
+        >>> obj.remove_rows(1, 3)
+        >>> obj.get_data()
+        [[1.0, 2.0], [7.0, 8.0]]
+        >>> obj.undo_log
+        [('rows', array('d', [3.0, 5.0]), array('d', [4.0, 6.0]))]
+        """
+        if first >= last:
+            return
+        self.make_columns_writable()
+        with self.columns_lock:
+            x_values = self.x_values[first:last]
+            y_values = self.y_values[first:last]
+            del self.x_values[first:last]
+            del self.y_values[first:last]
+            self.invalidate_pyramid(first)
+        self.record_undo("rows", x_values, y_values)
+        self.record_change("delrange", x_values[0], x_values[-1])
+
+    def remove_x_range(self, x_first, x_last):
+        """Removes the points with x values from x_first to x_last.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4], [5, 6]])
+        >>> obj.remove_x_range(2, 5)
+        >>> obj.get_data()
+        [[1.0, 2.0]]
+        """
+        self.load_data()
+        self.remove_rows(bisect_left(self.x_values, x_first), bisect_right(self.x_values, x_last))
+
+    def insert_rows(self, x_values, y_values):
+        """Puts back the sorted points removed by remove_rows. No point
+        of the tracker may have an x value between the first and the last
+        of x_values. Every point is recorded in the journal as a change.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [7, 8]])
+        >>> obj.insert_rows(array('d', [3, 5]), array('d', [4, 6]))
+        >>> obj.get_data()
+        [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]]
+        """
+        self.make_columns_writable()
+        with self.columns_lock:
+            index = bisect_left(self.x_values, x_values[0])
+            self.x_values[index:index] = x_values
+            self.y_values[index:index] = y_values
+            self.invalidate_pyramid(index)
+        self.record_undo("delrange", x_values[0], x_values[-1])
+        for x_value, y_value in zip(x_values, y_values):
+            self.record_change("set", x_value, y_value)
+
+    def set_y_value(self, index, y_value):
+        """Changes the y value of the point stored in index.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4]])
+        >>> obj.set_y_value(1, 10)
+        >>> obj.get_data()
+        [[1.0, 2.0], [3.0, 10.0]]
+        """
+        self.make_columns_writable()
+        self.record_undo("set", self.x_values[index], self.y_values[index])
+        with self.columns_lock:
+            self.y_values[index] = y_value
+            self.invalidate_pyramid(index, shifted=False)
+        self.record_change("set", self.x_values[index], y_value)
+
+    def set_x_value(self, index, x_value):
+        """Changes the x value of the point stored in index and
+        moves the point so the data stays sorted. Returns the new
+        index of the point. The caller is expected to have checked
+        that x_value is not repeated with check_for_x_repeats.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 2], [3, 4], [5, 6]])
+        >>> obj.set_x_value(0, 4)
+        1
+        >>> obj.get_data()
+        [[3.0, 4.0], [4.0, 2.0], [5.0, 6.0]]
+        >>> obj.set_x_value(2, 0)
+        0
+        >>> obj.get_data()
+        [[0.0, 6.0], [3.0, 4.0], [4.0, 2.0]]
+        """
+        self.make_columns_writable()
+        old_x_value = self.x_values[index]
+        y_value = self.y_values[index]
+        with self.columns_lock:
+            del self.x_values[index]
+            del self.y_values[index]
+            new_index = bisect_left(self.x_values, x_value)
+            self.x_values.insert(new_index, x_value)
+            self.y_values.insert(new_index, y_value)
+            self.invalidate_pyramid(min(index, new_index))
+        self.record_undo("set", old_x_value, y_value)
+        self.record_undo("del", x_value)
+        self.record_change("del", old_x_value)
+        self.record_change("set", x_value, y_value)
+        return new_index
+    
+    def set_x_axis_title(self, new_title):
+        """Sets self.x_axis_title with given new_title
+        >>> obj = Tracker()
+        >>> previous_title = obj.get_x_axis_title()
+        >>> obj.set_x_axis_title('X')
+        >>> previous_title != obj.get_x_axis_title()
+        True
+        >>> obj.get_x_axis_title()
+        'X'
+        >>> obj.set_x_axis_title('')
+        >>> obj.get_x_axis_title()
+        ''
+        """
+        self.record_undo("xtitle", self.x_axis_title)
+        self.x_axis_title = new_title
+        self.record_change("xtitle", new_title)
+    
+    def set_y_axis_title(self, new_title):
+        """Sets self.y_axis_title with given new_title
+        >>> obj = Tracker()
+        >>> previous_title = obj.get_y_axis_title()
+        >>> obj.set_y_axis_title('Y')
+        >>> previous_title != obj.get_y_axis_title()
+        True
+        >>> obj.get_y_axis_title()
+        'Y'
+        >>> obj.set_y_axis_title('')
+        >>> obj.get_y_axis_title()
+        ''
+        """
+        self.record_undo("ytitle", self.y_axis_title)
+        self.y_axis_title = new_title
+        self.record_change("ytitle", new_title)
+    
+    def get_x_axis_title(self):
+        """Returns the title stored in
+        self.x_axis_title
+        >>> obj = Tracker()
+        >>> obj.get_x_axis_title()
+        'X-Axis'
+        >>> obj.set_y_axis_title('X')
+        >>> obj.get_y_axis_title()
+        'X'
+        """
+        return self.x_axis_title
+    
+    def get_y_axis_title(self):
+        """Returns the title stored in
+        self.y_axis_title.
+        >>> obj = Tracker()
+        >>> obj.get_y_axis_title()
+        'Y-Axis'
+        >>> obj.set_y_axis_title('Y')
+        >>> obj.get_y_axis_title()
+        'Y'
+        """
+        return self.y_axis_title
+    
+    def set_back_up_data(self):
+        """Starts an edit session. Nothing is copied: from now on every
+        change records in self.undo_log the change that takes it back, so
+        restore_data only has to undo the changes that were made.
+        >>> obj = Tracker()
+        >>> obj.set_data([[1, 4], [6, 10]])
+        >>> obj.set_back_up_data()
+        >>> obj.undo_log
+        []
+        >>> obj.set_y_value(0, 5)
+        >>> obj.undo_log
+        [('set', 1.0, 4.0)]
+        """
+        self.load_data()
+        self.undo_log = []
+
+    def restore_data(self):
+        """Cancels the edit session, taking back the changes in
+        self.undo_log from the last one to the first. The changes that
+        take them back are recorded in the journal like any other change.
+        >>> obj = Tracker()
+        >>> obj.set_data([[2, 0], [10, 2]])
+        >>> previous_data = obj.get_data()
+        >>> previous_x_title = obj.get_x_axis_title()
+        >>> previous_y_title = obj.get_y_axis_title()
+        >>> obj.set_back_up_data()
+        >>> obj.add_graph_point(5, 1)
+        True
+        >>> obj.set_x_value(0, 20)
+        2
+        >>> _ = obj.remove_row(0)
+        >>> obj.set_y_value(0, 7)
+        >>> obj.remove_rows(0, 2)
+        >>> obj.set_x_axis_title('X')
+        >>> obj.set_y_axis_title('y')
+        >>> obj.restore_data()
+        >>> obj.get_data() == previous_data
+        True
+        >>> obj.get_x_axis_title() == previous_x_title
+        True
+        >>> obj.get_y_axis_title() == previous_y_title
+        True
+        >>> obj.undo_log
+        >>> obj.set_back_up_data()
+        >>> obj.set_data([[1, 0], [2, 10]])
+        >>> obj.add_graph_point(3, 3)
+        True
+        >>> obj.restore_data()
+        >>> obj.get_data() == previous_data
+        True
+        """
+        undo_log = self.undo_log or []
+        self.undo_log = None    #Taking back changes must not add to the log.
+
+        for fields in reversed(undo_log):
+            if fields[0] == "set":
+                index = self.find_x_index(fields[1])
+                if index == -1:
+                    self.add_graph_point(fields[1], fields[2])
+                else:
+                    self.set_y_value(index, fields[2])
+            elif fields[0] == "del":
+                self.remove_graph_point(fields[1])
+            elif fields[0] == "rows":
+                self.insert_rows(fields[1], fields[2])
+            elif fields[0] == "delrange":
+                self.remove_x_range(fields[1], fields[2])
+            elif fields[0] == "xtitle":
+                self.set_x_axis_title(fields[1])
+            elif fields[0] == "ytitle":
+                self.set_y_axis_title(fields[1])
+            elif fields[0] == "columns":
+                self.set_columns(fields[1], fields[2], copy=False)
+
+    def discard_back_up_data(self):
+        """Confirms the edit session by dropping self.undo_log.
+        >>> obj = Tracker()
+        >>> obj.set_back_up_data()
+        >>> obj.add_graph_point(1, 2)
+        True
+        >>> obj.discard_back_up_data()
+        >>> obj.undo_log, obj.get_data()
+        (None, [[1.0, 2.0]])
+        """
+        self.undo_log = None
+
+    def check_for_x_repeats(self, value_to_search):
+        """Finds if there is any repeats with the x value
+        that the user is trying to add to the list.
+        >>> obj = Tracker()
+        >>> obj.set_data([[2, 5], [3, 1], [6, 5]])
+        >>> obj.check_for_x_repeats(2)
+        True
+        >>> obj.set_data([[0, 1], [5, 3], [2, 8]])
+        >>> obj.check_for_x_repeats(10)
+        False
+        >>> obj.set_data([[]])
+        >>> obj.check_for_x_repeats(0)
+        False
+        """
+        return self.find_x_index(value_to_search) != -1
+    
+    def replace_y_value(self, x_value, y_value):
+        """Replaces y value using the x value as a
+        key.
+        >>> obj = Tracker()
+        >>> obj.set_data([[2, 6], [5, 10], [6, 20]])
+        >>> obj.replace_y_value(5, 2)
+        >>> obj.get_data()
+        [[2.0, 6.0], [5.0, 2.0], [6.0, 20.0]]
+        >>> obj.set_data([[4, 10], [19, 1], [10, 9]])
+        >>> obj.replace_y_value(10, 9)
+        >>> obj.get_data()
+        [[4.0, 10.0], [10.0, 9.0], [19.0, 1.0]]
+        >>> previous_data = obj.get_data()
+        >>> obj.replace_y_value(4, 10)
+        >>> new_data = obj.get_data()
+        >>> previous_data is new_data
+        False
+        >>> previous_data[0] is new_data[0]
+        False
+        >>> obj.set_data([[]])
+        >>> obj.replace_y_value(9, 10)
+        >>> obj.get_data()
+        []
+        """
+        index = self.find_x_index(x_value)
+        if index != -1:
+            self.set_y_value(index, y_value)
+    
+    def sort_tracker_data(self):
+        """Sorts tracker data according to its x value. Since
+        the data is kept sorted this only does a linear check unless
+        the columns were changed directly. Sorted columns replace the
+        old ones through set_columns, so the change is counted and the
+        pyramid is dropped.
+        >>> obj = Tracker()
+        >>> obj.set_data([[45, 10], [10, 20], [20, 100]])
+        >>> obj.sort_tracker_data()
+        >>> obj.get_data()
+        [[10.0, 20.0], [20.0, 100.0], [45.0, 10.0]]
+        >>> obj.set_data([[]])
+        >>> obj.sort_tracker_data()
+        >>> obj.get_data()
+        []
+        >>> obj.set_data([[-10, 90], [-5, 10], [-15, 20]])
+        >>> obj.sort_tracker_data()
+        >>> obj.get_data()
+        [[-15.0, 20.0], [-10.0, 90.0], [-5.0, 10.0]]
+        >>> previous_list = obj.get_data()
+        >>> obj.sort_tracker_data()
+        >>> new_list = obj.get_data()
+        >>> previous_list is new_list
+        False
+        >>> previous_list[0] is new_list[0]
+        False
+        >>> _ = obj.get_pyramid()
+        >>> obj.mark_saved()
+        >>> obj.x_values = array('d', [3, 1, 2])
+        >>> obj.y_values = array('d', [30, 10, 20])
+        >>> obj.sort_tracker_data()
+        >>> obj.get_data(), obj.is_dirty(), obj.pyramid
+        ([[1.0, 10.0], [2.0, 20.0], [3.0, 30.0]], True, None)
+        """
+        x_values, y_values = self.sort_columns(self.x_values, self.y_values)
+        if x_values is not self.x_values:
+            self.set_columns(x_values, y_values, copy=False)
+
+    @staticmethod
+    def sort_columns(x_values, y_values):
+        """Returns the x and y columns sorted by x, or the same columns
+        if they already are.
+        >>> Tracker.sort_columns(array('d', [2, 1]), array('d', [20, 10]))
+        (array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        """
+        if all(x_values[index] <= x_values[index + 1] for index in range(len(x_values) - 1)):
+            return x_values, y_values
+        order = sorted(range(len(x_values)), key=x_values.__getitem__)
+        return array('d', (x_values[index] for index in order)), array('d', (y_values[index] for index in order))
+
+class TrackerTextParser:
+    """Class TrackerTextParser turns the point lines of a text tracker
+    file, one "x y" pair per line, into x and y columns. Text where every
+    line is two numbers separated by one space, like the files written by
+    TrackerFile, is converted in a single pass: a few checks over the whole
+    buffer prove every line has that shape, then the buffer is split at once
+    and all the numbers go through one map(float) into an array. Any other
+    text is parsed one line at a time, allowing blank lines, comments (from
+    COMMENT to the end of the line) and CRLF line endings. Lines that are
+    not two numbers are skipped and their line numbers kept in
+    self.invalid_lines instead of stopping the parse.
+    """
+    COMMENT = b"#"
+    NOT_SEPARATORS = bytes(byte for byte in range(256) if byte not in b" \n")
+    OTHER_CHARACTERS = (b"\t", b"\r", b"\x0b", b"\x0c", COMMENT)
+
+    def __init__(self):
+        """Initializes a parser with no invalid lines.
+        >>> TrackerTextParser().invalid_lines
+        []
+        """
+        self.invalid_lines = []
+
+    def parse(self, contents, first_line_number=1):
+        """Returns the x and y columns of the points in contents, bytes
+        or a string. first_line_number is the line number of the first
+        line of contents, used for self.invalid_lines.
+        >>> obj = TrackerTextParser()
+        >>> obj.parse(b'1 10\\n2 20\\n')
+        (array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        >>> obj.parse('# Steps\\r\\n1 10\\r\\n\\r\\n2 abc\\r\\n3 30 # Sunday\\r\\n4\\r\\n', 3)
+        (array('d', [1.0, 3.0]), array('d', [10.0, 30.0]))
+        >>> obj.invalid_lines
+        [6, 8]
+        """
+        if isinstance(contents, str):
+            contents = contents.encode('utf-8')
+        if b"\r\n" in contents:
+            contents = contents.replace(b"\r\n", b"\n")
+        values = self.parse_fast(contents)
+        if values is None:
+            return self.parse_lines(contents, first_line_number)
+        return values[0::2], values[1::2]
+
+    def parse_fast(self, contents):
+        """Returns all the numbers of contents in a single array if every
+        line is two numbers separated by one space, or None otherwise.
+        >>> TrackerTextParser().parse_fast(b'1 10\\n2 20')
+        array('d', [1.0, 10.0, 2.0, 20.0])
+        >>> TrackerTextParser().parse_fast(b'1 10 2\\n20\\n')
+        """
+        if any(character in contents for character in self.OTHER_CHARACTERS):
+            return None
+        separators = contents.translate(None, self.NOT_SEPARATORS)
+        if not contents.endswith(b"\n"):
+            separators += b"\n"
+        line_count = len(separators) // 2
+        if line_count == 0 or separators != b" \n" * line_count:   #One space in every line.
+            return None
+
+        try:
+            values = array('d', map(float, contents.split()))
+        except ValueError:
+            return None
+        return values if len(values) == 2 * line_count else None   #No space at either end of a line.
+
+    def parse_lines(self, contents, first_line_number=1):
+        """Returns the x and y columns of the points in contents, parsing
+        one line at a time and keeping the numbers of the lines that are
+        not points in self.invalid_lines.
+        """
+        x_values = array('d')
+        y_values = array('d')
+
+        for line_number, file_line in enumerate(contents.split(b"\n"), first_line_number):
+            values = file_line.split(self.COMMENT, 1)[0].split()
+            if not values:
+                continue
+            try:
+                if len(values) != 2:
+                    raise ValueError
+                x_value = float(values[0])
+                y_value = float(values[1])
+            except ValueError:
+                self.invalid_lines.append(line_number)
+                continue
+            x_values.append(x_value)
+            y_values.append(y_value)
+        return x_values, y_values
+
+class TrackerFile:
+    """Class TrackerFile groups the methods that read and write
+    the files stored in tracker_info. The text format starts with a
+    checksum line (CHECKSUM_PREFIX and the CRC-32 of the rest of the file
+    in hexadecimal), then has the x axis title in the next line, the y axis
+    title in the line after it and then one "x y" line per point.
+    The binary format starts with a header (BINARY_MAGIC, number of points,
+    the length of both titles and the CRC-32 of the rest of the file),
+    followed by the UTF-8 titles, padding up to a multiple of 8 bytes, and
+    then the x and y columns packed as little-endian float64. Binary files
+    are memory-mapped when they are read, so the columns are used without
+    parsing or copying them.
+    Files are written to a temporary file that is flushed to the disk and
+    then renamed over the old file, so a crash or a full disk never leaves
+    a half written tracker file. Reading a file checks its checksum and
+    raises a ValueError if it does not match. Text files without a checksum
+    line and OLD_BINARY_MAGIC files, written before checksums were added,
+    are still read.
+    """
+    TEXT_FORMAT = "text"
+    BINARY_FORMAT = "binary"
+    BINARY_MAGIC = b"ITRACKB2"
+    BINARY_HEADER = struct.Struct("<8sQIII")
+    OLD_BINARY_MAGIC = b"ITRACKB1"
+    OLD_BINARY_HEADER = struct.Struct("<8sQII")
+    CHECKSUM_PREFIX = b"#crc32 "
+    CHECKSUM_LINE_SIZE = len(CHECKSUM_PREFIX) + 9
+    TAIL_SIZE = 4096
+    READ_SIZE = 1 << 20
+    TEMP_SUFFIX = ".tmp"
+    verified_files = {}     #Binary files whose body matched its checksum, with the identity they had then.
+
+    @classmethod
+    def detect_format(cls, file_path):
+        """Returns BINARY_FORMAT if the file starts with
+        BINARY_MAGIC (or OLD_BINARY_MAGIC) and TEXT_FORMAT otherwise.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [], [])
+        >>> TrackerFile.detect_format(file_path)
+        'text'
+        >>> _ = TrackerFile.write_binary(file_path, 'Day', 'Steps', [], [])
+        >>> TrackerFile.detect_format(file_path)
+        'binary'
+        """
+        with open(file_path, 'rb') as file_obj:
+            if file_obj.read(len(cls.BINARY_MAGIC)) in (cls.BINARY_MAGIC, cls.OLD_BINARY_MAGIC):
+                return cls.BINARY_FORMAT
+        return cls.TEXT_FORMAT
+
+    @classmethod
+    def unpack_binary_header(cls, file_buffer):
+        """Returns the size of the header, the number of points, the length
+        of both titles and the checksum (None in OLD_BINARY_MAGIC files) from
+        the start of a binary file in file_buffer, or None if file_buffer is
+        not the start of a binary file.
+        >>> header = TrackerFile.BINARY_HEADER.pack(TrackerFile.BINARY_MAGIC, 2, 3, 5, 7)
+        >>> TrackerFile.unpack_binary_header(header)
+        (28, 2, 3, 5, 7)
+        >>> TrackerFile.unpack_binary_header(b'Day')
+        """
+        for magic, header in ((cls.BINARY_MAGIC, cls.BINARY_HEADER), (cls.OLD_BINARY_MAGIC, cls.OLD_BINARY_HEADER)):
+            if len(file_buffer) >= header.size and file_buffer[:len(magic)] == magic:
+                fields = header.unpack_from(file_buffer, 0)
+                return (header.size,) + fields[1:4] + (fields[4] if len(fields) > 4 else None,)
+        return None
+
+    @classmethod
+    def get_checksum_line(cls, checksum):
+        """Returns the first line of a text file whose other
+        lines have the given checksum.
+        >>> TrackerFile.get_checksum_line(255)
+        b'#crc32 000000ff\\n'
+        """
+        return cls.CHECKSUM_PREFIX + b"%08x\n" % checksum
+
+    @classmethod
+    def read_checksum_line(cls, file_line):
+        """Returns the checksum stored in file_line, the first line of
+        a text file, or None if it is not a checksum line.
+        >>> TrackerFile.read_checksum_line(b'#crc32 000000ff\\n'), TrackerFile.read_checksum_line(b'Day\\n')
+        (255, None)
+        """
+        if len(file_line) != cls.CHECKSUM_LINE_SIZE or not file_line.startswith(cls.CHECKSUM_PREFIX):
+            return None
+        try:
+            return int(file_line[len(cls.CHECKSUM_PREFIX):-1], 16)
+        except ValueError:
+            return None
+
+    @classmethod
+    def has_checksum(cls, file_path):
+        """Returns True if the text file in file_path starts with a
+        checksum line, that is, it was written by TrackerFile and so
+        its points are sorted by x.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerFile.has_checksum(file_path)
+        True
+        >>> with open(file_path, 'wb') as file_obj:
+        ...     _ = file_obj.write(b'Day\\nSteps\\n1.0 2.0\\n')
+        >>> TrackerFile.has_checksum(file_path)
+        False
+        """
+        with open(file_path, 'rb') as file_obj:
+            return cls.read_checksum_line(file_obj.read(cls.CHECKSUM_LINE_SIZE)) is not None
+
+    @classmethod
+    def strip_checksum(cls, contents, file_path):
+        """Returns the contents of a text file without its checksum line,
+        after checking the rest of contents matches it. Raises a ValueError
+        if it does not. Contents without a checksum line are returned as they are.
+        >>> contents = TrackerFile.get_checksum_line(crc32(b'Day\\n')) + b'Day\\n'
+        >>> TrackerFile.strip_checksum(contents, 'Steps')
+        b'Day\\n'
+        >>> TrackerFile.strip_checksum(contents[:-1], 'Steps')
+        Traceback (most recent call last):
+        ...
+        ValueError: Steps does not match its checksum
+        """
+        checksum = cls.read_checksum_line(contents[:cls.CHECKSUM_LINE_SIZE])
+        if checksum is None:
+            return contents
+        body = contents[cls.CHECKSUM_LINE_SIZE:]
+        if crc32(body) != checksum:
+            raise ValueError(f"{file_path} does not match its checksum")
+        return body
+
+    @classmethod
+    def verify(cls, file_path):
+        """Returns False if the checksum of a tracker file does not match
+        its contents or the file cannot be read. The file is only read
+        through, without parsing its points. Files without a checksum
+        are only checked when they are read.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerFile.verify(file_path)
+        True
+        >>> with open(file_path, 'r+b') as file_obj:
+        ...     _ = file_obj.seek(-2, 2)
+        ...     _ = file_obj.write(b'5')
+        >>> TrackerFile.verify(file_path)
+        False
+        >>> _ = TrackerFile.write_binary(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerFile.verify(file_path)
+        True
+        """
+        try:
+            with open(file_path, 'rb') as file_obj:
+                header = file_obj.read(cls.BINARY_HEADER.size)
+                binary_header = cls.unpack_binary_header(header)
+                if binary_header is not None:
+                    header_size, point_count, x_title_length, y_title_length, checksum = binary_header
+                    file_size = file_obj.seek(0, 2)
+                    columns_offset = header_size + x_title_length + y_title_length
+                    columns_offset += -columns_offset % 8
+                    if file_size < columns_offset + 16 * point_count:
+                        return False
+                    file_obj.seek(header_size)
+                else:
+                    checksum = cls.read_checksum_line(header[:cls.CHECKSUM_LINE_SIZE])
+                    file_obj.seek(cls.CHECKSUM_LINE_SIZE)
+                if checksum is None:
+                    return True
+
+                file_identity = cls.get_file_identity(file_obj.fileno())
+                contents_checksum = 0
+                for file_chunk in iter(lambda: file_obj.read(cls.READ_SIZE), b""):
+                    contents_checksum = crc32(file_chunk, contents_checksum)
+                if contents_checksum != checksum:
+                    return False
+                if binary_header is not None:
+                    cls.verified_files[file_path] = file_identity
+                return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def get_file_identity(file):
+        """Returns what identifies the contents of file (a path or an
+        open file descriptor): its device, inode, size and modification
+        time. Replacing or changing the file changes its identity.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_binary(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> identity = TrackerFile.get_file_identity(file_path)
+        >>> _ = TrackerFile.write_atomic(file_path, TrackerFile.BINARY_FORMAT, 'Day', 'Steps', [1.0], [3.0])
+        >>> identity == TrackerFile.get_file_identity(file_path)
+        False
+        """
+        file_stat = os.stat(file)
+        return file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns
+
+    @classmethod
+    def read_header(cls, file_path):
+        """Reads only the format and the axis titles of a tracker file,
+        without reading any of its points.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerFile.read_header(file_path)
+        ('text', 'Day', 'Steps')
+        >>> _ = TrackerFile.write_binary(file_path, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerFile.read_header(file_path)
+        ('binary', 'Day', 'Steps')
+        """
+        with open(file_path, 'rb') as file_obj:
+            binary_header = cls.unpack_binary_header(file_obj.read(cls.BINARY_HEADER.size))
+            if binary_header is not None:
+                header_size, point_count, x_title_length, y_title_length, checksum = binary_header
+                file_obj.seek(header_size)
+                titles = file_obj.read(x_title_length + y_title_length).decode('utf-8')
+                return cls.BINARY_FORMAT, titles[:x_title_length], titles[x_title_length:]
+
+            file_obj.seek(0)
+            if cls.read_checksum_line(file_obj.readline()) is None:
+                file_obj.seek(0)
+            x_axis_title = file_obj.readline().decode('utf-8').rstrip('\r\n')
+            y_axis_title = file_obj.readline().decode('utf-8').rstrip('\r\n')
+        return cls.TEXT_FORMAT, x_axis_title, y_axis_title
+
+    @classmethod
+    def read(cls, file_path, parser=None):
+        """Reads a tracker file in any format. Returns a tuple with
+        the format of the file, the x and y axis titles and the x and y columns.
+        Text files are parsed by parser (see read_text).
+        """
+        if cls.detect_format(file_path) == cls.BINARY_FORMAT:
+            return (cls.BINARY_FORMAT,) + cls.read_binary(file_path)
+        return (cls.TEXT_FORMAT,) + cls.read_text(file_path, parser)
+
+    @classmethod
+    def write(cls, file_path, file_format, x_axis_title, y_axis_title, x_values, y_values):
+        """Writes a tracker file in the given format and returns
+        the number of bytes written.
+        """
+        if file_format == cls.BINARY_FORMAT:
+            return cls.write_binary(file_path, x_axis_title, y_axis_title, x_values, y_values)
+        return cls.write_text(file_path, x_axis_title, y_axis_title, x_values, y_values)
+
+    @classmethod
+    def read_text(cls, file_path, parser=None):
+        """Reads a tracker file in text format. Returns the x and y
+        axis titles and the x and y columns. The points are parsed by
+        parser, a TrackerTextParser, so lines that are not points are
+        skipped and their numbers kept in parser.invalid_lines.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0, 2.0], [10.0, 20.0])
+        >>> TrackerFile.read_text(file_path)
+        ('Day', 'Steps', array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        >>> with open(file_path, 'wb') as file_obj:
+        ...     _ = file_obj.write(b'Day\\r\\nSteps\\r\\n1 10\\r\\n2,20\\r\\n')
+        >>> parser = TrackerTextParser()
+        >>> TrackerFile.read_text(file_path, parser)
+        ('Day', 'Steps', array('d', [1.0]), array('d', [10.0]))
+        >>> parser.invalid_lines
+        [4]
+        """
+        with open(file_path, 'rb') as file_obj:
+            contents = file_obj.read()
+        body = cls.strip_checksum(contents, file_path)
+        first_line_number = 1 if len(body) == len(contents) else 2
+        file_lines = body.split(b"\n", 2)
+
+        x_axis_title = file_lines[0].decode('utf-8').rstrip('\r')
+        y_axis_title = file_lines[1].decode('utf-8').rstrip('\r') if len(file_lines) > 1 else ''
+        parser = TrackerTextParser() if parser is None else parser
+        x_values, y_values = parser.parse(file_lines[2] if len(file_lines) > 2 else b"", first_line_number + 2)
+        return x_axis_title, y_axis_title, x_values, y_values
+
+    @classmethod
+    def read_binary(cls, file_path):
+        """Memory-maps a tracker file in binary format. Returns the x and
+        y axis titles and the x and y columns as read-only memoryviews of the
+        mapped file, so nothing is parsed or copied.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> TrackerFile.write_binary(file_path, 'Day', 'Steps', [1.0, 2.0], [10.0, 20.0])
+        72
+        >>> x_axis_title, y_axis_title, x_values, y_values = TrackerFile.read_binary(file_path)
+        >>> x_axis_title, y_axis_title
+        ('Day', 'Steps')
+        >>> x_values.tolist(), y_values.tolist()
+        ([1.0, 2.0], [10.0, 20.0])
+        >>> x_values.readonly
+        True
+
+        The body of a file is only checked against its checksum the first
+        time it is read (or verified) while it has the same identity, so
+        opening it again does not touch every page of the mapping.
+        >>> TrackerFile.verified_files.get(file_path) == TrackerFile.get_file_identity(file_path)
+        True
+        """
+        with open(file_path, 'rb') as file_obj:
+            file_identity = cls.get_file_identity(file_obj.fileno())
+            mapped_file = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        binary_header = cls.unpack_binary_header(mapped_file[:cls.BINARY_HEADER.size])
+        if binary_header is None:
+            raise ValueError(f"{file_path} is not a binary tracker file")
+        header_size, point_count, x_title_length, y_title_length, checksum = binary_header
+
+        offset = header_size
+        x_axis_title = mapped_file[offset:offset + x_title_length].decode('utf-8')
+        offset += x_title_length
+        y_axis_title = mapped_file[offset:offset + y_title_length].decode('utf-8')
+        offset += y_title_length
+        offset += -offset % 8   #Columns start at a multiple of 8 bytes.
+        column_size = point_count * 8
+        if len(mapped_file) < offset + 2 * column_size:
+            raise ValueError(f"{file_path} is truncated")
+
+        file_buffer = memoryview(mapped_file)
+        if checksum is not None and cls.verified_files.get(file_path) != file_identity:
+            if crc32(file_buffer[header_size:]) != checksum:
+                raise ValueError(f"{file_path} does not match its checksum")
+            cls.verified_files[file_path] = file_identity
+        x_values = file_buffer[offset:offset + column_size].cast('d')
+        y_values = file_buffer[offset + column_size:offset + 2 * column_size].cast('d')
+        if byteorder == 'big':  #The file is little-endian, so the columns have to be copied and swapped.
+            x_values, y_values = Tracker.to_column(x_values), Tracker.to_column(y_values)
+            x_values.byteswap()
+            y_values.byteswap()
+        return x_axis_title, y_axis_title, x_values, y_values
+
+    @classmethod
+    def write_binary(cls, file_path, x_axis_title, y_axis_title, x_values, y_values):
+        """Writes a tracker file in binary format and returns
+        the number of bytes written.
+        """
+        x_title = x_axis_title.encode('utf-8')
+        y_title = y_axis_title.encode('utf-8')
+        header_size = cls.BINARY_HEADER.size + len(x_title) + len(y_title)
+        x_column = Tracker.to_column(x_values) if byteorder == 'big' or not isinstance(x_values, (array, memoryview)) else x_values
+        y_column = Tracker.to_column(y_values) if byteorder == 'big' or not isinstance(y_values, (array, memoryview)) else y_values
+        if byteorder == 'big':
+            x_column.byteswap()
+            y_column.byteswap()
+        titles = x_title + y_title + bytes(-header_size % 8)
+        checksum = crc32(y_column, crc32(x_column, crc32(titles)))
+
+        with open(file_path, 'wb') as file:
+            file.write(cls.BINARY_HEADER.pack(cls.BINARY_MAGIC, len(x_column), len(x_title), len(y_title), checksum))
+            file.write(titles)
+            file.write(x_column)
+            file.write(y_column)
+            return file.tell()
+
+    @classmethod
+    def convert(cls, file_path, file_format):
+        """Rewrites the tracker file in file_path in the given format.
+        The new file is written next to the old one and then replaces it.
+        Returns the number of bytes written.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0, 2.0], [10.0, 20.0])
+        >>> TrackerFile.convert(file_path, TrackerFile.BINARY_FORMAT)
+        72
+        >>> TrackerFile.read(file_path)[0]
+        'binary'
+        >>> _ = TrackerFile.convert(file_path, TrackerFile.TEXT_FORMAT)
+        >>> TrackerFile.read(file_path)
+        ('text', 'Day', 'Steps', array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        """
+        old_format, x_axis_title, y_axis_title, x_values, y_values = cls.read(file_path)
+        x_values, y_values = Tracker.to_column(x_values), Tracker.to_column(y_values)   #Releases the mapped file before it is replaced.
+        return cls.write_atomic(file_path, file_format, x_axis_title, y_axis_title, x_values, y_values)
+
+    @classmethod
+    def write_atomic(cls, file_path, file_format, x_axis_title, y_axis_title, x_values, y_values):
+        """Writes a tracker file to a temporary file in the journal
+        directory and then renames it over file_path, so a crash never
+        leaves a half written tracker file. Returns the number of bytes written.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> TrackerFile.write_atomic(file_path, TrackerFile.TEXT_FORMAT, 'Day', 'Steps', [1.0], [2.0])
+        34
+        >>> TrackerFile.read(file_path)
+        ('text', 'Day', 'Steps', array('d', [1.0]), array('d', [2.0]))
+        """
+        temp_path = cls.get_temp_path(file_path)
+        try:
+            bytes_written = cls.write(temp_path, file_format, x_axis_title, y_axis_title, x_values, y_values)
+        except BaseException:
+            cls.remove_temp_file(temp_path)
+            raise
+        cls.replace_synced(temp_path, file_path)
+        return bytes_written
+
+    @classmethod
+    def get_temp_path(cls, file_path):
+        """Returns the path of the temporary file used to replace
+        file_path, in the journal directory next to it, and creates
+        that directory if needed.
+        >>> from tempfile import mkdtemp
+        >>> temp_path = TrackerFile.get_temp_path(path.join(mkdtemp(), 'Steps'))
+        >>> path.basename(temp_path), path.isdir(path.dirname(temp_path))
+        ('Steps.tmp', True)
+        """
+        temp_dir = path.join(path.dirname(file_path), TrackerJournal.JOURNAL_DIR_NAME)
+        makedirs(temp_dir, exist_ok=True)
+        return path.join(temp_dir, path.basename(file_path) + cls.TEMP_SUFFIX)
+
+    @staticmethod
+    def remove_temp_file(temp_path):
+        """Removes a temporary file left by a write that failed.
+        """
+        if path.exists(temp_path):
+            remove(temp_path)
+
+    @staticmethod
+    def replace_synced(temp_path, file_path):
+        """Flushes temp_path to the disk, renames it over file_path and
+        flushes the directory, so after a crash file_path is either the
+        old file or the complete new one.
+        >>> from tempfile import mkdtemp
+        >>> directory = mkdtemp()
+        >>> with open(path.join(directory, 'new'), 'w') as file_obj:
+        ...     _ = file_obj.write('Day')
+        >>> TrackerFile.replace_synced(path.join(directory, 'new'), path.join(directory, 'Steps'))
+        >>> open(path.join(directory, 'Steps')).read()
+        'Day'
+        """
+        with open(temp_path, 'rb+') as file_obj:
+            os.fsync(file_obj.fileno())
+        replace(temp_path, file_path)
+        if hasattr(os, 'O_DIRECTORY'):  #Directories cannot be opened on Windows.
+            directory = os.open(path.dirname(path.abspath(file_path)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    @classmethod
+    def append_text(cls, file_path, x_values, y_values):
+        """Adds points at the end of a tracker file in text format. The
+        file is copied with the new lines to a temporary file that is then
+        renamed over file_path, like write_atomic, but the points already in
+        the file are copied as they are instead of being parsed and written
+        again. The checksum of the file is checked while it is copied, and
+        a ValueError is raised if it does not match. The points must be sorted
+        and come after the last point of the file. Returns the number of
+        bytes of the new file.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0], [10.0])
+        >>> TrackerFile.append_text(file_path, [2.0, 3.0], [20.0, 30.0])
+        53
+        >>> TrackerFile.read(file_path)
+        ('text', 'Day', 'Steps', array('d', [1.0, 2.0, 3.0]), array('d', [10.0, 20.0, 30.0]))
+        """
+        temp_path = cls.get_temp_path(file_path)
+
+        try:
+            with open(file_path, 'rb') as source, open(temp_path, 'wb') as file:
+                old_checksum = cls.read_checksum_line(source.read(cls.CHECKSUM_LINE_SIZE))
+                if old_checksum is None:
+                    source.seek(0)
+                file.write(cls.get_checksum_line(0))
+                checksum = 0
+                last_byte = b"\n"
+                for file_chunk in iter(lambda: source.read(cls.READ_SIZE), b""):
+                    checksum = crc32(file_chunk, checksum)
+                    file.write(file_chunk)
+                    last_byte = file_chunk[-1:]
+                if old_checksum is not None and checksum != old_checksum:
+                    raise ValueError(f"{file_path} does not match its checksum")
+                if last_byte != b"\n":
+                    checksum = crc32(b"\n", checksum)
+                    file.write(b"\n")
+                for file_chunk in cls.get_text_chunks(x_values, y_values):
+                    checksum = crc32(file_chunk, checksum)
+                    file.write(file_chunk)
+                bytes_written = file.tell()
+                file.seek(0)
+                file.write(cls.get_checksum_line(checksum))
+        except BaseException:
+            cls.remove_temp_file(temp_path)
+            raise
+        cls.replace_synced(temp_path, file_path)
+        return bytes_written
+
+    @classmethod
+    def read_last_x(cls, file_path):
+        """Returns the x value of the last point of a tracker file, or None
+        if it has no points. Only the last TAIL_SIZE bytes of a big text
+        file are read, so the file must be sorted by x for this to be its
+        largest x value (see has_checksum).
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [], [])
+        >>> TrackerFile.read_last_x(file_path)
+        >>> _ = TrackerFile.write_text(file_path, 'Day', 'Steps', range(1000), range(1000))
+        >>> TrackerFile.read_last_x(file_path)
+        999.0
+        >>> _ = TrackerFile.convert(file_path, TrackerFile.BINARY_FORMAT)
+        >>> TrackerFile.read_last_x(file_path)
+        999.0
+
+        If the last line is not a point, the whole file is read instead.
+        >>> with open(file_path, 'wb') as file_obj:
+        ...     _ = file_obj.write(b'Day Steps\\n')
+        ...     _ = file_obj.writelines(b'%d %d\\n' % (x, x) for x in range(1000))
+        ...     _ = file_obj.write(b'4\\n')
+        >>> TrackerFile.read_last_x(file_path)
+        999.0
+        """
+        if cls.detect_format(file_path) == cls.BINARY_FORMAT:
+            x_values = cls.read_binary(file_path)[2]
+            return x_values[len(x_values) - 1] if len(x_values) > 0 else None
+
+        with open(file_path, 'rb') as file_obj:
+            file_size = file_obj.seek(0, 2)
+            if file_size > cls.TAIL_SIZE:
+                file_obj.seek(file_size - cls.TAIL_SIZE)
+                file_tail = file_obj.read().rstrip()
+                if b"\n" in file_tail:    #The last line is whole.
+                    last_values = file_tail.rsplit(b"\n", 1)[1].split()
+                    try:
+                        if len(last_values) == 2:
+                            float(last_values[1])
+                            return float(last_values[0])
+                    except ValueError:
+                        pass
+        x_values = cls.read_text(file_path)[2]
+        return x_values[-1] if len(x_values) > 0 else None
+
+    @staticmethod
+    def get_text_chunks(x_values, y_values):
+        """Yields the "x y" lines of the given points, encoded,
+        TrackerExporter.CHUNK_SIZE points at a time.
+        >>> list(TrackerFile.get_text_chunks([1.0, 2.0], [10.0, 20.0]))
+        [b'1.0 10.0\\n2.0 20.0\\n']
+        """
+        for start in range(0, len(x_values), TrackerExporter.CHUNK_SIZE):
+            stop = start + TrackerExporter.CHUNK_SIZE
+            yield "".join(f"{x_value} {y_value}\n" for x_value, y_value in
+                zip(x_values[start:stop], y_values[start:stop])).encode()
+
+    @classmethod
+    def write_text(cls, file_path, x_axis_title, y_axis_title, x_values, y_values):
+        """Writes a tracker file in text format and returns
+        the number of bytes written.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> TrackerFile.write_text(file_path, 'Day', 'Steps', [1.0, 2.0], [10.0, 20.0])
+        44
+        >>> print(open(file_path).read(), end='')
+        #crc32 5f22584a
+        Day
+        Steps
+        1.0 10.0
+        2.0 20.0
+        """
+        with open(file_path, 'wb') as file:
+            file.write(cls.get_checksum_line(0))
+            titles = f"{x_axis_title}\n{y_axis_title}\n".encode('utf-8')
+            checksum = crc32(titles)
+            file.write(titles)
+            for file_chunk in cls.get_text_chunks(x_values, y_values):
+                checksum = crc32(file_chunk, checksum)
+                file.write(file_chunk)
+            bytes_written = file.tell()
+            file.seek(0)
+            file.write(cls.get_checksum_line(checksum))
+            return bytes_written
+
+class TrackerSaveWorker:
+    """Class TrackerSaveWorker writes tracker files in a dedicated thread,
+    so the user interface only has to take a snapshot of a tracker and
+    never waits for the disk. Snapshots are queued with submit(). If a file
+    is queued again before it was written, only the newest snapshot is kept.
+    At most max_queued files wait in the queue; submit() blocks while it is full.
+    Every file is written with TrackerFile.write_atomic.
+    """
+    MAX_QUEUED = 64
+
+    def __init__(self, max_queued=None):
+        """Initializes the worker and starts its thread.
+        >>> obj = TrackerSaveWorker(2)
+        >>> obj.max_queued, obj.files_written, obj.bytes_written, obj.errors
+        (2, 0, 0, [])
+        >>> obj.thread.is_alive()
+        True
+        """
+        self.max_queued = self.MAX_QUEUED if max_queued is None else max_queued
+        self.pending = OrderedDict()
+        self.file_in_progress = None
+        self.condition = Condition()
+        self.files_written = 0
+        self.bytes_written = 0
+        self.errors = []
+        self.thread = Thread(target=self.run, name="TrackerSaveWorker", daemon=True)
+
+        self.thread.start()
+
+    def submit(self, file_path, snapshot, on_saved=None):
+        """Queues snapshot to be written in file_path. snapshot is a tuple
+        with the file format, the x and y axis titles and the x and y columns.
+        on_saved is called from the worker thread once the file was written.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'Steps')
+        >>> obj = TrackerSaveWorker()
+        >>> obj.submit(file_path, ('text', 'Day', 'Steps', array('d', [1]), array('d', [2])))
+        >>> obj.submit(file_path, ('text', 'Day', 'Steps', array('d', [1]), array('d', [3])))
+        >>> obj.flush(10)
+        True
+        >>> TrackerFile.read(file_path)[4]
+        array('d', [3.0])
+        """
+        with self.condition:
+            if file_path in self.pending:
+                callbacks = self.pending[file_path][1]
+            else:
+                while len(self.pending) >= self.max_queued:
+                    self.condition.wait()
+                callbacks = []
+            if on_saved is not None:
+                callbacks.append(on_saved)
+            self.pending[file_path] = (snapshot, callbacks)
+            self.condition.notify_all()
+
+    def run(self):
+        """Writes the queued snapshots one at a time, oldest first.
+        Errors, raised by the write or by a callback, are stored in
+        self.errors instead of stopping the worker.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerSaveWorker()
+        >>> def fail():
+        ...     raise RuntimeError('callback failed')
+        >>> obj.submit(path.join(mkdtemp(), 'Steps'), ('text', 'Day', 'Steps', [1.0], [2.0]), fail)
+        >>> obj.flush(10)
+        True
+        >>> [type(error).__name__ for file_path, error in obj.errors], obj.thread.is_alive()
+        (['RuntimeError'], True)
+        """
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                file_path, (snapshot, callbacks) = self.pending.popitem(last=False)
+                self.file_in_progress = file_path
+                self.condition.notify_all()
+
+            bytes_written = None
+            try:
+                bytes_written = TrackerFile.write_atomic(file_path, *snapshot)
+                for callback in callbacks:
+                    callback()
+            except Exception as error:
+                with self.condition:
+                    self.errors.append((file_path, error))
+            finally:
+                with self.condition:
+                    if bytes_written is not None:
+                        self.files_written += 1
+                        self.bytes_written += bytes_written
+                    self.file_in_progress = None
+                    self.condition.notify_all()
+
+    def is_pending(self, file_path):
+        """Returns True if file_path is queued or being written.
+        >>> TrackerSaveWorker().is_pending('Steps')
+        False
+        """
+        with self.condition:
+            return file_path in self.pending or self.file_in_progress == file_path
+
+    def wait_for(self, file_path, timeout=None):
+        """Waits until file_path is written. Returns False if
+        timeout seconds passed first.
+        >>> TrackerSaveWorker().wait_for('Steps', 1)
+        True
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: file_path not in self.pending and
+                self.file_in_progress != file_path, timeout)
+
+    def flush(self, timeout=None):
+        """Waits until every queued file is written. Returns False if
+        timeout seconds passed first.
+        >>> TrackerSaveWorker().flush(1)
+        True
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and self.file_in_progress is None, timeout)
+
+class TrackerJournal:
+    """Class TrackerJournal writes every change made to a tracker
+    to an append-only journal file as soon as it happens, so nothing
+    is lost if the application crashes. The journal lives in
+    tracker_info/.journal next to the tracker file (the base file),
+    which keeps the usual text format. Once the journal grows past
+    COMPACT_THRESHOLD entries it is compacted: a snapshot of the tracker
+    is written as the new base file by a TrackerSaveWorker and the old
+    journal is discarded.
+    Journal entries only describe the final state of a point or a title
+    ("set x y", "del x", "xtitle t", "ytitle t"), so replaying entries that
+    are already part of the base file does not change the result.
+    """
+    JOURNAL_DIR_NAME = ".journal"
+    COMPACT_THRESHOLD = 1000
+
+    def __init__(self, tracker_info_dir, tracker, save_worker=None):
+        """Initializes a journal for tracker, stored inside
+        the directory tracker_info_dir. Compactions are written by
+        save_worker, or right away if it is None. The journal directory
+        is only created when the first entry is recorded, so reading
+        a tracker does not change the directory.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> obj.name
+        'Steps'
+        >>> obj.entries
+        0
+        >>> path.isdir(obj.journal_dir)
+        False
+        """
+        self.tracker_info_dir = tracker_info_dir
+        self.journal_dir = path.join(tracker_info_dir, self.JOURNAL_DIR_NAME)
+        self.tracker = tracker
+        self.name = tracker.get_name()
+        self.entries = 0
+        self.journal_file = None
+        self.save_worker = save_worker
+
+        tracker.file_path = self.get_base_path()
+
+    def get_base_path(self, name=None):
+        """Returns the path of the tracker file.
+        >>> obj = TrackerJournal.__new__(TrackerJournal)
+        >>> obj.tracker_info_dir, obj.name = 'dir', 'Steps'
+        >>> obj.get_base_path() == path.join('dir', 'Steps')
+        True
+        """
+        return path.join(self.tracker_info_dir, self.name if name is None else name)
+
+    def get_journal_path(self, name=None):
+        """Returns the path of the journal file.
+        >>> obj = TrackerJournal.__new__(TrackerJournal)
+        >>> obj.journal_dir, obj.name = 'dir', 'Steps'
+        >>> obj.get_journal_path() == path.join('dir', 'Steps.log')
+        True
+        """
+        return path.join(self.journal_dir, (self.name if name is None else name) + ".log")
+
+    def get_old_journal_path(self, name=None):
+        """Returns the path where the journal is moved
+        while it is being compacted.
+        >>> obj = TrackerJournal.__new__(TrackerJournal)
+        >>> obj.journal_dir, obj.name = 'dir', 'Steps'
+        >>> obj.get_old_journal_path() == path.join('dir', 'Steps.log.old')
+        True
+        """
+        return self.get_journal_path(name) + ".old"
+
+    def record(self, *fields):
+        """Appends an entry to the journal and flushes it to
+        the file. Starts a compaction if the journal got too long.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> obj.record("set", 1.0, 2.0)
+        >>> obj.record("xtitle", "Day of the week")
+        >>> obj.entries
+        2
+        >>> obj.close()
+        >>> print(open(obj.get_journal_path()).read(), end='')
+        set 1.0 2.0
+        xtitle Day of the week
+        """
+        if self.journal_file is None:
+            makedirs(self.journal_dir, exist_ok=True)
+            self.journal_file = open(self.get_journal_path(), 'a')
+        self.journal_file.write(" ".join(str(field) for field in fields) + "\n")
+        self.journal_file.flush()
+        self.entries += 1
+
+        if self.entries >= self.COMPACT_THRESHOLD:
+            self.compact()
+
+    def apply_journal_file(self, file_path):
+        """Applies every entry of the journal file in file_path
+        to the tracker. The tracker must not have this journal attached
+        while this happens. Returns the number of entries applied. A truncated
+        last line (left by a crash in the middle of a write) is ignored.
+        """
+        tracker = self.tracker
+        entries = 0
+
+        if not path.exists(file_path):
+            return entries
+
+        with open(file_path, 'r') as file_obj:
+            for file_line in file_obj:
+                if not file_line.endswith("\n"):
+                    break
+                operation, _, value = file_line[:-1].partition(" ")
+                try:
+                    if operation == "set":
+                        x_value, y_value = (float(number) for number in value.split())
+                        index = tracker.find_x_index(x_value)
+                        if index == -1:
+                            tracker.add_graph_point(x_value, y_value)
+                        else:
+                            tracker.set_y_value(index, y_value)
+                    elif operation == "del":
+                        tracker.remove_graph_point(float(value))
+                    elif operation == "delrange":
+                        x_first, x_last = (float(number) for number in value.split())
+                        tracker.remove_x_range(x_first, x_last)
+                    elif operation == "xtitle":
+                        tracker.set_x_axis_title(value)
+                    elif operation == "ytitle":
+                        tracker.set_y_axis_title(value)
+                    else:
+                        continue
+                except ValueError:
+                    continue
+                entries += 1
+        return entries
+
+    def has_entries(self):
+        """Returns True if there is a journal file for the tracker,
+        that is, there are changes not compacted into the tracker file yet.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> obj.has_entries()
+        False
+        >>> obj.record("del", 1.0)
+        >>> obj.has_entries()
+        True
+        """
+        return path.exists(self.get_journal_path()) or path.exists(self.get_old_journal_path())
+
+    def replay(self):
+        """Applies the journal left by a previous session (including
+        one that was being compacted) to the tracker. Returns the number of
+        entries applied.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> tracker.set_data([[1, 1], [2, 2]])
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> makedirs(obj.journal_dir)
+        >>> with open(obj.get_journal_path(), 'w') as file_obj:
+        ...     _ = file_obj.write("set 3.0 3.0\\ndel 1.0\\nset 2.0 5.0\\nytitle Steps\\nset 4.0 4.0\\ndelrange 3.5 4.0\\n")
+        >>> obj.replay()
+        6
+        >>> tracker.get_data()
+        [[2.0, 5.0], [3.0, 3.0]]
+        >>> tracker.get_y_axis_title()
+        'Steps'
+        """
+        entries = self.apply_journal_file(self.get_old_journal_path())
+        entries += self.apply_journal_file(self.get_journal_path())
+        return entries
+
+    def compact(self, wait=False):
+        """Takes a snapshot of the tracker, moves the current journal
+        aside and queues the snapshot in the save worker to be written as
+        the new base file. If wait is True, this method returns once the
+        base file was written.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> tracker.set_journal(obj)
+        >>> tracker.add_graph_point(1, 2)
+        True
+        >>> obj.compact(wait=True)
+        >>> print(open(obj.get_base_path()).read(), end='')
+        #crc32 97b2688c
+        X-Axis
+        Y-Axis
+        1.0 2.0
+        >>> path.exists(obj.get_journal_path()) or path.exists(obj.get_old_journal_path())
+        False
+        >>> obj.save_worker = TrackerSaveWorker()
+        >>> tracker.add_graph_point(2, 3)
+        True
+        >>> obj.compact(wait=True)
+        >>> TrackerFile.read(obj.get_base_path())[3]
+        array('d', [1.0, 2.0])
+        """
+        self.wait_for_compaction()
+
+        tracker = self.tracker
+        snapshot = (tracker.file_format, tracker.get_x_axis_title(), tracker.get_y_axis_title(),
+            *tracker.copy_columns())
+
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
+        if path.exists(self.get_journal_path()):
+            replace(self.get_journal_path(), self.get_old_journal_path())
+        self.entries = 0
+        tracker.mark_saved()
+
+        if self.save_worker is None:
+            TrackerFile.write_atomic(self.get_base_path(), *snapshot)
+            self.remove_old_journal()
+        else:
+            self.save_worker.submit(self.get_base_path(), snapshot, self.remove_old_journal)
+            if wait:
+                self.wait_for_compaction()
+
+    def remove_old_journal(self):
+        """Removes the journal moved aside by compact() once
+        the new base file is written.
+        """
+        if path.exists(self.get_old_journal_path()):
+            remove(self.get_old_journal_path())
+
+    def is_compacting(self):
+        """Returns True if a compaction is waiting to be written.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> TrackerJournal(mkdtemp(), tracker).is_compacting()
+        False
+        """
+        return self.save_worker is not None and self.save_worker.is_pending(self.get_base_path())
+
+    def wait_for_compaction(self):
+        """Blocks until the compaction queued in the save worker, if any,
+        is written.
+        """
+        if self.save_worker is not None:
+            self.save_worker.wait_for(self.get_base_path())
+
+    def rename(self, new_name):
+        """Moves the tracker file and its journal so they match
+        the new name of the tracker.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> tracker.set_journal(obj)
+        >>> obj.compact(wait=True)
+        >>> tracker.add_graph_point(1, 2)
+        True
+        >>> tracker.set_name('Walk')
+        >>> obj.name
+        'Walk'
+        >>> path.exists(obj.get_base_path()), path.exists(obj.get_journal_path())
+        (True, True)
+        >>> path.exists(obj.get_base_path('Steps'))
+        False
+
+        A journal left by a compaction that failed to write is moved too.
+        >>> with open(obj.get_old_journal_path(), 'w') as file_obj:
+        ...     _ = file_obj.write("set 5.0 6.0\\n")
+        >>> tracker.set_name('Run')
+        >>> path.exists(obj.get_old_journal_path()), path.exists(obj.get_old_journal_path('Walk'))
+        (True, False)
+        """
+        self.wait_for_compaction()
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
+
+        for old_path, new_path in ((self.get_base_path(), self.get_base_path(new_name)),
+            (self.get_old_journal_path(), self.get_old_journal_path(new_name)),
+            (self.get_journal_path(), self.get_journal_path(new_name))):
+            if path.exists(old_path):
+                replace(old_path, new_path)
+            elif new_path != self.get_base_path(new_name) and path.exists(new_path):
+                remove(new_path)    #A stale journal of a tracker that had the new name must not be replayed.
+        self.name = new_name
+        self.tracker.file_path = self.get_base_path()
+
+    def delete(self):
+        """Removes the tracker file and its journal.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerJournal(mkdtemp(), tracker)
+        >>> obj.compact(wait=True)
+        >>> obj.record("set", 1.0, 2.0)
+        >>> obj.delete()
+        >>> path.exists(obj.get_base_path()), path.exists(obj.get_journal_path())
+        (False, False)
+        """
+        self.close()
+        for file_path in (self.get_base_path(), self.get_journal_path(), self.get_old_journal_path()):
+            if path.exists(file_path):
+                remove(file_path)
+
+    def close(self):
+        """Waits for any running compaction and closes the journal file.
+        Everything recorded so far is already on disk.
+        """
+        self.wait_for_compaction()
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
+
+class TrackerLoader:
+    """Class TrackerLoader reads many tracker files at once using a pool
+    of workers. Headers and binary files are read in threads since that is
+    mostly waiting for the disk. Text files larger than PROCESS_PARSE_THRESHOLD
+    bytes are parsed in separate processes, which send back the compact
+    array('d') columns. Results are always returned in the same order as
+    the file paths given, no matter which worker finishes first.
+    """
+    PROCESS_PARSE_THRESHOLD = 1 << 20
+
+    def __init__(self, max_workers=None, use_processes=True):
+        """Initializes a TrackerLoader with at most max_workers workers
+        per pool (None lets concurrent.futures choose from the number of cores).
+        >>> obj = TrackerLoader(4, use_processes=False)
+        >>> obj.max_workers, obj.use_processes
+        (4, False)
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+
+    def read_headers(self, file_paths, verify=False):
+        """Returns the result of TrackerFile.read_header for every file path,
+        or None for the files whose header cannot be read. If verify is True,
+        the checksum of every file is checked first and None is also returned
+        for the files that are corrupt.
+        >>> from tempfile import mkdtemp
+        >>> directory = mkdtemp()
+        >>> file_paths = [path.join(directory, name) for name in ('A', 'B', 'C')]
+        >>> _ = TrackerFile.write_text(file_paths[0], 'Day', 'Steps', [], [])
+        >>> _ = TrackerFile.write_binary(file_paths[1], 'Week', 'Weight', [], [])
+        >>> TrackerLoader(2).read_headers(file_paths[:2])
+        [('text', 'Day', 'Steps'), ('binary', 'Week', 'Weight')]
+        >>> with open(file_paths[2], 'wb') as file_obj:
+        ...     _ = file_obj.write(TrackerFile.get_checksum_line(0) + b'Day\\n')
+        >>> TrackerLoader(2).read_headers(file_paths, verify=True)[2]
+        >>> with open(file_paths[2], 'wb') as file_obj:
+        ...     _ = file_obj.write(b'\\xff\\xfe\\n')
+        >>> TrackerLoader(2).read_headers(file_paths + [path.join(directory, 'D')])[2:]
+        [None, None]
+        """
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            return list(executor.map(self.read_verified_header if verify else self.read_checked_header, file_paths))
+
+    @staticmethod
+    def read_checked_header(file_path):
+        """Returns the result of TrackerFile.read_header for file_path,
+        or None if its header cannot be read.
+        """
+        try:
+            return TrackerFile.read_header(file_path)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def read_verified_header(cls, file_path):
+        """Returns the result of TrackerFile.read_header for file_path,
+        or None if the file does not match its checksum or its header
+        cannot be read.
+        """
+        if not TrackerFile.verify(file_path):
+            return None
+        return cls.read_checked_header(file_path)
+
+    def read_files(self, file_paths):
+        """Returns the result of TrackerFile.read for every file path,
+        or None for the files that cannot be read or parsed, so one bad
+        file does not stop the others from loading.
+        >>> from tempfile import mkdtemp
+        >>> directory = mkdtemp()
+        >>> file_paths = [path.join(directory, name) for name in ('A', 'B', 'C', 'D')]
+        >>> _ = TrackerFile.write_text(file_paths[0], 'Day', 'Steps', [1.0], [2.0])
+        >>> _ = TrackerFile.write_text(file_paths[1], 'Week', 'Weight', [3.0], [4.0])
+        >>> with open(file_paths[2], 'wb') as file_obj:
+        ...     _ = file_obj.write(TrackerFile.get_checksum_line(0) + b'Day\\n')
+        >>> obj = TrackerLoader(2)
+        >>> obj.PROCESS_PARSE_THRESHOLD = 0
+        >>> [file_contents and file_contents[3].tolist() for file_contents in obj.read_files(file_paths)]
+        [[1.0], [3.0], None, None]
+        """
+        results = [None] * len(file_paths)
+        thread_indexes = []
+        process_indexes = []
+
+        for index, file_path in enumerate(file_paths):
+            try:
+                parse_in_process = self.use_processes and path.getsize(file_path) >= self.PROCESS_PARSE_THRESHOLD and \
+                    TrackerFile.detect_format(file_path) == TrackerFile.TEXT_FORMAT
+            except OSError:
+                parse_in_process = False    #Reading it in a thread gives None as well.
+            (process_indexes if parse_in_process else thread_indexes).append(index)
+
+        with ThreadPoolExecutor(self.max_workers) as thread_executor:
+            futures = [(index, thread_executor.submit(self.read_checked_file, file_paths[index])) for index in thread_indexes]
+            if process_indexes:
+                with ProcessPoolExecutor(self.max_workers) as process_executor:
+                    futures += [(index, process_executor.submit(self.read_checked_file, file_paths[index]))
+                        for index in process_indexes]
+            for index, future in futures:
+                results[index] = self.get_checked_result(future)
+        return results
+
+    @staticmethod
+    def read_checked_file(file_path):
+        """Returns the result of TrackerFile.read for file_path,
+        or None if the file cannot be read or parsed.
+        """
+        try:
+            return TrackerFile.read(file_path)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def get_checked_result(future):
+        """Returns the result of future, or None if the worker running
+        it failed (a process pool breaks if one of its processes dies).
+        """
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+class StorageLocation:
+    """Class StorageLocation decides where the tracker files are stored.
+    The directory is resolved once, in this order: the --data-dir command
+    line flag, the ITRACK_DATA_DIR environment variable, and a tracker_info
+    directory next to this script. The loader and the saver both use
+    the resolved path, so the program finds its data no matter
+    which directory it is executed from.
+    """
+    COMMAND_LINE_FLAG = "--data-dir"
+    ENVIRONMENT_VARIABLE = "ITRACK_DATA_DIR"
+    DEFAULT_DIR_NAME = "tracker_info"
+    QUARANTINE_DIR_NAME = ".quarantine"
+
+    def __init__(self, tracker_info_dir):
+        """Initializes a StorageLocation for the given directory.
+        >>> obj = StorageLocation('tracker_info')
+        >>> path.isabs(obj.get_path())
+        True
+        """
+        self.tracker_info_dir = path.abspath(path.expanduser(tracker_info_dir))
+
+    @classmethod
+    def resolve(cls, arguments=None, environment=None):
+        """Returns a StorageLocation for the directory given in the
+        command line arguments, the environment or the default one.
+        >>> StorageLocation.resolve(['--data-dir', '/data/trackers'], {}).get_path() == path.abspath('/data/trackers')
+        True
+        >>> StorageLocation.resolve([], {'ITRACK_DATA_DIR': '/env/trackers'}).get_path() == path.abspath('/env/trackers')
+        True
+        >>> StorageLocation.resolve(['--data-dir=/data'], {'ITRACK_DATA_DIR': '/env'}).get_path() == path.abspath('/data')
+        True
+        >>> path.basename(StorageLocation.resolve([], {}).get_path())
+        'tracker_info'
+        """
+        arguments = sys.argv[1:] if arguments is None else arguments
+        environment = environ if environment is None else environment
+        parser = ArgumentParser(add_help=False)
+        parser.add_argument(cls.COMMAND_LINE_FLAG, dest="data_dir")
+        known_arguments, other_arguments = parser.parse_known_args(arguments)
+
+        if known_arguments.data_dir:
+            return cls(known_arguments.data_dir)
+        elif environment.get(cls.ENVIRONMENT_VARIABLE):
+            return cls(environment[cls.ENVIRONMENT_VARIABLE])
+        else:
+            return cls(path.join(path.dirname(path.abspath(__file__)), cls.DEFAULT_DIR_NAME))
+
+    def get_path(self):
+        """Returns the absolute path of the directory where
+        the tracker files are stored.
+        """
+        return self.tracker_info_dir
+
+    def create(self):
+        """Creates the directory if it does not exist. This is safe
+        to call any number of times, also if another process creates it
+        at the same time.
+        >>> from tempfile import mkdtemp
+        >>> obj = StorageLocation(path.join(mkdtemp(), 'a', 'tracker_info'))
+        >>> obj.create()
+        >>> obj.create()
+        >>> path.isdir(obj.get_path())
+        True
+        """
+        makedirs(self.tracker_info_dir, exist_ok=True)
+
+    def quarantine(self, file_path):
+        """Moves the corrupt tracker file in file_path and its journal
+        to the QUARANTINE_DIR_NAME directory, where they are not loaded but
+        can still be recovered by hand. A number is added to the name if an
+        older file with the same name is already there. Returns the new
+        path of the tracker file.
+        >>> from tempfile import mkdtemp
+        >>> obj = StorageLocation(mkdtemp())
+        >>> file_path = path.join(obj.get_path(), 'Steps')
+        >>> for number in range(2):
+        ...     _ = TrackerFile.write_text(file_path, 'Day', 'Steps', [], [])
+        ...     path.basename(obj.quarantine(file_path))
+        'Steps'
+        'Steps.1'
+        >>> path.exists(file_path)
+        False
+        """
+        quarantine_dir = path.join(self.tracker_info_dir, self.QUARANTINE_DIR_NAME)
+        name = path.basename(file_path)
+        journal_path = path.join(self.tracker_info_dir, TrackerJournal.JOURNAL_DIR_NAME, name + ".log")
+        new_path = path.join(quarantine_dir, name)
+        number = 0
+
+        makedirs(quarantine_dir, exist_ok=True)
+        while path.exists(new_path):
+            number += 1
+            new_path = path.join(quarantine_dir, f"{name}.{number}")
+        for old_path, moved_path in ((file_path, new_path), (journal_path, new_path + ".log"),
+            (journal_path + ".old", new_path + ".log.old")):
+            if path.exists(old_path):
+                replace(old_path, moved_path)
+        return new_path
+
+class StorageLock:
+    """Class StorageLock is an advisory lock on a tracker_info directory,
+    held on the file .journal/.lock inside it. The application holds it
+    for its whole session, because it keeps the points and the journals of
+    open trackers in memory. TrackerFileStore takes it for every change, so
+    itrack_cli.py waits for the application instead of writing under it.
+    The operating system releases the lock if its process dies.
+    """
+    LOCK_FILE_NAME = ".lock"
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, tracker_info_dir):
+        """Initializes an unlocked StorageLock for tracker_info_dir.
+        >>> obj = StorageLock('tracker_info')
+        >>> path.basename(obj.lock_path), obj.lock_file
+        ('.lock', None)
+        """
+        self.lock_path = path.join(tracker_info_dir, TrackerJournal.JOURNAL_DIR_NAME, self.LOCK_FILE_NAME)
+        self.lock_file = None
+
+    def acquire(self, timeout=None):
+        """Takes the lock, waiting at most timeout seconds for it (or
+        as long as needed if timeout is None). Returns True if the lock
+        was taken, also when this object already held it.
+        >>> from tempfile import mkdtemp
+        >>> tracker_info_dir = mkdtemp()
+        >>> obj = StorageLock(tracker_info_dir)
+        >>> obj.acquire(0)
+        True
+        >>> StorageLock(tracker_info_dir).acquire(0)
+        False
+        >>> obj.release()
+        >>> StorageLock(tracker_info_dir).acquire(0)
+        True
+        """
+        if self.lock_file is not None:
+            return True
+        makedirs(path.dirname(self.lock_path), exist_ok=True)
+        lock_file = open(self.lock_path, 'a+b')
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while not self.try_lock(lock_file):
+            if deadline is not None and monotonic() >= deadline:
+                lock_file.close()
+                return False
+            sleep(self.POLL_INTERVAL)
+        self.lock_file = lock_file
+        return True
+
+    @staticmethod
+    def try_lock(lock_file):
+        """Tries to lock lock_file without waiting. Returns True if it
+        was locked.
+        """
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def release(self):
+        """Releases the lock if this object holds it.
+        """
+        if self.lock_file is None:
+            return
+        if fcntl is None:
+            self.lock_file.seek(0)
+            msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.lock_file.close()    #Closing the file releases a flock.
+        self.lock_file = None
+
+class TrackerImporter:
+    """Class TrackerImporter reads points from CSV or TSV files into
+    trackers. Files are parsed in chunks of self.chunk_size rows as they
+    are read, the first two columns being the x and y values. A first row
+    that is not made of numbers is taken as the axis titles, and other rows
+    that are not numbers are skipped and their line numbers kept in
+    self.invalid_lines. Repeated x values, in the file or already in the
+    tracker, are resolved with the duplicate policy: keep the first value,
+    the last value, or the mean of all of them. The points are merged into
+    the tracker with a single sort.
+    """
+    KEEP_FIRST = "first"
+    KEEP_LAST = "last"
+    MEAN = "mean"
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, duplicate_policy=KEEP_LAST, chunk_size=None):
+        """Initializes an importer using duplicate_policy.
+        >>> obj = TrackerImporter()
+        >>> obj.duplicate_policy, obj.chunk_size, obj.invalid_lines
+        ('last', 65536, [])
+        >>> obj.x_axis_title, obj.y_axis_title
+        (None, None)
+        """
+        self.duplicate_policy = duplicate_policy
+        self.chunk_size = self.CHUNK_SIZE if chunk_size is None else chunk_size
+        self.invalid_lines = []
+        self.x_axis_title = None
+        self.y_axis_title = None
+
+    @staticmethod
+    def get_delimiter(file_path):
+        """Returns the delimiter of the columns of file_path,
+        a tab for .tsv and .tab files and a comma otherwise.
+        >>> TrackerImporter.get_delimiter('steps.tsv'), TrackerImporter.get_delimiter('steps.csv')
+        ('\\t', ',')
+        """
+        return "\t" if path.splitext(file_path)[1].lower() in (".tsv", ".tab") else ","
+
+    def read_chunks(self, file_path, progress=None):
+        """Yields the points of file_path as x and y columns, one
+        chunk of rows at a time. progress, if given, is called after
+        every chunk with the number of characters read so far and the
+        size of the file.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'steps.csv')
+        >>> with open(file_path, 'w') as file_obj:
+        ...     _ = file_obj.write('Day,Steps\\n1,10\\n2,abc\\n\\n3, 30\\n')
+        >>> obj = TrackerImporter(chunk_size=1)
+        >>> list(obj.read_chunks(file_path))
+        [(array('d', [1.0]), array('d', [10.0])), (array('d', [3.0]), array('d', [30.0]))]
+        >>> obj.x_axis_title, obj.y_axis_title, obj.invalid_lines
+        ('Day', 'Steps', [3])
+        """
+        total_size = path.getsize(file_path)
+        characters_read = 0
+        line_number = 0
+
+        with open(file_path, newline="") as file_obj:
+            rows = csv.reader(file_obj, delimiter=self.get_delimiter(file_path))
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                x_values = array('d')
+                y_values = array('d')
+                for row in chunk:
+                    line_number += 1
+                    characters_read += sum(len(value) + 1 for value in row)
+                    if not row or not "".join(row).strip():
+                        continue
+                    try:
+                        x_value = float(row[0].strip())
+                        y_value = float(row[1].strip())
+                    except (ValueError, IndexError):
+                        if line_number == 1 and len(row) >= 2:
+                            self.x_axis_title = row[0].strip()
+                            self.y_axis_title = row[1].strip()
+                        else:
+                            self.invalid_lines.append(line_number)
+                        continue
+                    x_values.append(x_value)
+                    y_values.append(y_value)
+                if progress is not None:
+                    progress(min(characters_read, total_size), total_size)
+                if x_values:
+                    yield x_values, y_values
+
+    def merge(self, x_values, y_values, new_x_values, new_y_values):
+        """Returns the sorted x and y columns of the points of both pairs
+        of columns, resolving repeated x values with self.duplicate_policy.
+        The points in x_values and y_values come first.
+        >>> x_values, y_values = array('d', [1, 2]), array('d', [10, 20])
+        >>> new_x_values, new_y_values = array('d', [2, 0, 2]), array('d', [40, 5, 60])
+        >>> TrackerImporter(TrackerImporter.KEEP_FIRST).merge(x_values, y_values, new_x_values, new_y_values)
+        (array('d', [0.0, 1.0, 2.0]), array('d', [5.0, 10.0, 20.0]))
+        >>> TrackerImporter(TrackerImporter.KEEP_LAST).merge(x_values, y_values, new_x_values, new_y_values)
+        (array('d', [0.0, 1.0, 2.0]), array('d', [5.0, 10.0, 60.0]))
+        >>> TrackerImporter(TrackerImporter.MEAN).merge(x_values, y_values, new_x_values, new_y_values)
+        (array('d', [0.0, 1.0, 2.0]), array('d', [5.0, 10.0, 40.0]))
+        """
+        all_x_values = Tracker.to_column(x_values)
+        all_y_values = Tracker.to_column(y_values)
+        all_x_values.extend(new_x_values)
+        all_y_values.extend(new_y_values)
+        order = sorted(range(len(all_x_values)), key=all_x_values.__getitem__)     #Stable, so first stays first.
+        merged_x_values = array('d')
+        merged_y_values = array('d')
+
+        first = 0
+        while first < len(order):
+            x_value = all_x_values[order[first]]
+            last = first + 1
+            while last < len(order) and all_x_values[order[last]] == x_value:
+                last += 1
+            if self.duplicate_policy == self.KEEP_FIRST or last - first == 1:
+                y_value = all_y_values[order[first]]
+            elif self.duplicate_policy == self.KEEP_LAST:
+                y_value = all_y_values[order[last - 1]]
+            else:
+                y_value = sum(all_y_values[order[index]] for index in range(first, last)) / (last - first)
+            merged_x_values.append(x_value)
+            merged_y_values.append(y_value)
+            first = last
+        return merged_x_values, merged_y_values
+
+    def import_file(self, file_path, tracker, progress=None):
+        """Reads the points of file_path and merges them into tracker.
+        Returns the number of points read from the file.
+        >>> from tempfile import mkdtemp
+        >>> file_path = path.join(mkdtemp(), 'steps.tsv')
+        >>> with open(file_path, 'w') as file_obj:
+        ...     _ = file_obj.write('3\\t30\\n1\\t10\\n3\\t50\\n')
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[2, 20]])
+        >>> TrackerImporter(TrackerImporter.MEAN).import_file(file_path, tracker)
+        3
+        >>> tracker.get_data()
+        [[1.0, 10.0], [2.0, 20.0], [3.0, 40.0]]
+
+        A tracker whose points are not loaded yet is loaded first.
+        >>> tracker = Tracker()
+        >>> tracker.file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(tracker.file_path, 'X', 'Y', [1.0, 2.0], [10.0, 20.0])
+        >>> tracker.loaded = False
+        >>> TrackerImporter().import_file(file_path, tracker)
+        3
+        >>> tracker.get_data()
+        [[1.0, 10.0], [2.0, 20.0], [3.0, 50.0]]
+        """
+        new_x_values = array('d')
+        new_y_values = array('d')
+
+        for x_values, y_values in self.read_chunks(file_path, progress):
+            new_x_values.extend(x_values)
+            new_y_values.extend(y_values)
+        tracker.load_data()
+        tracker.set_columns(*self.merge(tracker.get_column(0), tracker.get_column(1), new_x_values, new_y_values),
+            copy=False)
+        return len(new_x_values)
+
+class TrackerExporter:
+    """Class TrackerExporter writes the points of a tracker to CSV (or
+    TSV), JSON Lines or a columnar binary file. The points are written in
+    chunks of self.chunk_size points, so only one chunk of output is in
+    memory at a time besides the columns themselves (which export_file maps
+    instead of reading for binary tracker files).
+    The columnar format starts with COLUMNAR_HEADER (COLUMNAR_MAGIC and the
+    length of both titles) and the UTF-8 titles. Then come row groups, each
+    one the number of points in it as a little-endian uint64 followed by the
+    x and y columns of those points packed as little-endian float64. A row
+    group of 0 points ends the file.
+    """
+    CSV_FORMAT = "csv"
+    JSONL_FORMAT = "jsonl"
+    COLUMNAR_FORMAT = "columnar"
+    COLUMNAR_MAGIC = b"ITRACKC1"
+    COLUMNAR_HEADER = struct.Struct("<8sII")
+    ROW_GROUP_HEADER = struct.Struct("<Q")
+    CHUNK_SIZE = 1 << 16
+    EXTENSIONS = {".csv": CSV_FORMAT, ".tsv": CSV_FORMAT, ".tab": CSV_FORMAT, ".txt": CSV_FORMAT,
+        ".jsonl": JSONL_FORMAT, ".itc": COLUMNAR_FORMAT}
+
+    def __init__(self, file_format=CSV_FORMAT, chunk_size=None):
+        """Initializes an exporter writing file_format files.
+        >>> obj = TrackerExporter()
+        >>> obj.file_format, obj.chunk_size
+        ('csv', 65536)
+        """
+        self.file_format = file_format
+        self.chunk_size = self.CHUNK_SIZE if chunk_size is None else chunk_size
+
+    @classmethod
+    def get_format(cls, file_path):
+        """Returns the format of the extension of file_path,
+        or CSV_FORMAT if the extension is unknown.
+        >>> TrackerExporter.get_format('steps.jsonl'), TrackerExporter.get_format('steps.itc')
+        ('jsonl', 'columnar')
+        """
+        return cls.EXTENSIONS.get(path.splitext(file_path)[1].lower(), cls.CSV_FORMAT)
+
+    def get_chunks(self, x_values, y_values):
+        """Yields the x and y columns split in chunks of self.chunk_size points.
+        >>> list(TrackerExporter(chunk_size=2).get_chunks(array('d', [1, 2, 3]), array('d', [4, 5, 6])))
+        [(array('d', [1.0, 2.0]), array('d', [4.0, 5.0])), (array('d', [3.0]), array('d', [6.0]))]
+        """
+        for first in range(0, len(x_values), self.chunk_size):
+            yield (Tracker.to_column(x_values[first:first + self.chunk_size]),
+                Tracker.to_column(y_values[first:first + self.chunk_size]))
+
+    def export(self, tracker, file_path, progress=None):
+        """Writes the points of tracker to file_path. progress, if given,
+        is called after every chunk with the number of points written and
+        the number of points of the tracker. Returns the number of bytes written.
+        >>> from tempfile import mkdtemp
+        >>> tracker = Tracker()
+        >>> tracker.set_data([[1, 2], [3, 4.5]])
+        >>> tracker.set_x_axis_title('Day')
+        >>> file_path = path.join(mkdtemp(), 'steps.csv')
+        >>> TrackerExporter().export(tracker, file_path)
+        27
+        >>> print(open(file_path).read(), end='')
+        Day,Y-Axis
+        1.0,2.0
+        3.0,4.5
+        >>> _ = TrackerExporter(TrackerExporter.JSONL_FORMAT).export(tracker, file_path)
+        >>> print(open(file_path).read(), end='')
+        {"x": 1.0, "y": 2.0}
+        {"x": 3.0, "y": 4.5}
+        >>> TrackerExporter(TrackerExporter.COLUMNAR_FORMAT).export(tracker, file_path)
+        73
+        >>> TrackerExporter.read_columnar(file_path)
+        ('Day', 'Y-Axis', array('d', [1.0, 3.0]), array('d', [2.0, 4.5]))
+
+        A tracker whose points are not loaded yet is loaded first.
+        >>> tracker = Tracker()
+        >>> tracker.file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write_text(tracker.file_path, 'Day', 'Steps', [1.0], [10.0])
+        >>> tracker.loaded = False
+        >>> _ = TrackerExporter().export(tracker, file_path)
+        >>> print(open(file_path).read(), end='')
+        X-Axis,Y-Axis
+        1.0,10.0
+        """
+        tracker.load_data()
+        return self.export_columns(file_path, tracker.get_x_axis_title(), tracker.get_y_axis_title(),
+            tracker.get_column(0), tracker.get_column(1), progress)
+
+    def export_file(self, tracker_file_path, file_path, progress=None):
+        """Exports the tracker file in tracker_file_path without creating
+        a Tracker. Binary tracker files are mapped, so they are exported
+        without being read into memory. Text tracker files are parsed
+        whole first, so they need as much memory as loading the tracker.
+        Returns the number of bytes written.
+        >>> from tempfile import mkdtemp
+        >>> tracker_file_path = path.join(mkdtemp(), 'Steps')
+        >>> _ = TrackerFile.write(tracker_file_path, TrackerFile.BINARY_FORMAT, 'Day', 'Steps', [1.0], [2.0])
+        >>> TrackerExporter().export_file(tracker_file_path, tracker_file_path + '.csv')
+        18
+        """
+        file_format, x_axis_title, y_axis_title, x_values, y_values = TrackerFile.read(tracker_file_path)
+        return self.export_columns(file_path, x_axis_title, y_axis_title, x_values, y_values, progress)
+
+    def export_columns(self, file_path, x_axis_title, y_axis_title, x_values, y_values, progress=None):
+        """Writes the given titles and columns to file_path in
+        self.file_format. Returns the number of bytes written.
+        """
+        if self.file_format == self.COLUMNAR_FORMAT:
+            write_chunk = self.write_columnar_chunk
+            file_args = {'mode': 'wb'}
+        elif self.file_format == self.JSONL_FORMAT:
+            write_chunk = self.write_jsonl_chunk
+            file_args = {'mode': 'w', 'encoding': 'utf-8', 'newline': ''}
+        else:
+            write_chunk = self.write_csv_chunk
+            file_args = {'mode': 'w', 'encoding': 'utf-8', 'newline': ''}
+
+        with open(file_path, **file_args) as file_obj:
+            if self.file_format == self.COLUMNAR_FORMAT:
+                x_title = x_axis_title.encode('utf-8')
+                y_title = y_axis_title.encode('utf-8')
+                file_obj.write(self.COLUMNAR_HEADER.pack(self.COLUMNAR_MAGIC, len(x_title), len(y_title)) + x_title + y_title)
+            elif self.file_format != self.JSONL_FORMAT:
+                csv.writer(file_obj, delimiter=TrackerImporter.get_delimiter(file_path), lineterminator='\n').writerow(
+                    [x_axis_title, y_axis_title])
+            points_written = 0
+            for x_chunk, y_chunk in self.get_chunks(x_values, y_values):
+                write_chunk(file_obj, x_chunk, y_chunk)
+                points_written += len(x_chunk)
+                if progress is not None:
+                    progress(points_written, len(x_values))
+            if self.file_format == self.COLUMNAR_FORMAT:
+                file_obj.write(self.ROW_GROUP_HEADER.pack(0))
+            file_obj.flush()
+            return file_obj.buffer.tell() if hasattr(file_obj, 'buffer') else file_obj.tell()
+
+    def write_csv_chunk(self, file_obj, x_chunk, y_chunk):
+        """Writes one chunk of points as CSV rows.
+        """
+        csv.writer(file_obj, delimiter=TrackerImporter.get_delimiter(file_obj.name), lineterminator='\n').writerows(
+            zip(x_chunk, y_chunk))
+
+    def write_jsonl_chunk(self, file_obj, x_chunk, y_chunk):
+        """Writes one chunk of points as one JSON object per line. Values
+        that are not finite are written the way json.dumps writes them,
+        as NaN, Infinity and -Infinity, which Python's json module reads
+        back but strict JSON parsers reject.
+        >>> from io import StringIO
+        >>> file_obj = StringIO()
+        >>> TrackerExporter().write_jsonl_chunk(file_obj, array('d', [1, 2]), array('d', [float('nan'), -float('inf')]))
+        >>> print(file_obj.getvalue(), end='')
+        {"x": 1.0, "y": NaN}
+        {"x": 2.0, "y": -Infinity}
+        """
+        if all(map(isfinite, x_chunk)) and all(map(isfinite, y_chunk)):
+            lines = "".join('{"x": %r, "y": %r}\n' % point for point in zip(x_chunk, y_chunk))
+        else:   #repr() of nan and inf is not valid in any JSON reader.
+            lines = "".join('{"x": %s, "y": %s}\n' % (json.dumps(x_value), json.dumps(y_value))
+                for x_value, y_value in zip(x_chunk, y_chunk))
+        file_obj.write(lines)
+
+    def write_columnar_chunk(self, file_obj, x_chunk, y_chunk):
+        """Writes one chunk of points as a row group.
+        """
+        if byteorder == 'big':
+            x_chunk.byteswap()
+            y_chunk.byteswap()
+        file_obj.write(self.ROW_GROUP_HEADER.pack(len(x_chunk)))
+        file_obj.write(x_chunk)
+        file_obj.write(y_chunk)
+
+    @classmethod
+    def read_columnar(cls, file_path):
+        """Reads a columnar file written by export and returns
+        its titles and its x and y columns.
+        """
+        x_values = array('d')
+        y_values = array('d')
+
+        with open(file_path, 'rb') as file_obj:
+            magic, x_title_size, y_title_size = cls.COLUMNAR_HEADER.unpack(file_obj.read(cls.COLUMNAR_HEADER.size))
+            if magic != cls.COLUMNAR_MAGIC:
+                raise ValueError("not a columnar tracker export")
+            x_axis_title = file_obj.read(x_title_size).decode('utf-8')
+            y_axis_title = file_obj.read(y_title_size).decode('utf-8')
+            while True:
+                point_count, = cls.ROW_GROUP_HEADER.unpack(file_obj.read(cls.ROW_GROUP_HEADER.size))
+                if point_count == 0:
+                    break
+                x_values.fromfile(file_obj, point_count)
+                y_values.fromfile(file_obj, point_count)
+        if byteorder == 'big':
+            x_values.byteswap()
+            y_values.byteswap()
+        return x_axis_title, y_axis_title, x_values, y_values
+
+class GraphSampler:
+    """Class GraphSampler reduces the points of a tracker to about as
+    many points as the graph is wide in pixels, so drawing the graph costs
+    the same for any tracker size. Two methods are available: MIN_MAX keeps
+    the lowest and highest point of every pixel column, so spikes are never
+    lost, and LTTB (Largest-Triangle-Three-Buckets) keeps the points that
+    best preserve the shape of the line.
+    """
+    MIN_MAX = "minmax"
+    LTTB = "lttb"
+    MIN_WIDTH = 100     #Fewest pixel columns assumed, for graphs that are not shown yet.
+
+    @classmethod
+    def sample(cls, x_values, y_values, width, method=MIN_MAX):
+        """Returns the x and y columns of the points to draw in
+        a graph width pixels wide, using method. Trackers with
+        fewer than two points per pixel are returned whole.
+        >>> x_values = array('d', range(1000))
+        >>> y_values = array('d', [x % 7 for x in range(1000)])
+        >>> sampled = GraphSampler.sample(x_values, y_values, 100)
+        >>> len(sampled[0]) <= 200, min(sampled[1]), max(sampled[1])
+        (True, 0.0, 6.0)
+        >>> len(GraphSampler.sample(x_values, y_values, 100, GraphSampler.LTTB)[0])
+        200
+        >>> GraphSampler.sample(array('d', [1]), array('d', [2]), 100)
+        (array('d', [1.0]), array('d', [2.0]))
+        """
+        width = max(width, cls.MIN_WIDTH)
+        if len(x_values) <= 2 * width:
+            return Tracker.to_column(x_values), Tracker.to_column(y_values)
+        elif method == cls.LTTB:
+            return cls.lttb(x_values, y_values, 2 * width)
+        else:
+            return cls.min_max(x_values, y_values, width)
+
+    @staticmethod
+    def min_max(x_values, y_values, buckets):
+        """Splits the points in buckets of consecutive points and keeps
+        the lowest and the highest point of each bucket, in x order.
+        >>> GraphSampler.min_max([1, 2, 3, 4, 5, 6], [5, 1, 9, 2, 2, 0], 2)
+        (array('d', [2.0, 3.0, 4.0, 6.0]), array('d', [1.0, 9.0, 2.0, 0.0]))
+        """
+        point_count = len(x_values)
+        sampled_x = array('d')
+        sampled_y = array('d')
+
+        for bucket in range(buckets):
+            first = bucket * point_count // buckets
+            last = (bucket + 1) * point_count // buckets
+            bucket_y = y_values[first:last]
+            if not isinstance(bucket_y, list):
+                bucket_y = bucket_y.tolist()    #array('d') and memoryview columns.
+            if not bucket_y:
+                continue
+            low = bucket_y.index(min(bucket_y))
+            high = bucket_y.index(max(bucket_y))
+            for index in sorted({low, high}):
+                sampled_x.append(x_values[first + index])
+                sampled_y.append(bucket_y[index])
+        return sampled_x, sampled_y
+
+    @staticmethod
+    def lttb(x_values, y_values, threshold):
+        """Keeps threshold points using the Largest-Triangle-Three-Buckets
+        algorithm. The first and last points are always kept; from every
+        bucket in between, the point forming the largest triangle with the
+        point kept before it and the average of the next bucket is kept.
+        >>> GraphSampler.lttb([1, 2, 3, 4, 5, 6], [0, 1, 9, 1, 0, 0], 3)
+        (array('d', [1.0, 3.0, 6.0]), array('d', [0.0, 9.0, 0.0]))
+        """
+        point_count = len(x_values)
+        if threshold >= point_count or threshold < 3:
+            return Tracker.to_column(x_values), Tracker.to_column(y_values)
+        sampled_x = array('d', [x_values[0]])
+        sampled_y = array('d', [y_values[0]])
+        bucket_size = (point_count - 2) / (threshold - 2)
+        selected = 0
+
+        for bucket in range(threshold - 2):
+            first = int(bucket * bucket_size) + 1
+            next_first = int((bucket + 1) * bucket_size) + 1
+            next_last = min(int((bucket + 2) * bucket_size) + 1, point_count)
+            average_x = sum(x_values[next_first:next_last]) / (next_last - next_first)
+            average_y = sum(y_values[next_first:next_last]) / (next_last - next_first)
+            selected_x = x_values[selected]
+            selected_y = y_values[selected]
+
+            largest_area = -1
+            for index in range(first, next_first):
+                area = abs((selected_x - average_x) * (y_values[index] - selected_y) -
+                    (selected_x - x_values[index]) * (average_y - selected_y))
+                if area > largest_area:
+                    largest_area = area
+                    selected = index
+            sampled_x.append(x_values[selected])
+            sampled_y.append(y_values[selected])
+
+        sampled_x.append(x_values[-1])
+        sampled_y.append(y_values[-1])
+        return sampled_x, sampled_y
+
+class TrackerPyramid:
+    """Class TrackerPyramid caches the lowest, highest and mean y value
+    of a tracker over buckets of 2 ** level consecutive points, from
+    BASE_LEVEL upwards. Every level is built from the one below it the first
+    time a graph needs it, so a zoomed out graph reads about as many buckets
+    as it has pixels instead of every point of the tracker. When a point
+    changes only the buckets covering it are recomputed, and when points
+    are inserted or removed only the buckets after them are dropped.
+    Points can be read from another thread: self.lock is the columns_lock
+    of the tracker, held while its columns change, so the columns and the
+    levels are always read in a consistent state.
+    Each level is a list of five columns: the lowest, highest and mean
+    y value of every bucket and the indexes of its lowest and highest points.
+    """
+    BASE_LEVEL = 4  #Smaller buckets are cheap enough to read from the points.
+    MIN, MAX, MEAN, MIN_INDEX, MAX_INDEX = range(5)
+
+    def __init__(self, tracker):
+        """Initializes an empty pyramid for tracker.
+        >>> obj = TrackerPyramid(Tracker())
+        >>> obj.levels
+        {}
+        """
+        self.tracker = tracker
+        self.levels = {}
+        self.lock = tracker.columns_lock
+
+    def get_level(self, level):
+        """Returns the columns of level, building the buckets
+        that are missing.
+        >>> tracker = Tracker()
+        >>> tracker.set_columns(range(40), [x % 10 for x in range(40)])
+        >>> level = TrackerPyramid(tracker).get_level(5)
+        >>> level[TrackerPyramid.MIN], level[TrackerPyramid.MAX], level[TrackerPyramid.MEAN]
+        (array('d', [0.0, 2.0]), array('d', [9.0, 9.0]), array('d', [4.25, 5.5]))
+        >>> level[TrackerPyramid.MIN_INDEX], level[TrackerPyramid.MAX_INDEX]
+        (array('q', [0, 32]), array('q', [9, 39]))
+        """
+        if level not in self.levels:
+            self.levels[level] = [array('d'), array('d'), array('d'), array('q'), array('q')]
+        columns = self.levels[level]
+        bucket_count = (len(self.tracker.x_values) + (1 << level) - 1) >> level
+
+        if len(columns[self.MIN]) < bucket_count:
+            if level > self.BASE_LEVEL:
+                self.get_level(level - 1)
+            for bucket in range(len(columns[self.MIN]), bucket_count):
+                for column, value in zip(columns, self.get_bucket(level, bucket)):
+                    column.append(value)
+        return columns
+
+    def get_bucket(self, level, bucket):
+        """Returns the five values of bucket in level. Buckets of
+        BASE_LEVEL are read from the points of the tracker and buckets
+        above it are combined from the two buckets below them.
+        """
+        size = 1 << level
+        first = bucket * size
+
+        if level == self.BASE_LEVEL:
+            bucket_y = self.tracker.y_values[first:first + size].tolist()
+            low = min(bucket_y)
+            high = max(bucket_y)
+            return low, high, sum(bucket_y) / len(bucket_y), first + bucket_y.index(low), first + bucket_y.index(high)
+
+        children = self.levels[level - 1]
+        left = 2 * bucket
+        right = left + 1
+        if right >= len(children[self.MIN]):
+            return tuple(column[left] for column in children)
+
+        left_count = size // 2
+        right_count = min(size // 2, len(self.tracker.x_values) - first - left_count)
+        low_child = left if children[self.MIN][left] <= children[self.MIN][right] else right
+        high_child = left if children[self.MAX][left] >= children[self.MAX][right] else right
+        mean = (children[self.MEAN][left] * left_count + children[self.MEAN][right] * right_count) / (left_count + right_count)
+        return (children[self.MIN][low_child], children[self.MAX][high_child], mean,
+            children[self.MIN_INDEX][low_child], children[self.MAX_INDEX][high_child])
+
+    def invalidate(self, index, shifted=True):
+        """Updates the levels after the point in index changed. If
+        shifted is True the points after index moved, so every bucket from
+        the one covering index onwards is dropped and built again when needed.
+        Otherwise only the bucket covering index is recomputed in every level.
+        >>> tracker = Tracker()
+        >>> tracker.set_columns(range(64), [1] * 64)
+        >>> obj = tracker.get_pyramid()
+        >>> obj.get_level(6)[TrackerPyramid.MAX]
+        array('d', [1.0])
+        >>> tracker.set_y_value(40, 5)
+        >>> obj.get_level(6)[TrackerPyramid.MAX], obj.get_level(6)[TrackerPyramid.MAX_INDEX]
+        (array('d', [5.0]), array('q', [40]))
+        >>> tracker.remove_row(20)
+        [20.0, 1.0]
+        >>> len(obj.levels[4][TrackerPyramid.MIN]), len(obj.levels[5][TrackerPyramid.MIN])
+        (1, 0)
+        >>> obj.get_level(6)[TrackerPyramid.MAX_INDEX]
+        array('q', [39])
+        """
+        with self.lock:
+            self.invalidate_levels(index, shifted)
+
+    def invalidate_levels(self, index, shifted):
+        """Drops or recomputes the buckets of every level
+        covering index, see invalidate.
+        """
+        for level in sorted(self.levels):
+            columns = self.levels[level]
+            bucket = index >> level
+            if shifted:
+                for column in columns:
+                    del column[bucket:]
+            elif bucket < len(columns[self.MIN]):
+                for column, value in zip(columns, self.get_bucket(level, bucket)):
+                    column[bucket] = value
+
+    def get_y_range(self):
+        """Returns the lowest and highest y value of the tracker, read from
+        the single bucket of the top level, or None if it has no points.
+        Once the levels are built this does not read any point.
+        >>> tracker = Tracker()
+        >>> tracker.set_columns(range(100), [(x * 37) % 101 for x in range(100)])
+        >>> tracker.get_pyramid().get_y_range()
+        (0.0, 100.0)
+        >>> TrackerPyramid(Tracker()).get_y_range()
+        """
+        with self.lock:
+            point_count = len(self.tracker.x_values)
+            if point_count == 0:
+                return None
+            columns = self.get_level(max((point_count - 1).bit_length(), self.BASE_LEVEL))
+            return columns[self.MIN][0], columns[self.MAX][0]
+
+    def get_points(self, first, last, max_buckets):
+        """Returns the x and y columns of the points to draw for the points
+        with indexes first to last - 1, using at most max_buckets buckets.
+        The lowest and highest point of every bucket are returned, taken from
+        the lowest level of the pyramid that has few enough buckets.
+        >>> tracker = Tracker()
+        >>> tracker.set_columns(range(256), [x % 50 for x in range(256)])
+        >>> obj = tracker.get_pyramid()
+        >>> obj.get_points(0, 256, 2)
+        (array('d', [0.0, 49.0, 149.0, 150.0]), array('d', [0.0, 49.0, 49.0, 0.0]))
+        >>> sorted(obj.levels)
+        [4, 5, 6, 7]
+        >>> obj.get_points(10, 13, 2)
+        (array('d', [10.0, 11.0, 12.0]), array('d', [10.0, 11.0, 12.0]))
+        """
+        with self.lock:
+            x_values = self.tracker.x_values
+            y_values = self.tracker.y_values
+            last = min(last, len(x_values))     #The tracker may have lost points since the request.
+            point_count = last - first
+
+            if point_count <= max_buckets << self.BASE_LEVEL:
+                return GraphSampler.sample(x_values[first:last], y_values[first:last], max_buckets)
+
+            level = self.BASE_LEVEL
+            while point_count >> level > max_buckets:
+                level += 1
+            sampled_x = array('d')
+            sampled_y = array('d')
+
+            columns = self.get_level(level)
+            for bucket in range(first >> level, ((last - 1) >> level) + 1):
+                for index in sorted({columns[self.MIN_INDEX][bucket], columns[self.MAX_INDEX][bucket]}):
+                    sampled_x.append(x_values[index])
+                    sampled_y.append(y_values[index])
+        return sampled_x, sampled_y
+
+class TrackerNameIndex:
+    """Class TrackerNameIndex keeps the trackers sorted by their
+    lowercase name so the trackers whose name starts with a prefix
+    are found with two binary searches.
+    """
+    def __init__(self, trackers=()):
+        """Initializes the index with trackers.
+        >>> first, second = Tracker(), Tracker()
+        >>> first.set_name('Steps')
+        >>> second.set_name('Sleep')
+        >>> obj = TrackerNameIndex([first, second])
+        >>> obj.keys
+        [('sleep', 'Sleep'), ('steps', 'Steps')]
+        """
+        entries = sorted((self.get_key(tracker.get_name()), index, tracker) for index, tracker in enumerate(trackers))
+        self.keys = [key for key, index, tracker in entries]
+        self.trackers = [tracker for key, index, tracker in entries]
+
+    @staticmethod
+    def get_key(name):
+        """Returns the key used to sort name. Names that
+        only differ in case are kept in a fixed order.
+        >>> TrackerNameIndex.get_key('Steps')
+        ('steps', 'Steps')
+        """
+        return (name.lower(), name)
+
+    def add(self, tracker):
+        """Adds tracker to the index.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerNameIndex()
+        >>> obj.add(tracker)
+        >>> obj.find_prefix('st') == [tracker]
+        True
+        """
+        key = self.get_key(tracker.get_name())
+        index = bisect_left(self.keys, key)
+
+        self.keys.insert(index, key)
+        self.trackers.insert(index, tracker)
+
+    def remove(self, tracker, name=None):
+        """Removes tracker from the index. name is the name the
+        tracker had when it was added, if it was renamed since.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerNameIndex([tracker])
+        >>> obj.remove(tracker)
+        >>> obj.find_prefix('')
+        []
+        """
+        key = self.get_key(tracker.get_name() if name is None else name)
+        index = bisect_left(self.keys, key)
+
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.trackers[index]
+
+    def find_prefix(self, prefix):
+        """Returns the trackers whose name starts with prefix,
+        ignoring case, sorted by name.
+        >>> trackers = [Tracker(), Tracker(), Tracker()]
+        >>> for tracker, name in zip(trackers, ['Steps', 'sleep', 'Weight']):
+        ...     tracker.set_name(name)
+        >>> obj = TrackerNameIndex(trackers)
+        >>> [tracker.get_name() for tracker in obj.find_prefix('S')]
+        ['sleep', 'Steps']
+        >>> [tracker.get_name() for tracker in obj.find_prefix('ste')]
+        ['Steps']
+        >>> obj.find_prefix('x')
+        []
+        """
+        prefix = prefix.lower()
+        first = bisect_left(self.keys, (prefix,))
+        last = bisect_left(self.keys, (prefix + chr(sys.maxunicode),), first)
+        return self.trackers[first:last]
+
+class TrackerRegistry:
+    """Class TrackerRegistry holds every tracker of the application and
+    is the one place the user interface and the storage look them up.
+    Trackers are found by name in a dictionary and kept in the order
+    they were added (also when renamed) in a second dictionary, so adding,
+    finding, renaming and removing a tracker take constant time. The list
+    of trackers in order and the row of every tracker, used to show them,
+    are built again only after a tracker is removed. A TrackerNameIndex
+    finds the trackers by name prefix.
+    """
+    RESERVED_CHARACTERS = ('\\', '/', ':')
+
+    def __init__(self, trackers=()):
+        """Initializes the registry with trackers.
+        >>> first, second = Tracker(), Tracker()
+        >>> first.set_name('Steps')
+        >>> second.set_name('Sleep')
+        >>> obj = TrackerRegistry([first, second])
+        >>> len(obj), obj.get('Sleep') is second
+        (2, True)
+        >>> [tracker.get_name() for tracker in obj]
+        ['Steps', 'Sleep']
+        """
+        self.trackers_by_name = {}
+        self.trackers = {}  #Keys are the trackers in the order they were added.
+        self.tracker_list = None
+        self.rows = None
+        self.name_index = TrackerNameIndex()
+
+        for tracker in trackers:
+            self.add(tracker)
+
+    def __len__(self):
+        """Returns the number of trackers.
+        """
+        return len(self.trackers)
+
+    def __iter__(self):
+        """Iterates over the trackers in the order they were added.
+        """
+        return iter(self.trackers)
+
+    def __contains__(self, name):
+        """Returns True if there is a tracker called name.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> 'Steps' in TrackerRegistry([tracker]), 'Walk' in TrackerRegistry([tracker])
+        (True, False)
+        """
+        return name in self.trackers_by_name
+
+    def get(self, name):
+        """Returns the tracker called name, or None if there is none.
+        """
+        return self.trackers_by_name.get(name)
+
+    @classmethod
+    def is_valid_name(cls, name):
+        """Returns True if name can be used as the name of a tracker file:
+        it is not empty, does not start with a dot (like the journal
+        directory) and has none of RESERVED_CHARACTERS.
+        >>> TrackerRegistry.is_valid_name('Steps'), TrackerRegistry.is_valid_name('')
+        (True, False)
+        >>> TrackerRegistry.is_valid_name('a:b'), TrackerRegistry.is_valid_name('.journal')
+        (False, False)
+        """
+        return len(name) > 0 and not name.startswith(".") and \
+            not any(character in name for character in cls.RESERVED_CHARACTERS)
+
+    def is_name_available(self, name):
+        """Returns True if name is a valid name and no tracker is called name.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerRegistry([tracker])
+        >>> obj.is_name_available('Steps'), obj.is_name_available('Walk')
+        (False, True)
+        """
+        return self.is_valid_name(name) and name not in self.trackers_by_name
+
+    def add(self, tracker):
+        """Adds tracker after the other trackers. Raises a ValueError
+        if another tracker has the same name.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerRegistry()
+        >>> obj.add(tracker)
+        >>> obj.add(tracker)
+        Traceback (most recent call last):
+        ...
+        ValueError: there is already a tracker called 'Steps'
+        """
+        name = tracker.get_name()
+        if name in self.trackers_by_name:
+            raise ValueError(f"there is already a tracker called {name!r}")
+
+        self.trackers_by_name[name] = tracker
+        self.trackers[tracker] = None
+        self.name_index.add(tracker)
+        if self.tracker_list is not None:
+            self.rows[tracker] = len(self.tracker_list)
+            self.tracker_list.append(tracker)
+
+    def remove(self, tracker):
+        """Removes tracker from the registry.
+        >>> tracker = Tracker()
+        >>> tracker.set_name('Steps')
+        >>> obj = TrackerRegistry([tracker])
+        >>> obj.remove(tracker)
+        >>> len(obj), obj.get('Steps'), obj.find_prefix('')
+        (0, None, [])
+        """
+        del self.trackers_by_name[tracker.get_name()]
+        del self.trackers[tracker]
+        self.name_index.remove(tracker)
+        self.tracker_list = None
+        self.rows = None
+
+    def rename(self, tracker, new_name):
+        """Changes the name of tracker, which also moves its files if it
+        has a journal, keeping its place in the order. Raises a ValueError
+        and changes nothing if new_name is not available. The registry is
+        only updated once the tracker was renamed.
+        >>> trackers = [Tracker(), Tracker()]
+        >>> trackers[0].set_name('Steps')
+        >>> trackers[1].set_name('Sleep')
+        >>> obj = TrackerRegistry(trackers)
+        >>> obj.rename(trackers[0], 'Walk')
+        >>> [tracker.get_name() for tracker in obj], obj.get('Walk') is trackers[0], 'Steps' in obj
+        (['Walk', 'Sleep'], True, False)
+        >>> obj.rename(trackers[0], 'Sleep')
+        Traceback (most recent call last):
+        ...
+        ValueError: 'Sleep' cannot be used as a tracker name
+        """
+        if not self.is_name_available(new_name):
+            raise ValueError(f"{new_name!r} cannot be used as a tracker name")
+        old_name = tracker.get_name()
+
+        tracker.set_name(new_name)
+        del self.trackers_by_name[old_name]
+        self.trackers_by_name[new_name] = tracker
+        self.name_index.remove(tracker, old_name)
+        self.name_index.add(tracker)
+
+    def get_trackers(self):
+        """Returns the list of trackers in the order they were added.
+        The list must not be changed.
+        >>> tracker = Tracker()
+        >>> TrackerRegistry([tracker]).get_trackers() == [tracker]
+        True
+        """
+        if self.tracker_list is None:
+            self.tracker_list = list(self.trackers)
+            self.rows = {tracker: row for row, tracker in enumerate(self.tracker_list)}
+        return self.tracker_list
+
+    def get_tracker(self, row):
+        """Returns the tracker in position row of the order.
+        """
+        return self.get_trackers()[row]
+
+    def get_row(self, tracker):
+        """Returns the position of tracker in the order.
+        >>> trackers = [Tracker(), Tracker()]
+        >>> trackers[1].set_name('Steps')
+        >>> TrackerRegistry(trackers).get_row(trackers[1])
+        1
+        """
+        self.get_trackers()
+        return self.rows[tracker]
+
+    def find_prefix(self, prefix):
+        """Returns the trackers whose name starts with prefix,
+        ignoring case, sorted by name.
+        """
+        return self.name_index.find_prefix(prefix)
+
+class TrackerStore(ABC):
+    """Class TrackerStore is the interface of the places trackers are
+    stored in. A store keeps the axis titles of every tracker and its
+    points sorted by x, and answers range queries: the points of a tracker
+    with an x value between first and last. TrackerFileStore keeps one file
+    per tracker in a StorageLocation, and TrackerSQLiteStore keeps all the
+    trackers in one SQLite database. Subclasses implement the abstract
+    methods, and a subclass missing one cannot be created; the other
+    methods are built on top of them.
+    >>> class PartialStore(TrackerStore):
+    ...     def get_names(self):
+    ...         return []
+    >>> PartialStore()     #doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    TypeError: Can't instantiate abstract class PartialStore ...
+    """
+
+    @abstractmethod
+    def is_valid_name(self, name):
+        """Returns True if name can be the name of a tracker in this store.
+        """
+
+    @abstractmethod
+    def get_names(self):
+        """Returns the sorted names of all the trackers.
+        """
+
+    @abstractmethod
+    def read_headers(self, names):
+        """Returns the x and y axis titles of the trackers called names.
+        """
+
+    @abstractmethod
+    def read(self, name):
+        """Returns the x and y axis titles and the x and y columns of the
+        tracker called name. Raises a LookupError if there is no such tracker.
+        """
+
+    @abstractmethod
+    def read_range(self, name, first=None, last=None):
+        """Returns the x and y columns of the points of the tracker called
+        name with an x value between first and last. None means no limit.
+        """
+
+    @abstractmethod
+    def add_points(self, name, x_values, y_values, create=False, replace_all=False):
+        """Adds the given points to the tracker called name. A point with
+        the x value of an existing one replaces its y value. If replace_all
+        is True, the given points replace all the points of the tracker
+        instead. If the tracker does not exist, it is created when create is
+        True and a LookupError is raised otherwise.
+        """
+
+    @abstractmethod
+    def write(self, name, x_axis_title, y_axis_title, x_values, y_values):
+        """Stores a tracker called name with the given axis titles and
+        points, sorted by x, replacing the tracker with that name if any.
+        """
+
+    @abstractmethod
+    def rename(self, name, new_name):
+        """Renames the tracker called name. Raises a ValueError if a
+        tracker called new_name already exists.
+        """
+
+    @abstractmethod
+    def delete(self, name):
+        """Removes the tracker called name and its points.
+        """
+
+    def close(self):
+        """Releases what the store holds open. Nothing by default.
+        """
+
+    def check_name(self, name):
+        """Raises a ValueError if name cannot be the name of a tracker
+        in this store.
+        >>> from tempfile import mkdtemp
+        >>> TrackerFileStore(StorageLocation(mkdtemp())).check_name('a/b')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid tracker name: 'a/b'
+        """
+        if not self.is_valid_name(name):
+            raise ValueError(f"invalid tracker name: {name!r}")
+
+    def get_stats(self, name, first=None, last=None):
+        """Returns a dictionary with the number of points of the tracker
+        called name with an x value between first and last, their first
+        and last x values, and the minimum, maximum, mean and sum of their
+        y values. Only the count is given if there are no points.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.add_points('Steps', array('d', [1, 2, 3]), array('d', [10, 20, 60]), create=True)
+        >>> obj.get_stats('Steps')
+        {'count': 3, 'first_x': 1.0, 'last_x': 3.0, 'min_y': 10.0, 'max_y': 60.0, 'mean_y': 30.0, 'sum_y': 90.0}
+        >>> obj.get_stats('Steps', first=5)
+        {'count': 0}
+        """
+        x_values, y_values = self.read_range(name, first, last)
+        count = len(x_values)
+
+        if count == 0:
+            return {'count': count}
+        y_sum = sum(y_values)
+        return {'count': count, 'first_x': x_values[0], 'last_x': x_values[-1],
+            'min_y': min(y_values), 'max_y': max(y_values), 'mean_y': y_sum / count, 'sum_y': y_sum}
+
+    def copy_from(self, store):
+        """Writes every tracker of store into this store, replacing the
+        trackers with the same names. Returns the number of trackers copied.
+        >>> from tempfile import mkdtemp
+        >>> files = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> files.write('Steps', 'Day', 'Steps', array('d', [1]), array('d', [10]))
+        >>> obj = TrackerSQLiteStore(path.join(mkdtemp(), 'trackers.db'))
+        >>> obj.copy_from(files)
+        1
+        >>> obj.read('Steps')
+        ('Day', 'Steps', array('d', [1.0]), array('d', [10.0]))
+        """
+        names = store.get_names()
+        for name in names:
+            self.write(name, *store.read(name))
+        return len(names)
+
+    @staticmethod
+    def get_range(x_values, first=None, last=None):
+        """Returns the indexes of the first point with an x value of
+        at least first and of the point after the last one with an x
+        value of at most last. None means no limit.
+        >>> x_values = array('d', [1, 2, 3, 4])
+        >>> TrackerStore.get_range(x_values, 2, 3)
+        (1, 3)
+        >>> TrackerStore.get_range(x_values)
+        (0, 4)
+        """
+        first_index = 0 if first is None else bisect_left(x_values, first)
+        last_index = len(x_values) if last is None else bisect_right(x_values, last)
+        return first_index, max(first_index, last_index)
+
+class TrackerFileStore(TrackerStore):
+    """Class TrackerFileStore stores every tracker in a file named after
+    it, in the directory of a StorageLocation and in the formats of
+    TrackerFile. Every change takes the StorageLock of the directory, which
+    the application holds while it runs, so no change is made while the
+    application has trackers in memory: after lock_timeout seconds a
+    TimeoutError is raised instead. Points that come after the last point of
+    a text file are appended to it without parsing the points already there.
+    Otherwise the file is read, the new points are merged in with a single
+    sort, and the result is written back with one atomic write, which also
+    folds in any journal left behind. Range queries read the whole file
+    and bisect it.
+    """
+    LOCK_TIMEOUT = 10
+
+    def __init__(self, storage_location):
+        """Initializes a TrackerFileStore for the trackers stored in
+        storage_location.
+        >>> obj = TrackerFileStore(StorageLocation('tracker_info'))
+        >>> path.basename(obj.tracker_info_dir), obj.lock_timeout
+        ('tracker_info', 10)
+        """
+        self.storage_location = storage_location
+        self.tracker_info_dir = storage_location.get_path()
+        self.lock = StorageLock(self.tracker_info_dir)
+        self.lock_timeout = self.LOCK_TIMEOUT
+
+    def acquire_lock(self):
+        """Takes the StorageLock of the directory, raising a TimeoutError
+        if another program (like the application) holds it for more than
+        self.lock_timeout seconds.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> application_lock = StorageLock(obj.tracker_info_dir)
+        >>> application_lock.acquire()
+        True
+        >>> obj.lock_timeout = 0
+        >>> obj.add_points('Steps', array('d', [1]), array('d', [10]), create=True)
+        Traceback (most recent call last):
+        ...
+        TimeoutError: the trackers are in use by another program, like ITrack
+        >>> application_lock.release()
+        >>> obj.add_points('Steps', array('d', [1]), array('d', [10]), create=True)
+        >>> obj.get_names()
+        ['Steps']
+        """
+        if not self.lock.acquire(self.lock_timeout):
+            raise TimeoutError("the trackers are in use by another program, like ITrack")
+
+    def is_valid_name(self, name):
+        """Returns True if name can be used as the name of a tracker file.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.is_valid_name('Steps'), obj.is_valid_name('a:b')
+        (True, False)
+        """
+        return TrackerRegistry.is_valid_name(name)
+
+    def get_path(self, name):
+        """Returns the path of the file of the tracker called name.
+        """
+        return path.join(self.tracker_info_dir, name)
+
+    def get_names(self):
+        """Returns the sorted names of all the trackers.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.get_names()
+        []
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'X', 'Y', [], [])
+        >>> obj.get_names()
+        ['Steps']
+        """
+        if not path.isdir(self.tracker_info_dir):
+            return []
+        dir_name, sub_names, file_names = next(walk(self.tracker_info_dir))
+        return sorted(file_names)
+
+    def read_headers(self, names):
+        """Returns the x and y axis titles of the trackers called names,
+        read from the start of their files only.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'Day', 'Steps', [1.0], [2.0])
+        >>> obj.read_headers(['Steps'])
+        [('Day', 'Steps')]
+        """
+        file_headers = TrackerLoader().read_headers([self.get_path(name) for name in names])
+        return [(x_axis_title, y_axis_title) for file_format, x_axis_title, y_axis_title in file_headers]
+
+    def open_tracker(self, name, create=False):
+        """Returns the tracker called name with its points loaded and
+        its journal attached, so every change made to it is stored. The
+        journal has no save worker, so compactions are written right away.
+        If the tracker does not exist, it is created when create is True
+        and a LookupError is raised otherwise.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.open_tracker('Steps')
+        Traceback (most recent call last):
+        ...
+        LookupError: no tracker called 'Steps'
+        >>> tracker = obj.open_tracker('Steps', create=True)
+        >>> tracker.get_name(), tracker.get_data(), path.exists(tracker.file_path)
+        ('Steps', [], False)
+        """
+        self.check_name(name)
+        file_path = self.get_path(name)
+        tracker = Tracker()
+        tracker.set_name(name)
+
+        if path.exists(file_path):
+            file_contents = TrackerFile.read(file_path)
+            tracker.file_format, x_axis_title, y_axis_title = file_contents[:3]
+            tracker.set_x_axis_title(x_axis_title)
+            tracker.set_y_axis_title(y_axis_title)
+            tracker.loaded = False
+        elif create:
+            self.storage_location.create()
+            file_contents = None
+        else:
+            raise LookupError(f"no tracker called {name!r}")
+
+        journal = TrackerJournal(self.tracker_info_dir, tracker)
+        tracker.set_journal(journal)
+        if file_contents is not None:
+            tracker.load_data(file_contents)
+        tracker.mark_saved()
+        return tracker
+
+    def read_tracker(self, name):
+        """Returns the tracker called name with its points loaded,
+        including the changes in its journal, without attaching the
+        journal, so nothing is written.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'Day', 'Steps', [1.0], [2.0])
+        >>> obj.read_tracker('Steps').get_data()
+        [[1.0, 2.0]]
+        """
+        tracker = self.open_tracker(name)
+        tracker.set_journal(None)
+        return tracker
+
+    def read(self, name):
+        """Returns the x and y axis titles and the x and y columns of the
+        tracker called name.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'Day', 'Steps', [1.0], [2.0])
+        >>> obj.read('Steps')
+        ('Day', 'Steps', array('d', [1.0]), array('d', [2.0]))
+        >>> path.isdir(path.join(obj.tracker_info_dir, TrackerJournal.JOURNAL_DIR_NAME))
+        False
+        """
+        tracker = self.read_tracker(name)
+        return (tracker.get_x_axis_title(), tracker.get_y_axis_title(),
+            Tracker.to_column(tracker.get_column(0)), Tracker.to_column(tracker.get_column(1)))
+
+    def read_range(self, name, first=None, last=None):
+        """Returns the x and y columns of the points of the tracker called
+        name with an x value between first and last. None means no limit.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'Day', 'Steps', [1.0, 2.0, 3.0], [10.0, 20.0, 30.0])
+        >>> obj.read_range('Steps', first=1.5)
+        (array('d', [2.0, 3.0]), array('d', [20.0, 30.0]))
+        """
+        tracker = self.read_tracker(name)
+        first_index, last_index = self.get_range(tracker.get_column(0), first, last)
+        return (Tracker.to_column(tracker.get_column(0)[first_index:last_index]),
+            Tracker.to_column(tracker.get_column(1)[first_index:last_index]))
+
+    @staticmethod
+    def is_sorted_after(x_values, new_x_values):
+        """Returns True if new_x_values are strictly increasing and all
+        come after the last of x_values, so they can just be appended.
+        >>> TrackerFileStore.is_sorted_after(array('d', [1, 2]), array('d', [3, 4]))
+        True
+        >>> TrackerFileStore.is_sorted_after(array('d', [1, 2]), array('d', [2, 4]))
+        False
+        >>> TrackerFileStore.is_sorted_after(array('d'), array('d', [4, 3]))
+        False
+        """
+        if len(new_x_values) == 0:
+            return True
+        if len(x_values) > 0 and not new_x_values[0] > x_values[-1]:
+            return False
+        return all(new_x_values[index] < new_x_values[index + 1] for index in range(len(new_x_values) - 1))
+
+    def can_append(self, name, new_x_values):
+        """Returns True if the points with new_x_values can be written at
+        the end of the text file of the tracker called name without reading
+        it: they are sorted, come after its last point and the tracker has
+        no journal left by the application. Only files with a checksum line
+        are known to be sorted; files written by hand or by older versions
+        are read and merged instead.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> _ = TrackerFile.write_text(obj.get_path('Steps'), 'Day', 'Steps', [1.0], [2.0])
+        >>> obj.can_append('Steps', array('d', [2, 3])), obj.can_append('Steps', array('d', [0]))
+        (True, False)
+        >>> obj.can_append('Walk', array('d', [2, 3]))
+        False
+        >>> with open(obj.get_path('Walk'), 'wb') as file_obj:
+        ...     _ = file_obj.write(b'Day\\nKm\\n5.0 1.0\\n1.0 2.0\\n')
+        >>> obj.can_append('Walk', array('d', [2, 3]))
+        False
+        >>> obj.add_points('Walk', array('d', [2, 3]), array('d', [20, 30]))
+        >>> obj.read_range('Walk')[0]
+        array('d', [1.0, 2.0, 3.0, 5.0])
+        """
+        file_path = self.get_path(name)
+        if not path.exists(file_path) or TrackerFile.detect_format(file_path) != TrackerFile.TEXT_FORMAT:
+            return False
+        if not TrackerFile.has_checksum(file_path):
+            return False
+        tracker = Tracker()
+        tracker.set_name(name)
+        if TrackerJournal(self.tracker_info_dir, tracker).has_entries():
+            return False
+
+        last_x_value = TrackerFile.read_last_x(file_path)
+        return self.is_sorted_after(array('d', [] if last_x_value is None else [last_x_value]), new_x_values)
+
+    def add_points(self, name, x_values, y_values, create=False, replace_all=False):
+        """Adds the given points to the tracker called name and writes
+        its file. A point with the x value of an existing one replaces its
+        y value. If replace_all is True, the given points replace all the
+        points of the tracker instead.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.add_points('Steps', array('d', [1, 2]), array('d', [10, 20]), create=True)
+        >>> obj.add_points('Steps', array('d', [2, 0]), array('d', [40, 5]))
+        >>> obj.add_points('Steps', array('d', [3]), array('d', [30]))
+        >>> obj.read_tracker('Steps').get_data()
+        [[0.0, 5.0], [1.0, 10.0], [2.0, 40.0], [3.0, 30.0]]
+        >>> obj.add_points('Steps', array('d', [3]), array('d', [30]), replace_all=True)
+        >>> print(open(obj.get_path('Steps')).read(), end='')
+        #crc32 460f0a69
+        X-Axis
+        Y-Axis
+        3.0 30.0
+        """
+        self.check_name(name)
+        self.acquire_lock()
+        try:
+            self.write_points(name, x_values, y_values, create, replace_all)
+        finally:
+            self.lock.release()
+
+    def write_points(self, name, x_values, y_values, create=False, replace_all=False):
+        """Does the work of add_points once the lock is held.
+        """
+        if not replace_all and self.can_append(name, x_values):
+            TrackerFile.append_text(self.get_path(name), x_values, y_values)
+            return
+
+        tracker = self.open_tracker(name, create)
+        if replace_all:
+            merged_columns = TrackerImporter(TrackerImporter.KEEP_LAST).merge(array('d'), array('d'),
+                x_values, y_values)
+        elif self.is_sorted_after(tracker.get_column(0), x_values):
+            merged_columns = Tracker.to_column(tracker.get_column(0)), Tracker.to_column(tracker.get_column(1))
+            merged_columns[0].extend(x_values)
+            merged_columns[1].extend(y_values)
+        else:
+            merged_columns = TrackerImporter(TrackerImporter.KEEP_LAST).merge(tracker.get_column(0),
+                tracker.get_column(1), x_values, y_values)
+        tracker.set_columns(*merged_columns, copy=False)    #Writes the tracker file and folds in its journal.
+        tracker.journal.close()
+
+    def write(self, name, x_axis_title, y_axis_title, x_values, y_values):
+        """Writes the file of a tracker called name with the given axis
+        titles and points, replacing the tracker with that name if any.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.write('Steps', 'Day', 'Steps', array('d', [2, 1]), array('d', [20, 10]))
+        >>> obj.read('Steps')
+        ('Day', 'Steps', array('d', [1.0, 2.0]), array('d', [10.0, 20.0]))
+        """
+        self.acquire_lock()
+        try:
+            tracker = self.open_tracker(name, create=True)
+            tracker.set_x_axis_title(x_axis_title)
+            tracker.set_y_axis_title(y_axis_title)
+            merged_columns = TrackerImporter(TrackerImporter.KEEP_LAST).merge(array('d'), array('d'),
+                x_values, y_values)
+            tracker.set_columns(*merged_columns, copy=False)
+            tracker.journal.close()
+        finally:
+            self.lock.release()
+
+    def rename(self, name, new_name):
+        """Moves the file and the journal of the tracker called name
+        so they match new_name.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.add_points('Steps', array('d', [1]), array('d', [10]), create=True)
+        >>> obj.add_points('Walk', array('d', [1]), array('d', [10]), create=True)
+        >>> obj.rename('Steps', 'Run')
+        >>> obj.get_names()
+        ['Run', 'Walk']
+        >>> obj.rename('Run', 'Walk')
+        Traceback (most recent call last):
+        ...
+        ValueError: a tracker called 'Walk' already exists
+        """
+        self.check_name(name)
+        self.check_name(new_name)
+        tracker = Tracker()
+        tracker.set_name(name)
+        self.acquire_lock()
+        try:
+            if not path.exists(self.get_path(name)):    #Checked with the lock held, so nothing changes in between.
+                raise LookupError(f"no tracker called {name!r}")
+            if path.exists(self.get_path(new_name)):
+                raise ValueError(f"a tracker called {new_name!r} already exists")
+            TrackerJournal(self.tracker_info_dir, tracker).rename(new_name)
+        finally:
+            self.lock.release()
+
+    def delete(self, name):
+        """Removes the file and the journal of the tracker called name.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerFileStore(StorageLocation(mkdtemp()))
+        >>> obj.add_points('Steps', array('d', [1]), array('d', [10]), create=True)
+        >>> obj.delete('Steps')
+        >>> obj.get_names()
+        []
+        """
+        self.check_name(name)
+        tracker = Tracker()
+        tracker.set_name(name)
+        self.acquire_lock()
+        try:
+            if not path.exists(self.get_path(name)):
+                raise LookupError(f"no tracker called {name!r}")
+            TrackerJournal(self.tracker_info_dir, tracker).delete()
+        finally:
+            self.lock.release()
+
+class TrackerSQLiteStore(TrackerStore):
+    """Class TrackerSQLiteStore stores all the trackers in one SQLite
+    database: a trackers table with the name and axis titles of every
+    tracker, and a points table whose primary key is (tracker_id, x).
+    The points table is a WITHOUT ROWID table, so the points are stored in
+    that index itself, sorted by x within each tracker: range queries and
+    statistics are answered from the index without loading whole trackers,
+    and a repeated x value replaces the y value of the old point. The
+    database uses write-ahead logging, and every change is one transaction,
+    however many points it has. Names are plain text, so they can hold
+    characters that file names cannot, like ':', and a rename only changes
+    one row.
+    """
+    BATCH_SIZE = 1 << 14
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS trackers (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, "
+        "x_axis_title TEXT NOT NULL, y_axis_title TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS points (tracker_id INTEGER NOT NULL REFERENCES trackers (id), "
+        "x REAL NOT NULL, y REAL NOT NULL, PRIMARY KEY (tracker_id, x)) WITHOUT ROWID",
+    )
+    RANGE_QUERY = "SELECT x, y FROM points WHERE tracker_id = ? AND x BETWEEN ? AND ? ORDER BY x"
+    STATS_QUERY = ("SELECT count(*), min(x), max(x), min(y), max(y), avg(y), sum(y) FROM points "
+        "WHERE tracker_id = ? AND x BETWEEN ? AND ?")
+    INSERT_POINT = "INSERT OR REPLACE INTO points (tracker_id, x, y) VALUES (?, ?, ?)"
+
+    def __init__(self, database_path):
+        """Opens the database at database_path, creating it and its
+        tables if needed.
+        >>> from tempfile import mkdtemp
+        >>> obj = TrackerSQLiteStore(path.join(mkdtemp(), 'trackers.db'))
+        >>> obj.connection.execute('PRAGMA journal_mode').fetchone()
+        ('wal',)
+        >>> obj.get_names()
+        []
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")    #Safe with WAL: a crash can only lose the last commits.
+        with self.connection:
+            for statement in self.SCHEMA:
+                self.connection.execute(statement)
+
+    def is_valid_name(self, name):
+        """Returns True if name is not blank. Any other text can be
+        the name of a tracker in a database.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.is_valid_name('Steps: 2026'), obj.is_valid_name(' ')
+        (True, False)
+        """
+        return bool(name.strip())
+
+    def get_tracker_id(self, name, create=False):
+        """Returns the id of the tracker called name. If there is no such
+        tracker, it is created with the default axis titles when create is
+        True and a LookupError is raised otherwise.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.get_tracker_id('Steps')
+        Traceback (most recent call last):
+        ...
+        LookupError: no tracker called 'Steps'
+        >>> obj.get_tracker_id('Steps', create=True) == obj.get_tracker_id('Steps')
+        True
+        """
+        tracker_row = self.connection.execute("SELECT id FROM trackers WHERE name = ?", (name,)).fetchone()
+        if tracker_row is not None:
+            return tracker_row[0]
+        if not create:
+            raise LookupError(f"no tracker called {name!r}")
+        default_tracker = Tracker()
+        return self.connection.execute("INSERT INTO trackers (name, x_axis_title, y_axis_title) VALUES (?, ?, ?)",
+            (name, default_tracker.get_x_axis_title(), default_tracker.get_y_axis_title())).lastrowid
+
+    def get_names(self):
+        """Returns the sorted names of all the trackers.
+        """
+        return [name for name, in self.connection.execute("SELECT name FROM trackers ORDER BY name")]
+
+    def read_headers(self, names):
+        """Returns the x and y axis titles of the trackers called names.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.write('Steps', 'Day', 'Steps', [], [])
+        >>> obj.read_headers(['Steps'])
+        [('Day', 'Steps')]
+        """
+        headers = []
+        for name in names:
+            header = self.connection.execute("SELECT x_axis_title, y_axis_title FROM trackers WHERE name = ?",
+                (name,)).fetchone()
+            if header is None:
+                raise LookupError(f"no tracker called {name!r}")
+            headers.append(header)
+        return headers
+
+    @staticmethod
+    def get_bounds(first, last):
+        """Returns first and last for a BETWEEN condition, replacing None
+        with an infinity so there is no limit on that side.
+        >>> TrackerSQLiteStore.get_bounds(None, 2)
+        (-inf, 2)
+        """
+        return float('-inf') if first is None else first, float('inf') if last is None else last
+
+    def select_points(self, tracker_id, first=None, last=None):
+        """Returns the x and y columns of the points of the tracker with
+        tracker_id with an x value between first and last, fetched
+        BATCH_SIZE rows at a time.
+        """
+        values = array('d')
+        cursor = self.connection.execute(self.RANGE_QUERY, (tracker_id,) + self.get_bounds(first, last))
+        for rows in iter(lambda: cursor.fetchmany(self.BATCH_SIZE), []):
+            values.extend(chain.from_iterable(rows))
+        return values[0::2], values[1::2]
+
+    def read(self, name):
+        """Returns the x and y axis titles and the x and y columns of the
+        tracker called name.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.read('Steps')
+        Traceback (most recent call last):
+        ...
+        LookupError: no tracker called 'Steps'
+        """
+        header = self.connection.execute("SELECT id, x_axis_title, y_axis_title FROM trackers WHERE name = ?",
+            (name,)).fetchone()
+        if header is None:
+            raise LookupError(f"no tracker called {name!r}")
+        tracker_id, x_axis_title, y_axis_title = header
+        return (x_axis_title, y_axis_title) + self.select_points(tracker_id)
+
+    def read_range(self, name, first=None, last=None):
+        """Returns the x and y columns of the points of the tracker called
+        name with an x value between first and last. None means no limit.
+        The points are read from the (tracker_id, x) index.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.add_points('Steps', array('d', [3, 1, 2]), array('d', [30, 10, 20]), create=True)
+        >>> obj.read_range('Steps', first=1.5)
+        (array('d', [2.0, 3.0]), array('d', [20.0, 30.0]))
+        >>> query_plan = obj.connection.execute('EXPLAIN QUERY PLAN ' + obj.RANGE_QUERY, (1, 0, 1)).fetchall()
+        >>> 'USING PRIMARY KEY (tracker_id=? AND x>? AND x<?)' in query_plan[-1][-1]
+        True
+        """
+        return self.select_points(self.get_tracker_id(name), first, last)
+
+    def get_stats(self, name, first=None, last=None):
+        """Returns the same statistics as TrackerStore.get_stats,
+        computed by the database over the (tracker_id, x) index.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.add_points('Steps', array('d', [1, 2, 3]), array('d', [10, 20, 60]), create=True)
+        >>> obj.get_stats('Steps')
+        {'count': 3, 'first_x': 1.0, 'last_x': 3.0, 'min_y': 10.0, 'max_y': 60.0, 'mean_y': 30.0, 'sum_y': 90.0}
+        >>> obj.get_stats('Steps', first=5)
+        {'count': 0}
+        """
+        count, first_x, last_x, min_y, max_y, mean_y, y_sum = self.connection.execute(self.STATS_QUERY,
+            (self.get_tracker_id(name),) + self.get_bounds(first, last)).fetchone()
+
+        if count == 0:
+            return {'count': count}
+        return {'count': count, 'first_x': first_x, 'last_x': last_x,
+            'min_y': min_y, 'max_y': max_y, 'mean_y': mean_y, 'sum_y': y_sum}
+
+    def add_points(self, name, x_values, y_values, create=False, replace_all=False):
+        """Adds the given points to the tracker called name in one
+        transaction. A point with the x value of an existing one replaces
+        its y value. If replace_all is True, the given points replace all
+        the points of the tracker instead.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.add_points('Steps', array('d', [1, 2]), array('d', [10, 20]), create=True)
+        >>> obj.add_points('Steps', array('d', [2, 0]), array('d', [40, 5]))
+        >>> obj.read('Steps')
+        ('X-Axis', 'Y-Axis', array('d', [0.0, 1.0, 2.0]), array('d', [5.0, 10.0, 40.0]))
+        >>> obj.add_points('Steps', array('d', [3]), array('d', [30]), replace_all=True)
+        >>> obj.read_range('Steps')
+        (array('d', [3.0]), array('d', [30.0]))
+        """
+        self.check_name(name)
+        with self.connection:
+            tracker_id = self.get_tracker_id(name, create)
+            if replace_all:
+                self.connection.execute("DELETE FROM points WHERE tracker_id = ?", (tracker_id,))
+            self.connection.executemany(self.INSERT_POINT, zip(repeat(tracker_id), x_values, y_values))
+
+    def write(self, name, x_axis_title, y_axis_title, x_values, y_values):
+        """Stores a tracker called name with the given axis titles and
+        points in one transaction, replacing the tracker with that name if any.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.write('Steps: 2026', 'Day', 'Steps', array('d', [2, 1]), array('d', [20, 10]))
+        >>> obj.write('Steps: 2026', 'Week', 'Steps', array('d', [3]), array('d', [30]))
+        >>> obj.read('Steps: 2026')
+        ('Week', 'Steps', array('d', [3.0]), array('d', [30.0]))
+        """
+        self.check_name(name)
+        with self.connection:
+            self.connection.execute("INSERT INTO trackers (name, x_axis_title, y_axis_title) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET x_axis_title = excluded.x_axis_title, "
+                "y_axis_title = excluded.y_axis_title", (name, x_axis_title, y_axis_title))
+            tracker_id = self.get_tracker_id(name)
+            self.connection.execute("DELETE FROM points WHERE tracker_id = ?", (tracker_id,))
+            self.connection.executemany(self.INSERT_POINT, zip(repeat(tracker_id), x_values, y_values))
+
+    def rename(self, name, new_name):
+        """Renames the tracker called name by changing its row only.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.write('Steps', 'Day', 'Steps', [1], [10])
+        >>> obj.write('Walk', 'Day', 'Km', [], [])
+        >>> obj.rename('Steps', 'Steps: 2026')
+        >>> obj.get_names()
+        ['Steps: 2026', 'Walk']
+        >>> obj.rename('Walk', 'Steps: 2026')
+        Traceback (most recent call last):
+        ...
+        ValueError: a tracker called 'Steps: 2026' already exists
+        """
+        self.check_name(new_name)
+        try:
+            with self.connection:
+                cursor = self.connection.execute("UPDATE trackers SET name = ? WHERE name = ?", (new_name, name))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"a tracker called {new_name!r} already exists") from None
+        if cursor.rowcount == 0:
+            raise LookupError(f"no tracker called {name!r}")
+
+    def delete(self, name):
+        """Removes the tracker called name and its points in one transaction.
+        >>> obj = TrackerSQLiteStore(':memory:')
+        >>> obj.write('Steps', 'Day', 'Steps', [1], [10])
+        >>> obj.delete('Steps')
+        >>> obj.get_names(), obj.connection.execute('SELECT count(*) FROM points').fetchone()
+        ([], (0,))
+        """
+        with self.connection:
+            tracker_id = self.get_tracker_id(name)
+            self.connection.execute("DELETE FROM points WHERE tracker_id = ?", (tracker_id,))
+            self.connection.execute("DELETE FROM trackers WHERE id = ?", (tracker_id,))
+
+    def close(self):
+        """Closes the database.
+        """
+        self.connection.close()
+
+if __name__ == '__main__':
+    doctest.testmod()